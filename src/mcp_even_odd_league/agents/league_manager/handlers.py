@@ -4,6 +4,14 @@ League Manager - Message Handlers
 Handles incoming MCP messages.
 """
 
+from mcp_even_odd_league.league_sdk import message_codecs
+
+
+def _accept_codecs(league_manager, meta: dict) -> None:
+    """Remember the message encodings a registering agent advertised for its contact_endpoint"""
+    if league_manager is not None and meta.get("codecs") and meta.get("contact_endpoint"):
+        league_manager.mcp_client.set_endpoint_codecs(meta["contact_endpoint"], meta["codecs"])
+
 
 def handle_referee_register_request(league_manager, request_data: dict) -> dict:
     """
@@ -40,12 +48,14 @@ def handle_referee_register_request(league_manager, request_data: dict) -> dict:
     # Static stub response - ACCEPTED
     referee_id = f"REF{str(uuid.uuid4())[:2].upper()}"
     auth_token = f"tok-{referee_id.lower()}-{str(uuid.uuid4())[:8]}"
+    _accept_codecs(league_manager, referee_meta)
 
     return {
         "status": "ACCEPTED",
         "referee_id": referee_id,
         "auth_token": auth_token,
         "league_id": league_manager.league_id if league_manager else "league_2025_even_odd",
+        "codecs": message_codecs.supported_content_types(),
         "reason": None
     }
 
@@ -95,12 +105,14 @@ def handle_league_register_request(league_manager, request_data: dict) -> dict:
     # For now, generate a simple player_id and token
     player_id = f"P{str(uuid.uuid4())[:2].upper()}"  # Simplified ID
     auth_token = f"tok-{player_id.lower()}-{str(uuid.uuid4())[:8]}"
+    _accept_codecs(league_manager, player_meta)
 
     return {
         "status": "ACCEPTED",
         "player_id": player_id,
         "auth_token": auth_token,
         "league_id": league_manager.league_id if league_manager else "league_2025_even_odd",
+        "codecs": message_codecs.supported_content_types(),
         "reason": None
     }
 
@@ -144,16 +156,24 @@ def handle_match_result_report(league_manager, request_data: dict) -> dict:
     }
 
 
-def handle_league_query(request_data: dict) -> dict:
+def handle_league_query(league_manager, request_data: dict) -> dict:
     """
     Handle LEAGUE_QUERY message.
 
     Args:
+        league_manager: LeagueManager instance
         request_data: Request payload
 
     Returns:
-        Response payload
-
-    TODO: Implement standings query handling
+        Response payload (without protocol/message_type/timestamp - added by caller)
     """
-    pass
+    query_type = request_data.get("query_type")
+    if query_type != "GET_STANDINGS":
+        return {
+            "status": "REJECTED",
+            "reason": f"Unsupported query_type: {query_type}"
+        }
+
+    sender = request_data.get("sender", "")
+    player_id = sender.split(":", 1)[-1]
+    return league_manager.query_standings(player_id, request_data.get("auth_token"))
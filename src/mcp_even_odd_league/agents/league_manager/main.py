@@ -5,13 +5,20 @@ Top-level orchestrator for the entire league system.
 Based on interfaces.md - LeagueManagerInterface.
 """
 import sys
+import threading
+from datetime import datetime
+from typing import Optional
 
-from flask import Flask, request, jsonify
+from flask import Flask, request
 from mcp_even_odd_league.league_sdk.config_loader import ConfigLoader
+from mcp_even_odd_league.league_sdk.event_log import EventLog
 from mcp_even_odd_league.league_sdk.repositories import StandingsRepository, RoundsRepository
 from mcp_even_odd_league.league_sdk.logger import JsonLogger
 from mcp_even_odd_league.league_sdk.mcp_client import MCPClient
-from mcp_even_odd_league.league_sdk.config_models import SystemConfig, LeagueConfig
+from mcp_even_odd_league.league_sdk import jsonrpc, mcp_server
+from mcp_even_odd_league.league_sdk.config_models import SystemConfig, LeagueConfig, ScoringConfig
+from mcp_even_odd_league.agents.league_manager import handlers, scheduler
+from mcp_even_odd_league.agents.league_manager.standings import RankedStandings
 
 
 app = Flask(__name__)
@@ -24,27 +31,44 @@ class LeagueManager:
     Implements LeagueManagerInterface from interfaces.md
     """
 
-    def __init__(self, league_id: str):
+    def __init__(self, league_id: str, scoring: Optional[ScoringConfig] = None):
         """
         Initialize League Manager.
 
         Args:
             league_id: League identifier
+            scoring: Optional scoring rules overriding the league configuration
         """
         self.league_id = league_id
         self.config_loader = ConfigLoader()
         self.system_config = self.config_loader.load_system()
         self.league_config = self.config_loader.load_league(league_id)
+        if scoring is not None:
+            self.league_config.scoring = scoring
         self.standings_repo = StandingsRepository(league_id)
         self.rounds_repo = RoundsRepository(league_id)
-        self.logger = JsonLogger("league_manager", league_id)
-        self.mcp_client = MCPClient()
+        self.logger = JsonLogger("league_manager", league_id, config=self.system_config.logging)
+        self.mcp_client = MCPClient(self.system_config.http_pool)
         self.state = "WAITING_FOR_REGISTRATIONS"
 
-        # Phase 5: In-memory standings tracking
-        # Structure: {player_id: {"wins": int, "losses": int, "draws": int, "points": int, "matches_played": int}}
-        self.standings = {}
+        # Phase 5: In-memory standings tracking, kept in ranking order
+        # standings[player_id] -> {"wins", "losses", "draws", "points", "matches_played"}
+        self.standings = RankedStandings(self.league_config.scoring.tiebreakers,
+                                         store=ConfigLoader.get_standings_store())
         self.total_matches = 0
+        self.current_round = 0
+        # Results already folded in, so a retried report is not counted twice
+        self.recorded_matches = set()
+        # Serializes result recording (append + fold + snapshot) with standings reads;
+        # the Flask server handles reports on concurrent threads
+        self._standings_lock = threading.RLock()
+
+        # Optional durable standings: MATCH_RESULT events folded into self.standings
+        self.event_log = None
+        self.snapshot_every = ConfigLoader.get_snapshot_every()
+        if ConfigLoader.get_event_log_enabled():
+            self.event_log = EventLog(self.standings_repo.file_path.with_name("events.jsonl"))
+            self.recover_standings()
 
         print(f"League Manager initialized for league: {league_id}")
 
@@ -102,11 +126,30 @@ class LeagueManager:
             referees: List of referee configurations
 
         Returns:
-            Schedule object
+            Schedule object (see scheduler.create_round_robin_schedule)
+        """
+        schedule = scheduler.create_round_robin_schedule(players, referees)
+        schedule["league_id"] = self.league_id
+
+        self.logger.log_event("SCHEDULE_CREATED", {
+            "total_rounds": schedule["total_rounds"],
+            "total_matches": schedule["total_matches"]
+        })
+        return schedule
 
-        TODO: Implement Round-Robin scheduling algorithm
+    def iter_schedule(self, players: list, referees: list, start_round: int = 1):
         """
-        pass
+        Generate the schedule lazily, one round at a time.
+
+        Args:
+            players: List of player configurations
+            referees: List of referee configurations
+            start_round: Round to resume from (earlier rounds are not generated)
+
+        Returns:
+            Iterator of round objects (see scheduler.iter_schedule)
+        """
+        return scheduler.iter_schedule(players, referees, start_round)
 
     def announce_round(self, round_id: int, matches: list) -> None:
         """
@@ -175,25 +218,50 @@ class LeagueManager:
 
         Phase 5: In-memory standings initialization
         """
-        if player_id not in self.standings:
-            self.standings[player_id] = {
-                "wins": 0,
-                "losses": 0,
-                "draws": 0,
-                "points": 0,
-                "matches_played": 0
-            }
+        self.standings.add_player(player_id)
 
     def update_standings_from_match(self, match_result: dict) -> None:
         """
         Update standings based on match result.
 
+        With the event log enabled the result is first recorded as a
+        MATCH_RESULT event, and a snapshot is taken every snapshot_every events.
+        A report for a match_id already recorded is ignored.
+
+        Args:
+            match_result: Match result from MATCH_RESULT_REPORT
+        """
+        with self._standings_lock:
+            if match_result.get("match_id") in self.recorded_matches:
+                print(f"  ⚠️ WARNING: Duplicate result for match {match_result['match_id']} ignored")
+                return
+
+            previous_round = self.current_round
+            if self.event_log is not None:
+                self.event_log.append({"type": "MATCH_RESULT", "match_result": match_result})
+            self.apply_match_result(match_result)
+
+            if self.event_log is not None and self.event_log.since_snapshot >= self.snapshot_every:
+                # Under the lock, so the snapshot's seq covers exactly the events folded in
+                self.event_log.snapshot(self.standings_snapshot())
+
+        if self.current_round > previous_round and previous_round and self.logger.config.rotate_on_round:
+            # The first result of a new round closes the previous round's log segment
+            self.logger.rotate(f"round {previous_round}")
+
+    def apply_match_result(self, match_result: dict) -> None:
+        """
+        Fold one match result into the in-memory standings (callers hold _standings_lock).
+
         Args:
             match_result: Match result from MATCH_RESULT_REPORT
 
         Phase 5: Update in-memory standings
-        Scoring: Win = 3 points, Draw = 1 point, Loss = 0 points
+        Scoring: league_config.scoring (default Win = 3, Draw = 1, Loss = 0 points)
         """
+        match_id = match_result.get("match_id")
+        if match_id in self.recorded_matches:
+            return
         result = match_result.get("result", {})
         score_dict = result.get("score", {})
         details = result.get("details", {})
@@ -213,49 +281,65 @@ class LeagueManager:
         self.initialize_player_standings(player_A_id)
         self.initialize_player_standings(player_B_id)
 
+        scoring = self.league_config.scoring
+
         # Update based on result
         if status == "DRAW":
-            # Both players get 1 point
-            self.standings[player_A_id]["draws"] += 1
-            self.standings[player_A_id]["points"] += 1
-            self.standings[player_A_id]["matches_played"] += 1
+            # Both players get draw points
+            self.standings.record(player_A_id, draws=1, points=scoring.draw_points)
+            self.standings.record(player_B_id, draws=1, points=scoring.draw_points)
 
-            self.standings[player_B_id]["draws"] += 1
-            self.standings[player_B_id]["points"] += 1
-            self.standings[player_B_id]["matches_played"] += 1
-
-        elif status == "TECHNICAL_LOSS":
-            # Technical loss: winner gets 3 points, loser gets 0
+        else:  # Normal WIN or TECHNICAL_LOSS: winner gets win points, loser gets loss points
             winner = result.get("winner")
             if winner == player_A_id:
                 loser = player_B_id
             else:
                 loser = player_A_id
 
-            self.standings[winner]["wins"] += 1
-            self.standings[winner]["points"] += 3
-            self.standings[winner]["matches_played"] += 1
-
-            self.standings[loser]["losses"] += 1
-            self.standings[loser]["points"] += 0
-            self.standings[loser]["matches_played"] += 1
+            self.standings.record(winner, wins=1, points=scoring.win_points)
+            self.standings.record(loser, losses=1, points=scoring.loss_points)
 
-        else:  # Normal WIN
-            winner = result.get("winner")
-            if winner == player_A_id:
-                loser = player_B_id
-            else:
-                loser = player_A_id
+        self.total_matches += 1
+        if match_id is not None:
+            self.recorded_matches.add(match_id)
+        self.current_round = max(self.current_round, match_result.get("round_id") or 0)
 
-            self.standings[winner]["wins"] += 1
-            self.standings[winner]["points"] += 3
-            self.standings[winner]["matches_played"] += 1
+    def standings_snapshot(self) -> dict:
+        """
+        Capture the folded standings state for an event log snapshot.
 
-            self.standings[loser]["losses"] += 1
-            self.standings[loser]["points"] += 0
-            self.standings[loser]["matches_played"] += 1
+        Returns:
+            Snapshot state (standings rows, total_matches, current_round, recorded match ids)
+        """
+        with self._standings_lock:
+            return {
+                "standings": [{"player_id": player_id, **stats} for player_id, stats in self.standings.items()],
+                "total_matches": self.total_matches,
+                "current_round": self.current_round,
+                "match_ids": sorted(self.recorded_matches)
+            }
 
-        self.total_matches += 1
+    def recover_standings(self) -> None:
+        """
+        Rebuild standings from the latest snapshot plus the events after it.
+        """
+        with self._standings_lock:
+            state, events = self.event_log.recover()
+            if state is not None:
+                for row in state["standings"]:
+                    stats = {field: value for field, value in row.items() if field != "player_id"}
+                    self.standings.record(row["player_id"], **stats)
+                self.total_matches = state["total_matches"]
+                self.current_round = state["current_round"]
+                self.recorded_matches.update(state.get("match_ids", []))
+
+            for event in events:
+                if event["type"] == "MATCH_RESULT":
+                    self.apply_match_result(event["match_result"])
+
+        if state is not None or events:
+            print(f"Recovered standings: snapshot at event {self.event_log.seq - len(events)} "
+                  f"+ {len(events)} replayed events")
 
     def print_standings(self, title: str = "CURRENT STANDINGS") -> None:
         """
@@ -275,19 +359,12 @@ class LeagueManager:
             print(f"{'=' * 80}\n")
             return
 
-        # Sort by points (descending), then by wins (descending)
-        sorted_standings = sorted(
-            self.standings.items(),
-            key=lambda x: (x[1]["points"], x[1]["wins"]),
-            reverse=True
-        )
-
         # Print header
         print(f"{'Rank':<6} {'Player':<10} {'Played':<8} {'W':<4} {'D':<4} {'L':<4} {'Points':<8}")
         print(f"{'-' * 80}")
 
         # Print each player
-        for rank, (player_id, stats) in enumerate(sorted_standings, 1):
+        for rank, player_id, stats in self.standings.ranked():
             print(f"{rank:<6} {player_id:<10} {stats['matches_played']:<8} "
                   f"{stats['wins']:<4} {stats['draws']:<4} {stats['losses']:<4} "
                   f"{stats['points']:<8}")
@@ -305,130 +382,70 @@ class LeagueManager:
             auth_token: Player's authentication token
 
         Returns:
-            Standings data
+            LEAGUE_QUERY_RESPONSE payload for GET_STANDINGS (without protocol
+            fields - added by caller)
 
-        TODO: Implement standings query
+        NOTE: auth_token is not validated until player registration issues tokens.
         """
-        pass
-
-
-# Global league manager instance
-league_manager = None
+        with self._standings_lock:
+            return {
+                "query_type": "GET_STANDINGS",
+                "current_round": self.current_round,
+                "standings": self.standings.as_table()
+            }
 
 
-@app.route('/mcp', methods=['POST'])
-def handle_mcp_request():
+def create_dispatcher(agent: "LeagueManager") -> jsonrpc.MethodDispatcher:
     """
-    Handle incoming MCP requests.
+    Build the method table for the league manager.
 
-    This endpoint receives JSON-RPC 2.0 requests.
+    Args:
+        agent: LeagueManager instance the handlers act on
+
+    Returns:
+        Dispatcher with every league manager method registered
     """
-    from datetime import datetime
-
-    try:
-        # Parse JSON request
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32700,
-                    "message": "Parse error: Invalid JSON"
-                },
-                "id": None
-            }), 400
-
-        # Validate JSON-RPC structure
-        if "jsonrpc" not in data or data["jsonrpc"] != "2.0":
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32600,
-                    "message": "Invalid Request: jsonrpc must be '2.0'"
-                },
-                "id": data.get("id")
-            }), 400
-
-        if "method" not in data:
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32600,
-                    "message": "Invalid Request: missing 'method' field"
-                },
-                "id": data.get("id")
-            }), 400
-
-        method = data["method"]
-        params = data.get("params", {})
-        request_id = data.get("id")
-
-        # Route based on method
-        if method == "register_player":
-            from mcp_even_odd_league.agents.league_manager import handlers
-            result = handlers.handle_league_register_request(league_manager, params)
+    def with_protocol_fields(message_type: str, handler):
+        def wrapped(params: dict) -> dict:
+            result = handler(params)
 
             # Add protocol fields
             result["protocol"] = "league.v2"
-            result["message_type"] = "LEAGUE_REGISTER_RESPONSE"
+            result["message_type"] = message_type
             result["timestamp"] = datetime.utcnow().isoformat() + "Z"
+            return result
+        return wrapped
 
-            return jsonify({
-                "jsonrpc": "2.0",
-                "result": result,
-                "id": request_id
-            })
+    dispatcher = jsonrpc.MethodDispatcher()
+    dispatcher.register("register_player", with_protocol_fields(
+        "LEAGUE_REGISTER_RESPONSE", lambda params: handlers.handle_league_register_request(agent, params)))
+    dispatcher.register("register_referee", with_protocol_fields(
+        "REFEREE_REGISTER_RESPONSE", lambda params: handlers.handle_referee_register_request(agent, params)))
+    dispatcher.register("report_match_result", lambda params: handlers.handle_match_result_report(agent, params))
+    dispatcher.register("league_query", with_protocol_fields(
+        "LEAGUE_QUERY_RESPONSE", lambda params: handlers.handle_league_query(agent, params)))
+    return dispatcher
 
-        elif method == "register_referee":
-            from mcp_even_odd_league.agents.league_manager import handlers
-            result = handlers.handle_referee_register_request(league_manager, params)
 
-            # Add protocol fields
-            result["protocol"] = "league.v2"
-            result["message_type"] = "REFEREE_REGISTER_RESPONSE"
-            result["timestamp"] = datetime.utcnow().isoformat() + "Z"
+# Global league manager instance and its method table
+league_manager = None
+dispatcher = create_dispatcher(league_manager)
 
-            return jsonify({
-                "jsonrpc": "2.0",
-                "result": result,
-                "id": request_id
-            })
-
-        elif method == "report_match_result":
-            from mcp_even_odd_league.agents.league_manager import handlers
-            result = handlers.handle_match_result_report(league_manager, params)
-
-            return jsonify({
-                "jsonrpc": "2.0",
-                "result": result,
-                "id": request_id
-            })
-
-        else:
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32601,
-                    "message": f"Method not found: {method}"
-                },
-                "id": request_id
-            }), 404
-
-    except Exception as e:
-        return jsonify({
-            "jsonrpc": "2.0",
-            "error": {
-                "code": -32603,
-                "message": f"Internal error: {str(e)}"
-            },
-            "id": data.get("id") if 'data' in locals() else None
-        }), 500
+
+@app.route('/mcp', methods=['POST'])
+def handle_mcp_request():
+    """
+    Handle incoming MCP requests.
+
+    This endpoint receives JSON-RPC 2.0 requests, single or batched,
+    as JSON or any negotiated binary codec.
+    """
+    return mcp_server.handle_http(dispatcher, request.content_type, request.get_data())
 
 
 def main():
     """Main entry point"""
-    global league_manager
+    global league_manager, dispatcher
 
     # Default league ID
     league_id = "league_2025_even_odd"
@@ -436,16 +453,23 @@ def main():
     # Initialize League Manager
     league_manager = LeagueManager(league_id)
     league_manager.start_league_manager()
+    dispatcher = create_dispatcher(league_manager)
 
-    # Start Flask server
+    # Start MCP server
     port = league_manager.system_config.network.league_manager_port
+    server_mode = ConfigLoader.get_server_mode(sys.argv[1:])
+
     print(f"\n=== League Manager Starting ===")
     print(f"League ID: {league_id}")
     print(f"Port: {port}")
-    print(f"Endpoint: http://localhost:{port}/mcp")
+    print(f"Endpoint: {league_manager.system_config.network.endpoint_for('league_manager', port)}")
+    print(f"Server mode: {server_mode}")
     print("================================\n")
 
-    app.run(host='0.0.0.0', port=port, debug=False)
+    channel_offset = ConfigLoader.get_channel_port_offset()
+    mcp_server.serve(app, dispatcher, port, server_mode,
+                     unix_socket=league_manager.system_config.network.socket_path("league_manager"),
+                     channel_port=port + channel_offset if channel_offset else None)
 
 
 if __name__ == "__main__":
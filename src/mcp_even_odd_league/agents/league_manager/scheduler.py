@@ -2,42 +2,239 @@
 League Manager - Match Scheduler
 
 Creates Round-Robin match schedules.
+
+Pairings use the circle method: player 0 stays fixed while the others rotate
+one seat per round, so every player meets every other player exactly once
+and plays at most once per round. Each round's pairings are computed
+arithmetically from its index, so no quadratic pairing list is ever built.
 """
 
-from typing import List, Dict, Any
+import heapq
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
+
+
+GAME_TYPE = "even_odd"
+
+
+def count_rounds(num_players: int) -> int:
+    """
+    Number of rounds in a Round-Robin over num_players.
+
+    Args:
+        num_players: Number of players
+
+    Returns:
+        N-1 rounds for even N, N rounds for odd N (one player has a bye each round)
+    """
+    if num_players < 2:
+        return 0
+    return num_players - 1 if num_players % 2 == 0 else num_players
+
+
+def round_pairings(num_players: int, round_index: int) -> Iterator[Tuple[int, int]]:
+    """
+    Yield the (player_A, player_B) index pairs for one round.
+
+    Args:
+        num_players: Number of players
+        round_index: Zero-based round number (0 <= round_index < count_rounds)
+
+    Yields:
+        Index pairs into the player list; byes are skipped
+    """
+    seats = num_players + (num_players % 2)  # odd leagues get a phantom "bye" seat
+    rotating = seats - 1
+
+    def player_at(seat: int) -> int:
+        if seat == 0:
+            return 0
+        return (seat - 1 + round_index) % rotating + 1
+
+    for i in range(seats // 2):
+        a, b = player_at(i), player_at(seats - 1 - i)
+        if a >= num_players or b >= num_players:
+            continue
+        # Alternate the fixed player's side so roles stay balanced
+        if i == 0 and round_index % 2 == 1:
+            a, b = b, a
+        yield a, b
+
+
+def iter_round_matches(players: List[Dict[str, Any]], round_index: int) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the match objects for one round.
+
+    Args:
+        players: List of player configurations (each with player_id, optionally contact_endpoint)
+        round_index: Zero-based round number
+
+    Yields:
+        Match objects (match_id like "R1M1", round_id, game_type, player IDs and endpoints)
+    """
+    round_id = round_index + 1
+    for match_number, (a, b) in enumerate(round_pairings(len(players), round_index), start=1):
+        player_A, player_B = players[a], players[b]
+        yield {
+            "match_id": f"R{round_id}M{match_number}",
+            "round_id": round_id,
+            "game_type": GAME_TYPE,
+            "player_A_id": player_A["player_id"],
+            "player_B_id": player_B["player_id"],
+            "player_A_endpoint": player_A.get("contact_endpoint"),
+            "player_B_endpoint": player_B.get("contact_endpoint")
+        }
+
+
+def schedule_round(players: List[Dict[str, Any]], referees: List[Dict[str, Any]], round_id: int) -> Dict[str, Any]:
+    """
+    Build one round of the schedule without generating any other round.
+
+    Args:
+        players: List of player configurations
+        referees: List of available referees
+        round_id: One-based round number
+
+    Returns:
+        Round object {"round_id": int, "matches": [match, ...]}
+
+    Raises:
+        ValueError: If round_id is outside the schedule
+    """
+    if not 1 <= round_id <= count_rounds(len(players)):
+        raise ValueError(f"Round {round_id} is outside the schedule (1..{count_rounds(len(players))})")
+
+    matches = assign_matches_to_referees(iter_round_matches(players, round_id - 1), referees)
+    return {"round_id": round_id, "matches": matches}
+
+
+def iter_schedule(players: List[Dict[str, Any]], referees: List[Dict[str, Any]],
+                  start_round: int = 1) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the schedule one round at a time.
+
+    Only the current round is held in memory, and starting at round k does
+    no work for rounds 1..k-1, so a restarted league manager can resume
+    where it left off.
+
+    Args:
+        players: List of player configurations
+        referees: List of available referees
+        start_round: One-based round to start from
+
+    Yields:
+        Round objects, as returned by schedule_round
+    """
+    for round_id in range(max(1, start_round), count_rounds(len(players)) + 1):
+        yield schedule_round(players, referees, round_id)
+
+
+def iter_schedule_matches(players: List[Dict[str, Any]], referees: List[Dict[str, Any]],
+                          start_round: int = 1, start_match: int = 1) -> Iterator[Dict[str, Any]]:
+    """
+    Yield scheduled matches one at a time, across rounds.
+
+    Resuming mid-round (start_match > 1) gives the same referee assignments
+    as the full round, since balancing replays the round's earlier matches.
+
+    Args:
+        players: List of player configurations
+        referees: List of available referees
+        start_round: One-based round to start from
+        start_match: One-based match number within start_round to start from
+
+    Yields:
+        Match objects with referee assignments
+    """
+    for round_id in range(max(1, start_round), count_rounds(len(players)) + 1):
+        matches = iter_assign_matches(iter_round_matches(players, round_id - 1), referees)
+        skip = start_match - 1 if round_id == start_round else 0
+        for match in matches:
+            if skip > 0:
+                skip -= 1
+                continue
+            yield match
 
 
 def create_round_robin_schedule(players: List[Dict[str, Any]], referees: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Create Round-Robin schedule for all players.
 
+    Materializes every round; prefer iter_schedule for large leagues.
+
     Args:
         players: List of player configurations
         referees: List of available referees
 
     Returns:
-        Schedule object containing rounds and matches
+        Schedule object containing rounds and matches:
+        {"total_rounds": int, "total_matches": int,
+         "rounds": [{"round_id": int, "matches": [match, ...]}, ...]}
 
-    TODO: Implement Round-Robin algorithm
     Algorithm:
     - Every player plays every other player exactly once
     - Each player plays exactly once per round
-    - Matches distributed evenly across referees
+    - Matches distributed across referees by load and capacity, per round
+    """
+    return {
+        "total_rounds": count_rounds(len(players)),
+        "total_matches": len(players) * (len(players) - 1) // 2,
+        "rounds": list(iter_schedule(players, referees))
+    }
+
+
+def iter_assign_matches(matches: Iterable[Dict[str, Any]], referees: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Assign matches to referees lazily (see assign_matches_to_referees).
+
+    Args:
+        matches: Iterable of matches to assign
+        referees: List of available referees
+
+    Yields:
+        Matches with assigned referee_id and referee_endpoint
+
+    Raises:
+        ValueError: If there are matches but no referees
     """
-    pass
+    heap = []
+    for order, referee in enumerate(referees):
+        capacity = max(1, referee.get("max_concurrent_matches", 5))
+        load = referee.get("current_load", 0)
+        heap.append((load / capacity, order, load, capacity))
+    heapq.heapify(heap)
+
+    for match in matches:
+        if not heap:
+            raise ValueError("Cannot assign matches: no referees available")
+
+        _, order, load, capacity = heap[0]
+        referee = referees[order]
+        yield {
+            **match,
+            "referee_id": referee.get("referee_id"),
+            "referee_endpoint": referee.get("contact_endpoint")
+        }
+        load += 1
+        heapq.heapreplace(heap, (load / capacity, order, load, capacity))
 
 
 def assign_matches_to_referees(matches: List[Dict[str, Any]], referees: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Assign matches to available referees.
 
+    Each match goes to the referee with the lowest relative load
+    (load / max_concurrent_matches), counting any current_load the referee
+    already reports. Ties go to the referee listed first.
+
     Args:
-        matches: List of matches to assign
-        referees: List of available referees
+        matches: List (or iterable) of matches to assign
+        referees: List of available referees (referee_id, contact_endpoint,
+                  optional max_concurrent_matches and current_load)
 
     Returns:
-        List of matches with assigned referee endpoints
+        List of matches with assigned referee_id and referee_endpoint
 
-    TODO: Implement match assignment logic
+    Raises:
+        ValueError: If there are matches but no referees
     """
-    pass
+    return list(iter_assign_matches(matches, referees))
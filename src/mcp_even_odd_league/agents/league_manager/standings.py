@@ -0,0 +1,348 @@
+"""
+League Manager - Ranked Standings
+
+Standings table that keeps players in ranking order as results arrive.
+
+Each player's position is held in a sorted index keyed by the configured
+tiebreakers, so results and top-k / rank queries never re-sort the table.
+With sortedcontainers.SortedList (used when installed) recording a result
+and rank() are O(log N); top(k) is O(log N + k). The bisect-maintained list
+used otherwise has O(log N) rank() but O(N) inserts and removals, so each
+recorded result costs O(N), a memmove of the list.
+
+Per-player stats live in a pluggable store: one dict per player
+(DictStandingsStore) or interned ids plus parallel integer columns
+(ColumnarStandingsStore) for large leagues.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:  # pragma: no cover - exercised only without sortedcontainers
+    SortedList = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+STAT_FIELDS = ("wins", "losses", "draws", "points", "matches_played")
+
+# Tiebreakers where a lower value ranks higher
+ASCENDING_FIELDS = ("losses",)
+
+
+class _BisectList:
+    """
+    Minimal SortedList stand-in backed by a plain list.
+
+    index() is an O(log N) bisection; add() and remove() are O(N), as every
+    later item shifts along the list.
+    """
+
+    def __init__(self):
+        self._items: List[Any] = []
+
+    def add(self, item: Any) -> None:
+        insort(self._items, item)
+
+    def remove(self, item: Any) -> None:
+        del self._items[bisect_left(self._items, item)]
+
+    def index(self, item: Any) -> int:
+        return bisect_left(self._items, item)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class DictStandingsStore:
+    """Stats stored as one dict per player"""
+
+    def __init__(self):
+        self._rows: Dict[str, Dict[str, int]] = {}
+
+    def add(self, player_id: str) -> None:
+        self._rows[player_id] = {field: 0 for field in STAT_FIELDS}
+
+    def get(self, player_id: str, field: str) -> int:
+        return self._rows[player_id][field]
+
+    def increment(self, player_id: str, wins: int, losses: int, draws: int, points: int,
+                  matches_played: int) -> None:
+        row = self._rows[player_id]
+        row["wins"] += wins
+        row["losses"] += losses
+        row["draws"] += draws
+        row["points"] += points
+        row["matches_played"] += matches_played
+
+    def view(self, player_id: str) -> Mapping:
+        return MappingProxyType(self._rows[player_id])
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class _ColumnarRow(Mapping):
+    """Read-only dict-like view of one player's row in a ColumnarStandingsStore"""
+
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns: Dict[str, array], row: int):
+        self._columns = columns
+        self._row = row
+
+    def __getitem__(self, field: str) -> int:
+        return self._columns[field][self._row]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(STAT_FIELDS)
+
+    def __len__(self) -> int:
+        return len(STAT_FIELDS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class ColumnarStandingsStore:
+    """
+    Stats stored column-wise: interned player ids map to a row number, and
+    each stat is a parallel array('q') column (8 bytes per player per stat).
+    """
+
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        self.player_ids: List[str] = []
+        self.columns: Dict[str, array] = {field: array("q") for field in STAT_FIELDS}
+
+    def add(self, player_id: str) -> None:
+        player_id = sys.intern(player_id)
+        self._rows[player_id] = len(self.player_ids)
+        self.player_ids.append(player_id)
+        for column in self.columns.values():
+            column.append(0)
+
+    def get(self, player_id: str, field: str) -> int:
+        return self.columns[field][self._rows[player_id]]
+
+    def increment(self, player_id: str, wins: int, losses: int, draws: int, points: int,
+                  matches_played: int) -> None:
+        row = self._rows[player_id]
+        columns = self.columns
+        columns["wins"][row] += wins
+        columns["losses"][row] += losses
+        columns["draws"][row] += draws
+        columns["points"][row] += points
+        columns["matches_played"][row] += matches_played
+
+    def view(self, player_id: str) -> Mapping:
+        return _ColumnarRow(self.columns, self._rows[player_id])
+
+    def as_numpy(self) -> Dict[str, Any]:
+        """
+        Get the stat columns as NumPy arrays sharing this store's memory.
+
+        The views are invalidated when a player is added (columns may move).
+
+        Returns:
+            Dictionary of field -> int64 ndarray, in player_ids order
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+        """
+        if numpy is None:
+            raise RuntimeError("NumPy is not installed")
+        return {field: numpy.frombuffer(column, dtype=numpy.int64)  # pragma: no cover - needs numpy
+                for field, column in self.columns.items()}
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+
+STANDINGS_STORES = {
+    "dict": DictStandingsStore,
+    "columnar": ColumnarStandingsStore
+}
+
+
+class RankedStandings(Mapping):
+    """
+    Standings keyed by player_id, iterated in ranking order.
+
+    Reading standings[player_id] gives a read-only view of that player's
+    stats; all changes go through record() so the ranking index stays in sync.
+    """
+
+    def __init__(self, tiebreakers: Optional[List[str]] = None, store: str = "dict"):
+        """
+        Initialize RankedStandings.
+
+        Args:
+            tiebreakers: Ordered ranking rules (ScoringConfig.tiebreakers). Each is a
+                         stat field (higher ranks first; "losses" lower ranks first)
+                         or "alphabetical" (player_id ascending).
+            store: Stats storage, "dict" or "columnar"
+
+        Raises:
+            ValueError: On an unknown tiebreaker or store
+        """
+        self.tiebreakers = list(tiebreakers or ["points", "wins", "alphabetical"])
+        for rule in self.tiebreakers:
+            if rule != "alphabetical" and rule not in STAT_FIELDS:
+                raise ValueError(f"Unknown tiebreaker: {rule}")
+
+        if store not in STANDINGS_STORES:
+            raise ValueError(f"Unknown standings store: {store}")
+
+        self._stats = STANDINGS_STORES[store]()
+        self._index = SortedList() if SortedList is not None else _BisectList()
+
+    @property
+    def store(self):
+        """Underlying stats store (DictStandingsStore or ColumnarStandingsStore)"""
+        return self._stats
+
+    def _rank_key(self, player_id: str) -> Tuple:
+        """
+        Sort key placing better-ranked players first.
+
+        Keys are derived from the store on demand rather than kept per
+        player, so the index holds the only copy.
+        """
+        key = []
+        for rule in self.tiebreakers:
+            if rule == "alphabetical":
+                key.append(player_id)
+            elif rule in ASCENDING_FIELDS:
+                key.append(self._stats.get(player_id, rule))
+            else:
+                key.append(-self._stats.get(player_id, rule))
+        # player_id last keeps the order total even without "alphabetical"
+        key.append(player_id)
+        return tuple(key)
+
+    def add_player(self, player_id: str) -> None:
+        """
+        Add a player with empty stats (no-op if already present).
+
+        Args:
+            player_id: Player identifier
+        """
+        if player_id in self._stats:
+            return
+        self._stats.add(player_id)
+        self._index.add(self._rank_key(player_id))
+
+    def record(self, player_id: str, wins: int = 0, losses: int = 0, draws: int = 0,
+               points: int = 0, matches_played: int = 1) -> None:
+        """
+        Add one result to a player's stats and reposition them.
+
+        Args:
+            player_id: Player identifier (added if new)
+            wins / losses / draws / points: Increments to apply
+            matches_played: Matches the increments cover
+        """
+        self.add_player(player_id)
+        self._index.remove(self._rank_key(player_id))
+        self._stats.increment(player_id, wins, losses, draws, points, matches_played)
+        self._index.add(self._rank_key(player_id))
+
+    def rank(self, player_id: str) -> int:
+        """
+        Get a player's 1-based rank.
+
+        Args:
+            player_id: Player identifier
+
+        Returns:
+            Rank (1 = leader)
+
+        Raises:
+            KeyError: If the player is unknown
+        """
+        if player_id not in self._stats:
+            raise KeyError(player_id)
+        return self._index.index(self._rank_key(player_id)) + 1
+
+    def top(self, k: int) -> List[Tuple[str, Mapping]]:
+        """
+        Get the k best-ranked players.
+
+        Args:
+            k: Number of players
+
+        Returns:
+            List of (player_id, stats view), best first
+        """
+        return [(key[-1], self[key[-1]]) for key in self._index[:k]]
+
+    def ranked(self) -> Iterator[Tuple[int, str, Mapping]]:
+        """
+        Iterate the table in ranking order.
+
+        Yields:
+            (rank, player_id, stats view)
+        """
+        for rank, key in enumerate(self._index, 1):
+            yield rank, key[-1], self[key[-1]]
+
+    def as_table(self, display_names: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Render standings as LEAGUE_STANDINGS_UPDATE / LEAGUE_QUERY_RESPONSE entries.
+
+        Args:
+            display_names: Optional player_id -> display name mapping
+
+        Returns:
+            List of standing objects, best first
+        """
+        display_names = display_names or {}
+        return [
+            {
+                "rank": rank,
+                "player_id": player_id,
+                "display_name": display_names.get(player_id, player_id),
+                "played": stats["matches_played"],
+                "wins": stats["wins"],
+                "draws": stats["draws"],
+                "losses": stats["losses"],
+                "points": stats["points"]
+            }
+            for rank, player_id, stats in self.ranked()
+        ]
+
+    def __getitem__(self, player_id: str) -> Mapping:
+        if player_id not in self._stats:
+            raise KeyError(player_id)
+        return self._stats.view(player_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key[-1] for key in self._index)
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._stats
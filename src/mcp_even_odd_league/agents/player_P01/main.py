@@ -5,13 +5,17 @@ Autonomous game participant. Handles match invitations, makes strategic decision
 Based on interfaces.md - PlayerInterface.
 """
 
+import random
 import sys
-from flask import Flask, request, jsonify
+from datetime import datetime
+from flask import Flask, request
 from mcp_even_odd_league.league_sdk.config_loader import ConfigLoader
 from mcp_even_odd_league.league_sdk.repositories import PlayerHistoryRepository
 from mcp_even_odd_league.league_sdk.logger import JsonLogger
 from mcp_even_odd_league.league_sdk.mcp_client import MCPClient
+from mcp_even_odd_league.league_sdk import jsonrpc, mcp_server
 from mcp_even_odd_league.league_sdk.config_models import SystemConfig
+from mcp_even_odd_league.agents.player_P01 import handlers
 
 
 app = Flask(__name__)
@@ -35,11 +39,13 @@ class Player:
         self.config_loader = ConfigLoader()
         self.system_config = self.config_loader.load_system()
         self.history_repo = PlayerHistoryRepository(player_id)
-        self.logger = JsonLogger(f"player:{player_id}")
-        self.mcp_client = MCPClient()
+        self.logger = JsonLogger(f"player:{player_id}", config=self.system_config.logging)
+        self.mcp_client = MCPClient(self.system_config.http_pool)
         self.state = "IDLE"
         self.current_match = None
         self.assigned_parity = None
+        # Random source for parity choices (seeded by the simulator for reproducible runs)
+        self.rng = random.Random()
 
         print(f"Player initialized: {player_id}")
 
@@ -156,14 +162,15 @@ class Player:
         Make strategic parity choice for a match.
 
         Args:
-            match_context: Context including opponent, history, etc.
+            match_context: CHOOSE_PARITY_CALL context (opponent_id, round_id, ...) plus match_id
 
         Returns:
             Parity choice ("even" or "odd")
 
-        TODO: Implement decision-making logic (delegates to strategy module)
+        Chooses uniformly at random for each match.
+        TODO: Delegate to the strategy module once it is implemented
         """
-        pass
+        return self.rng.choice(("even", "odd"))
 
     def validate_state_transition(self, current_state: str, message_type: str) -> bool:
         """
@@ -178,11 +185,12 @@ class Player:
 
         Phase 4: Simple state validation
         State flow: IDLE → INVITED → CHOOSING → WAITING_RESULT → IDLE
+        (GAME_OVER from INVITED or CHOOSING ends a match lost by technical loss)
         """
         valid_transitions = {
             "IDLE": ["GAME_INVITATION"],
-            "INVITED": ["CHOOSE_PARITY_CALL"],
-            "CHOOSING": ["GAME_OVER"],  # After sending response, we're effectively waiting
+            "INVITED": ["CHOOSE_PARITY_CALL", "GAME_OVER"],  # GAME_OVER: opponent lost at the invitation stage
+            "CHOOSING": ["CHOOSE_PARITY_CALL", "GAME_OVER"],  # Referee retry of an unanswered call; GAME_OVER after the response
             "WAITING_RESULT": ["GAME_OVER"]
         }
 
@@ -201,6 +209,10 @@ class Player:
         old_state = self.state
         self.state = new_state
 
+        # Skip formatting the trace and event when STATE_TRANSITION is filtered out
+        if not self.logger.is_enabled("INFO", "STATE_TRANSITION"):
+            return
+
         log_msg = f"[{self.player_id}] State transition: {old_state} → {new_state}"
         if reason:
             log_msg += f" (Reason: {reason})"
@@ -214,8 +226,51 @@ class Player:
         })
 
 
-# Global player instance
+def create_dispatcher(agent: "Player") -> jsonrpc.MethodDispatcher:
+    """
+    Build the method table for a player.
+
+    Args:
+        agent: Player instance the handlers act on
+
+    Returns:
+        Dispatcher with every player method registered
+    """
+    dispatcher = jsonrpc.MethodDispatcher()
+
+    # Match messages only change in-memory state and queue log entries, so they
+    # are coroutines: the asyncio server runs them on its loop, not a worker thread
+    async def game_invitation(params: dict) -> dict:
+        return handlers.handle_game_invitation(agent, params)
+
+    async def parity_choose(params: dict) -> dict:
+        return handlers.handle_parity_choose(agent, params)
+
+    async def match_result(params: dict) -> dict:
+        return handlers.handle_notify_match_result(agent, params)
+
+    dispatcher.register("handle_game_invitation", game_invitation)
+    dispatcher.register("parity_choose", parity_choose)
+    dispatcher.register("notify_match_result", match_result)
+
+    def acknowledge(method: str, params: dict) -> dict:
+        # Other player methods return a simple acknowledgment for now
+        return {
+            "protocol": "league.v2",
+            "message_type": "ACK",
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "status": "OK",
+            "message": f"Player {agent.player_id if agent else 'unknown'} received {method}"
+        }
+
+    dispatcher.register_many(["round_announcement", "standings_update", "round_completed", "league_completed"],
+                             acknowledge)
+    return dispatcher
+
+
+# Global player instance and its method table
 player = None
+dispatcher = create_dispatcher(player)
 
 
 @app.route('/mcp', methods=['POST'])
@@ -223,133 +278,42 @@ def handle_mcp_request():
     """
     Handle incoming MCP requests.
 
-    This endpoint receives JSON-RPC 2.0 requests.
+    This endpoint receives JSON-RPC 2.0 requests, single or batched,
+    as JSON or any negotiated binary codec.
     """
-    from datetime import datetime
-
-    try:
-        # Parse JSON request
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32700,
-                    "message": "Parse error: Invalid JSON"
-                },
-                "id": None
-            }), 400
-
-        # Validate JSON-RPC structure
-        if "jsonrpc" not in data or data["jsonrpc"] != "2.0":
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32600,
-                    "message": "Invalid Request: jsonrpc must be '2.0'"
-                },
-                "id": data.get("id")
-            }), 400
-
-        if "method" not in data:
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32600,
-                    "message": "Invalid Request: missing 'method' field"
-                },
-                "id": data.get("id")
-            }), 400
-
-        method = data["method"]
-        params = data.get("params", {})
-        request_id = data.get("id")
-
-        # Route based on method
-        if method == "handle_game_invitation":
-            from mcp_even_odd_league.agents.player_P01 import handlers
-            result = handlers.handle_game_invitation(player, params)
-            return jsonify({
-                "jsonrpc": "2.0",
-                "result": result,
-                "id": request_id
-            })
-
-        elif method == "parity_choose":
-            from mcp_even_odd_league.agents.player_P01 import handlers
-            result = handlers.handle_parity_choose(player, params)
-            return jsonify({
-                "jsonrpc": "2.0",
-                "result": result,
-                "id": request_id
-            })
-
-        elif method == "notify_match_result":
-            from mcp_even_odd_league.agents.player_P01 import handlers
-            result = handlers.handle_notify_match_result(player, params)
-            return jsonify({
-                "jsonrpc": "2.0",
-                "result": result,
-                "id": request_id
-            })
-
-        elif method in ["round_announcement", "standings_update", "round_completed", "league_completed"]:
-            # Other player methods return a simple acknowledgment for now
-            return jsonify({
-                "jsonrpc": "2.0",
-                "result": {
-                    "protocol": "league.v2",
-                    "message_type": "ACK",
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "status": "OK",
-                    "message": f"Player {player.player_id if player else 'unknown'} received {method}"
-                },
-                "id": request_id
-            })
-        else:
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32601,
-                    "message": f"Method not found: {method}"
-                },
-                "id": request_id
-            }), 404
-
-    except Exception as e:
-        return jsonify({
-            "jsonrpc": "2.0",
-            "error": {
-                "code": -32603,
-                "message": f"Internal error: {str(e)}"
-            },
-            "id": data.get("id") if 'data' in locals() else None
-        }), 500
+    return mcp_server.handle_http(dispatcher, request.content_type, request.get_data())
 
 
 def main():
     """Main entry point"""
-    global player
+    global player, dispatcher
 
     # Player ID from command line or default
-    player_id = sys.argv[1] if len(sys.argv) > 1 else "P01"
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    player_id = args[0] if args else "P01"
 
     # Initialize Player
     player = Player(player_id)
     player.start_player()
+    dispatcher = create_dispatcher(player)
 
     # Determine port from configuration based on player_id
     player_index = {"P01": 0, "P02": 1, "P03": 2, "P04": 3}.get(player_id, 0)
     port = player.system_config.network.player_ports[player_index]
 
+    server_mode = ConfigLoader.get_server_mode(sys.argv[1:])
+
     print(f"\n=== Player Starting ===")
     print(f"Player ID: {player_id}")
     print(f"Port: {port}")
-    print(f"Endpoint: http://localhost:{port}/mcp")
+    print(f"Endpoint: {player.system_config.network.endpoint_for(player_id, port)}")
+    print(f"Server mode: {server_mode}")
     print("=======================\n")
 
-    app.run(host='0.0.0.0', port=port, debug=False)
+    channel_offset = ConfigLoader.get_channel_port_offset()
+    mcp_server.serve(app, dispatcher, port, server_mode,
+                     unix_socket=player.system_config.network.socket_path(player_id),
+                     channel_port=port + channel_offset if channel_offset else None)
 
 
 if __name__ == "__main__":
@@ -4,9 +4,10 @@ Player - Message Handlers
 Handles incoming MCP messages and coordinates responses.
 """
 
-import random
 from datetime import datetime
 
+from mcp_even_odd_league.league_sdk import message_codecs
+
 
 def handle_game_invitation(player, invite_data: dict) -> dict:
     """
@@ -70,7 +71,9 @@ def handle_game_invitation(player, invite_data: dict) -> dict:
         "match_id": match_id,
         "player_id": player.player_id,
         "arrival_timestamp": datetime.utcnow().isoformat() + "Z",
-        "accept": True
+        "accept": True,
+        # Encodings this player decodes; the referee sends the rest of the match in the best one
+        "codecs": message_codecs.supported_content_types()
     }
 
 
@@ -110,8 +113,7 @@ def handle_parity_choose(player, request_data: dict) -> dict:
     # Transition to CHOOSING state
     player.transition_state("CHOOSING", f"Received parity request for match {match_id}")
 
-    # Randomly choose between "even" and "odd" for each round
-    choice = random.choice(["even", "odd"])
+    choice = player.make_parity_choice({**request_data.get("context", {}), "match_id": match_id})
 
     print(f"  Choosing: {choice}")
 
@@ -149,9 +151,10 @@ def handle_notify_match_result(player, result_data: dict) -> dict:
     print(f"  Current state: {player.state}")
 
     # Phase 4: Validate state before processing
-    # Accept GAME_OVER in both CHOOSING and WAITING_RESULT states
-    if player.state not in ["CHOOSING", "WAITING_RESULT"]:
-        error_msg = f"Invalid state for GAME_OVER: current state is {player.state}, expected CHOOSING or WAITING_RESULT"
+    # Accept GAME_OVER in INVITED (technical loss at invitation), CHOOSING and WAITING_RESULT
+    if not player.validate_state_transition(player.state, "GAME_OVER"):
+        error_msg = (f"Invalid state for GAME_OVER: current state is {player.state}, "
+                     f"expected INVITED, CHOOSING or WAITING_RESULT")
         print(f"  ⚠️ WARNING: {error_msg}")
         player.logger.log_event("INVALID_MESSAGE_STATE", {
             "player_id": player.player_id,
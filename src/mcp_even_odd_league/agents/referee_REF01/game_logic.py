@@ -2,13 +2,31 @@
 Referee - Game Logic Module
 
 Implements even/odd game rules and winner determination.
+determine_winners_batch evaluates many matches at once for simulation and
+replay; it uses NumPy when installed and a pure-Python fallback otherwise.
 """
 
 import random
-from typing import Dict, Any
+from array import array
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence
 
 from mcp_even_odd_league.league_sdk.config_loader import ConfigLoader
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover - exercised only with numpy
+    numpy = None
+
+
+# Batch encoding of parity choices
+EVEN = 0
+ODD = 1
+
+# Batch winner indices
+WINNER_A = 0
+WINNER_B = 1
+NO_WINNER = -1
+
 
 def draw_random_number(min_value: int = None, max_value: int = None) -> int:
     """
@@ -129,3 +147,130 @@ def validate_parity_choice(choice: str) -> bool:
         True if valid ("even" or "odd"), False otherwise
     """
     return choice.lower() in ["even", "odd"]
+
+
+class BatchOutcome(NamedTuple):
+    """
+    Results of determine_winners_batch, one entry per match.
+
+    Fields are NumPy arrays on the NumPy path and array.array otherwise.
+    """
+    winner: Sequence[int]     # WINNER_A, WINNER_B or NO_WINNER (draw)
+    is_draw: Sequence[int]    # 1 for draws, 0 otherwise
+    score_A: Sequence[int]    # Points awarded to player A
+    score_B: Sequence[int]    # Points awarded to player B
+
+
+def encode_choices(choices: Sequence[str]) -> List[int]:
+    """
+    Encode parity choices for determine_winners_batch.
+
+    Args:
+        choices: "even" / "odd" strings (case-insensitive)
+
+    Returns:
+        List of EVEN (0) / ODD (1)
+    """
+    return [ODD if choice.lower() == "odd" else EVEN for choice in choices]
+
+
+def determine_winners_batch(drawn_numbers: Sequence[int], player_A_choices: Sequence[int],
+                            player_B_choices: Sequence[int], win_points: int = 3, draw_points: int = 1,
+                            loss_points: int = 0, use_numpy: Optional[bool] = None) -> BatchOutcome:
+    """
+    Determine winners for many matches in one pass.
+
+    Same rules as determine_winner: a player wins when only they matched the
+    drawn number's parity; both or neither matching is a draw.
+
+    Args:
+        drawn_numbers: Drawn numbers, one per match
+        player_A_choices: Player A choices encoded as EVEN (0) / ODD (1)
+        player_B_choices: Player B choices encoded as EVEN (0) / ODD (1)
+        win_points / draw_points / loss_points: Score for each outcome
+        use_numpy: Force (True) or disable (False) the NumPy path; None picks
+                   NumPy when installed
+
+    Returns:
+        BatchOutcome with winner indices, draw flags and score vectors
+
+    Raises:
+        ValueError: If the input lengths differ
+    """
+    if not len(drawn_numbers) == len(player_A_choices) == len(player_B_choices):
+        raise ValueError("drawn_numbers, player_A_choices and player_B_choices must have the same length")
+
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if use_numpy:
+        if numpy is None:
+            raise RuntimeError("NumPy is not installed")
+        return _determine_winners_numpy(drawn_numbers, player_A_choices, player_B_choices,
+                                        win_points, draw_points, loss_points)
+    return _determine_winners_bytes(drawn_numbers, player_A_choices, player_B_choices,
+                                    win_points, draw_points, loss_points)
+
+
+def _determine_winners_numpy(drawn_numbers, player_A_choices, player_B_choices,
+                             win_points: int, draw_points: int, loss_points: int) -> BatchOutcome:
+    """Vectorized evaluation with NumPy"""
+    parity = numpy.asarray(drawn_numbers, dtype=numpy.int64) & 1
+    a = numpy.asarray(player_A_choices, dtype=numpy.int8)
+    b = numpy.asarray(player_B_choices, dtype=numpy.int8)
+
+    is_draw = a == b
+    winner = numpy.where(is_draw, NO_WINNER, a ^ parity).astype(numpy.int8)
+    score_A = numpy.where(is_draw, draw_points, numpy.where(winner == WINNER_A, win_points, loss_points))
+    score_B = numpy.where(is_draw, draw_points, numpy.where(winner == WINNER_B, win_points, loss_points))
+    return BatchOutcome(winner, is_draw.astype(numpy.int8), score_A, score_B)
+
+
+def _determine_winners_bytes(drawn_numbers, player_A_choices, player_B_choices,
+                             win_points: int, draw_points: int, loss_points: int) -> BatchOutcome:
+    """
+    Pure-Python evaluation that stays in C loops.
+
+    Each 0/1 vector is packed one value per byte into a big integer, so XOR
+    and AND over the whole batch are single integer operations (no carries
+    cross byte boundaries); bytes.translate then maps outcome codes to results.
+    """
+    n = len(drawn_numbers)
+    if n == 0:
+        return BatchOutcome(array("b"), array("B"), array("q"), array("q"))
+
+    ones = int.from_bytes(b"\x01" * n, "big")
+    try:
+        parity = int.from_bytes(bytes(drawn_numbers), "big") & ones
+    except ValueError:
+        # Numbers outside 0..255 do not fit a byte; take their parity first
+        parity = int.from_bytes(bytes(number & 1 for number in drawn_numbers), "big")
+    a = int.from_bytes(bytes(player_A_choices), "big")
+    b = int.from_bytes(bytes(player_B_choices), "big")
+
+    differs = a ^ b                        # 1 where exactly one player can win
+    b_wins = (a ^ parity) & differs        # 1 where B won
+    draws = differs ^ ones                 # 1 where drawn
+
+    # Outcome code per match: 0 = A won, 1 = B won, 2 = draw
+    codes = (b_wins | (draws << 1)).to_bytes(n, "big")
+
+    winner = array("b", codes.translate(_code_table({0: WINNER_A, 1: WINNER_B, 2: NO_WINNER})))
+    is_draw = array("B", draws.to_bytes(n, "big"))
+    score_A = _scores_for(codes, {0: win_points, 1: loss_points, 2: draw_points})
+    score_B = _scores_for(codes, {0: loss_points, 1: win_points, 2: draw_points})
+    return BatchOutcome(winner, is_draw, score_A, score_B)
+
+
+def _code_table(mapping: Dict[int, int]) -> bytes:
+    """bytes.translate table mapping outcome codes to byte values"""
+    table = bytearray(range(256))
+    for code, value in mapping.items():
+        table[code] = value & 0xFF
+    return bytes(table)
+
+
+def _scores_for(codes: bytes, points: Dict[int, int]) -> array:
+    """Map outcome codes to a score vector"""
+    if all(0 <= value <= 255 for value in points.values()):
+        return array("q", array("B", codes.translate(_code_table(points))))
+    return array("q", [points[code] for code in codes])
@@ -9,16 +9,42 @@ def handle_match_assignment(referee, match_data: dict) -> dict:
     """
     Handle MATCH_ASSIGNMENT message from League Manager.
 
+    Queues the match on the referee's MatchEngine and acknowledges at once;
+    the match runs in the background alongside other assigned matches.
+
     Args:
         referee: Referee instance
-        match_data: Match assignment payload
+        match_data: Match assignment payload (match_id, league_id, round_id,
+                    player_A_id, player_B_id, player_A_endpoint, player_B_endpoint)
 
     Returns:
         Response payload
-
-    TODO: Implement match assignment handling
     """
-    pass
+    from datetime import datetime
+
+    required_fields = ["match_id", "league_id", "round_id", "player_A_id", "player_B_id",
+                       "player_A_endpoint", "player_B_endpoint"]
+    for field in required_fields:
+        if field not in match_data:
+            return {
+                "protocol": "league.v2",
+                "message_type": "MATCH_ASSIGNMENT_ACK",
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "status": "REJECTED",
+                "reason": f"Missing required field: {field}"
+            }
+
+    referee.match_engine.submit(match_data)
+
+    return {
+        "protocol": "league.v2",
+        "message_type": "MATCH_ASSIGNMENT_ACK",
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "status": "ACCEPTED",
+        "match_id": match_data["match_id"],
+        "active_matches": len(referee.active_matches),
+        "max_concurrent_matches": referee.max_concurrent_matches
+    }
 
 
 def handle_game_join_ack(referee, player_data: dict) -> dict:
@@ -5,13 +5,22 @@ Match-level orchestrator. Manages complete lifecycle of a single match.
 Based on interfaces.md - RefereeInterface.
 """
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as wait_for
+from datetime import datetime
+from typing import Dict, Optional
 
-from flask import Flask, request, jsonify
+from flask import Flask, request
 from mcp_even_odd_league.league_sdk.config_loader import ConfigLoader
 from mcp_even_odd_league.league_sdk.repositories import MatchRepository
 from mcp_even_odd_league.league_sdk.logger import JsonLogger
 from mcp_even_odd_league.league_sdk.mcp_client import MCPClient
+from mcp_even_odd_league.league_sdk.channel import ChannelTransport
+from mcp_even_odd_league.league_sdk.transports import HttpTransport
+from mcp_even_odd_league.league_sdk import jsonrpc, mcp_server
 from mcp_even_odd_league.league_sdk.config_models import SystemConfig
+from mcp_even_odd_league.agents.referee_REF01.match_engine import MatchEngine, MatchState
+from mcp_even_odd_league.agents.referee_REF01 import handlers
 
 
 app = Flask(__name__)
@@ -34,13 +43,42 @@ class Referee:
         self.referee_id = referee_id
         self.config_loader = ConfigLoader()
         self.system_config = self.config_loader.load_system()
-        self.logger = JsonLogger(f"referee:{referee_id}")
-        self.mcp_client = MCPClient()
-        self.state = "IDLE"
-        self.current_match = None
+        self.logger = JsonLogger(f"referee:{referee_id}", config=self.system_config.logging)
+
+        channel_offset = ConfigLoader.get_channel_port_offset()
+        if channel_offset:
+            # One persistent multiplexed connection per agent (players may push
+            # requests back over it); HTTP for agents that do not accept channels
+            transport = ChannelTransport(channel_offset, fallback=HttpTransport(self.system_config.http_pool),
+                                         dispatcher=create_dispatcher(self))
+            self.mcp_client = MCPClient(transport=transport)
+        else:
+            self.mcp_client = MCPClient(self.system_config.http_pool)
+
+        # Per-match state for every match currently running on this referee
+        self.active_matches: Dict[str, MatchState] = {}
+        self._matches_lock = threading.Lock()
+        self.max_concurrent_matches = ConfigLoader.get_max_concurrent_matches()
+        self.match_engine = MatchEngine(self, self.max_concurrent_matches)
+        # Shared by every match for its per-phase fan-out to both players
+        self._fan_out_executor = ThreadPoolExecutor(
+            max_workers=2 * self.max_concurrent_matches,
+            thread_name_prefix=f"referee-{referee_id}-fan-out"
+        )
 
         print(f"Referee initialized: {referee_id}")
 
+    @property
+    def state(self) -> str:
+        """Referee-level state: IDLE, or IN_MATCH while any match is running"""
+        return "IN_MATCH" if self.active_matches else "IDLE"
+
+    @property
+    def current_match(self) -> Optional[str]:
+        """Most recently started running match ID, or None when idle"""
+        with self._matches_lock:
+            return next(reversed(list(self.active_matches)), None)
+
     def start_referee(self) -> None:
         """
         Start Referee HTTP server and register with League Manager.
@@ -50,6 +88,17 @@ class Referee:
         print(f"Starting Referee {self.referee_id}")
         # Server started by Flask app.run() below
 
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop running matches and release the referee's worker pools and connections.
+
+        Args:
+            wait: Block until running (and queued) matches finish
+        """
+        self.match_engine.shutdown(wait=wait)
+        self._fan_out_executor.shutdown(wait=wait)
+        self.mcp_client.close()
+
     def handle_match_assignment(self, match_id: str, player_A_id: str, player_B_id: str,
                                  league_id: str, round_id: int) -> None:
         """
@@ -175,10 +224,50 @@ class Referee:
         - 5 second timeout for GAME_JOIN_ACK with 1 retry
         - 30 second timeout for CHOOSE_PARITY_RESPONSE with 1 retry
         - Technical loss handling after retry failure
+
+        Both players are contacted concurrently in every phase, so a phase
+        takes as long as the slower player rather than the sum of both.
+        Any number of matches may run at once; each keeps its own MatchState.
+        """
+        match = MatchState(
+            match_id=match_id,
+            league_id=league_id,
+            round_id=round_id,
+            player_A_id=player_A_id,
+            player_B_id=player_B_id,
+            logger=self.logger.bind(match_id=match_id)
+        )
+        with self._matches_lock:
+            self.active_matches[match_id] = match
+        try:
+            match.result = self._run_match(match, player_A_endpoint, player_B_endpoint, report_to_league_manager)
+            return match.result
+        finally:
+            with self._matches_lock:
+                self.active_matches.pop(match_id, None)
+
+    def _run_match(self, match: MatchState, player_A_endpoint: str, player_B_endpoint: str,
+                   report_to_league_manager: bool) -> dict:
+        """
+        Drive one match through the referee state machine.
+
+        Args:
+            match: Per-match state (IDs, bound logger, current state)
+            player_A_endpoint: Player A's MCP endpoint
+            player_B_endpoint: Player B's MCP endpoint
+            report_to_league_manager: If True, sends MATCH_RESULT_REPORT to League Manager
+
+        Returns:
+            Match result dictionary
         """
-        from datetime import datetime
         from mcp_even_odd_league.agents.referee_REF01 import game_logic
 
+        match_id = match.match_id
+        league_id = match.league_id
+        round_id = match.round_id
+        player_A_id = match.player_A_id
+        player_B_id = match.player_B_id
+
         print(f"\n=== Starting Match {match_id} ===")
         print(f"Player A: {player_A_id} ({player_A_endpoint})")
         print(f"Player B: {player_B_id} ({player_B_endpoint})")
@@ -188,11 +277,6 @@ class Referee:
         PARITY_RESPONSE_TIMEOUT = self.system_config.timeouts.move_timeout_sec
         MAX_RETRIES = ConfigLoader.get_max_retries()
 
-        # Track timeouts for technical loss
-        player_A_timeout = False
-        player_B_timeout = False
-        technical_loss_player = None
-
         # Step 1: Send GAME_INVITATION to both players with timeout and retry
         print("\nStep 1: Sending GAME_INVITATION to both players...")
 
@@ -224,80 +308,34 @@ class Referee:
             }
         )
 
-        # Send invitation to Player A with retry
-        ack_A = None
-        for attempt in range(MAX_RETRIES + 1):
-            try:
-                print(f"  Sending invitation to Player A (attempt {attempt + 1}/{MAX_RETRIES + 1})...")
-                ack_A = self.mcp_client.send_request(
-                    "handle_game_invitation",
-                    invitation_A,
-                    player_A_endpoint,
-                    timeout=JOIN_ACK_TIMEOUT
-                )
-                print(f"  Player A accepted: {ack_A.get('accept')}")
-                break
-            except Exception as e:
-                if "timeout" in str(e).lower() and attempt < MAX_RETRIES:
-                    print(f"  ⚠️ TIMEOUT: Player A did not respond within {JOIN_ACK_TIMEOUT}s. Retrying...")
-                    self.logger.log_event("TIMEOUT_GAME_JOIN_ACK", {
-                        "player_id": player_A_id,
-                        "match_id": match_id,
-                        "attempt": attempt + 1,
-                        "will_retry": True
-                    })
-                elif "timeout" in str(e).lower():
-                    print(f"  ❌ TECHNICAL LOSS: Player A failed to respond after {MAX_RETRIES} retries")
-                    self.logger.log_event("TECHNICAL_LOSS_GAME_JOIN_ACK", {
-                        "player_id": player_A_id,
-                        "match_id": match_id,
-                        "total_attempts": MAX_RETRIES + 1
-                    })
-                    player_A_timeout = True
-                    technical_loss_player = player_A_id
-                    break
-                else:
-                    raise
+        # Send invitations to both players concurrently, each with its own retries
+        ack_A, ack_B = self._fan_out(
+            lambda: self._send_with_retry(
+                "handle_game_invitation", invitation_A, player_A_endpoint, JOIN_ACK_TIMEOUT, MAX_RETRIES,
+                "Player A", player_A_id, match, "invitation", "GAME_JOIN_ACK"),
+            lambda: self._send_with_retry(
+                "handle_game_invitation", invitation_B, player_B_endpoint, JOIN_ACK_TIMEOUT, MAX_RETRIES,
+                "Player B", player_B_id, match, "invitation", "GAME_JOIN_ACK")
+        )
+
+        if ack_A is not None:
+            print(f"  Player A accepted: {ack_A.get('accept')}")
+        if ack_B is not None:
+            print(f"  Player B accepted: {ack_B.get('accept')}")
+
+        # Send the rest of the match in the encoding each player advertised in GAME_JOIN_ACK
+        for endpoint, ack in ((player_A_endpoint, ack_A), (player_B_endpoint, ack_B)):
+            if ack is not None and ack.get("codecs"):
+                self.mcp_client.set_endpoint_codecs(endpoint, ack["codecs"])
 
-        # Send invitation to Player B with retry
-        ack_B = None
-        if not player_A_timeout:  # Only if Player A didn't timeout
-            for attempt in range(MAX_RETRIES + 1):
-                try:
-                    print(f"  Sending invitation to Player B (attempt {attempt + 1}/{MAX_RETRIES + 1})...")
-                    ack_B = self.mcp_client.send_request(
-                        "handle_game_invitation",
-                        invitation_B,
-                        player_B_endpoint,
-                        timeout=JOIN_ACK_TIMEOUT
-                    )
-                    print(f"  Player B accepted: {ack_B.get('accept')}")
-                    break
-                except Exception as e:
-                    if "timeout" in str(e).lower() and attempt < MAX_RETRIES:
-                        print(f"  ⚠️ TIMEOUT: Player B did not respond within {JOIN_ACK_TIMEOUT}s. Retrying...")
-                        self.logger.log_event("TIMEOUT_GAME_JOIN_ACK", {
-                            "player_id": player_B_id,
-                            "match_id": match_id,
-                            "attempt": attempt + 1,
-                            "will_retry": True
-                        })
-                    elif "timeout" in str(e).lower():
-                        print(f"  ❌ TECHNICAL LOSS: Player B failed to respond after {MAX_RETRIES} retries")
-                        self.logger.log_event("TECHNICAL_LOSS_GAME_JOIN_ACK", {
-                            "player_id": player_B_id,
-                            "match_id": match_id,
-                            "total_attempts": MAX_RETRIES + 1
-                        })
-                        player_B_timeout = True
-                        technical_loss_player = player_B_id
-                        break
-                    else:
-                        raise
+        # If both players time out, Player A's timeout takes precedence
+        player_A_timeout = ack_A is None
+        player_B_timeout = ack_B is None
 
         # Handle technical loss at invitation stage
         if player_A_timeout or player_B_timeout:
             print(f"\n⚠️ Match ending due to technical loss at invitation stage")
+            technical_loss_player = player_A_id if player_A_timeout else player_B_id
             winner_id = player_B_id if player_A_timeout else player_A_id
             loser_id = technical_loss_player
 
@@ -314,10 +352,14 @@ class Referee:
             }
 
             # Skip to reporting
+            match.transition("REPORTING_RESULT")
             self._report_technical_loss(match_id, league_id, round_id, result, player_A_id, player_B_id, report_to_league_manager)
+            self._notify_technical_loss(match_id, result, player_A_endpoint, player_B_endpoint, JOIN_ACK_TIMEOUT)
+            match.transition("MATCH_COMPLETE")
             return result
 
         # Step 2: Send CHOOSE_PARITY_CALL to both players with timeout and retry
+        match.transition("COLLECTING_CHOICES")
         print("\nStep 2: Sending CHOOSE_PARITY_CALL to both players...")
 
         parity_call_A = self.mcp_client.format_message(
@@ -354,84 +396,31 @@ class Referee:
             }
         )
 
-        # Send parity call to Player A with retry
-        choice_A = None
-        player_A_choice = None
-        for attempt in range(MAX_RETRIES + 1):
-            try:
-                print(f"  Sending parity call to Player A (attempt {attempt + 1}/{MAX_RETRIES + 1})...")
-                choice_A = self.mcp_client.send_request(
-                    "parity_choose",
-                    parity_call_A,
-                    player_A_endpoint,
-                    timeout=PARITY_RESPONSE_TIMEOUT
-                )
-                player_A_choice = choice_A.get("parity_choice")
-                print(f"  Player A chose: {player_A_choice}")
-                break
-            except Exception as e:
-                if "timeout" in str(e).lower() and attempt < MAX_RETRIES:
-                    print(f"  ⚠️ TIMEOUT: Player A did not respond within {PARITY_RESPONSE_TIMEOUT}s. Retrying...")
-                    self.logger.log_event("TIMEOUT_CHOOSE_PARITY", {
-                        "player_id": player_A_id,
-                        "match_id": match_id,
-                        "attempt": attempt + 1,
-                        "will_retry": True
-                    })
-                elif "timeout" in str(e).lower():
-                    print(f"  ❌ TECHNICAL LOSS: Player A failed to respond after {MAX_RETRIES} retries")
-                    self.logger.log_event("TECHNICAL_LOSS_CHOOSE_PARITY", {
-                        "player_id": player_A_id,
-                        "match_id": match_id,
-                        "total_attempts": MAX_RETRIES + 1
-                    })
-                    player_A_timeout = True
-                    technical_loss_player = player_A_id
-                    break
-                else:
-                    raise
+        # Send parity calls to both players concurrently, each with its own retries
+        choice_A, choice_B = self._fan_out(
+            lambda: self._send_with_retry(
+                "parity_choose", parity_call_A, player_A_endpoint, PARITY_RESPONSE_TIMEOUT, MAX_RETRIES,
+                "Player A", player_A_id, match, "parity call", "CHOOSE_PARITY"),
+            lambda: self._send_with_retry(
+                "parity_choose", parity_call_B, player_B_endpoint, PARITY_RESPONSE_TIMEOUT, MAX_RETRIES,
+                "Player B", player_B_id, match, "parity call", "CHOOSE_PARITY")
+        )
+
+        player_A_choice = choice_A.get("parity_choice") if choice_A is not None else None
+        player_B_choice = choice_B.get("parity_choice") if choice_B is not None else None
+        if choice_A is not None:
+            print(f"  Player A chose: {player_A_choice}")
+        if choice_B is not None:
+            print(f"  Player B chose: {player_B_choice}")
 
-        # Send parity call to Player B with retry
-        choice_B = None
-        player_B_choice = None
-        if not player_A_timeout:  # Only if Player A didn't timeout
-            for attempt in range(MAX_RETRIES + 1):
-                try:
-                    print(f"  Sending parity call to Player B (attempt {attempt + 1}/{MAX_RETRIES + 1})...")
-                    choice_B = self.mcp_client.send_request(
-                        "parity_choose",
-                        parity_call_B,
-                        player_B_endpoint,
-                        timeout=PARITY_RESPONSE_TIMEOUT
-                    )
-                    player_B_choice = choice_B.get("parity_choice")
-                    print(f"  Player B chose: {player_B_choice}")
-                    break
-                except Exception as e:
-                    if "timeout" in str(e).lower() and attempt < MAX_RETRIES:
-                        print(f"  ⚠️ TIMEOUT: Player B did not respond within {PARITY_RESPONSE_TIMEOUT}s. Retrying...")
-                        self.logger.log_event("TIMEOUT_CHOOSE_PARITY", {
-                            "player_id": player_B_id,
-                            "match_id": match_id,
-                            "attempt": attempt + 1,
-                            "will_retry": True
-                        })
-                    elif "timeout" in str(e).lower():
-                        print(f"  ❌ TECHNICAL LOSS: Player B failed to respond after {MAX_RETRIES} retries")
-                        self.logger.log_event("TECHNICAL_LOSS_CHOOSE_PARITY", {
-                            "player_id": player_B_id,
-                            "match_id": match_id,
-                            "total_attempts": MAX_RETRIES + 1
-                        })
-                        player_B_timeout = True
-                        technical_loss_player = player_B_id
-                        break
-                    else:
-                        raise
+        # If both players time out, Player A's timeout takes precedence
+        player_A_timeout = choice_A is None
+        player_B_timeout = choice_B is None
 
         # Handle technical loss at parity choice stage
         if player_A_timeout or player_B_timeout:
             print(f"\n⚠️ Match ending due to technical loss at parity choice stage")
+            technical_loss_player = player_A_id if player_A_timeout else player_B_id
             winner_id = player_B_id if player_A_timeout else player_A_id
             loser_id = technical_loss_player
 
@@ -448,10 +437,14 @@ class Referee:
             }
 
             # Skip to reporting
+            match.transition("REPORTING_RESULT")
             self._report_technical_loss(match_id, league_id, round_id, result, player_A_id, player_B_id, report_to_league_manager)
+            self._notify_technical_loss(match_id, result, player_A_endpoint, player_B_endpoint, JOIN_ACK_TIMEOUT)
+            match.transition("MATCH_COMPLETE")
             return result
 
         # Step 3: Draw number and determine winner (normal path)
+        match.transition("DRAWING_NUMBER")
         print("\nStep 3: Drawing number and determining winner...")
 
         drawn_number = game_logic.draw_random_number()
@@ -468,6 +461,7 @@ class Referee:
             print(f"  Winner: {result['winner_id']}")
 
         # Step 4: Send GAME_OVER to both players
+        match.transition("NOTIFYING_PLAYERS")
         print("\nStep 4: Sending GAME_OVER to both players...")
 
         game_over_msg = self.mcp_client.format_message(
@@ -492,13 +486,16 @@ class Referee:
             }
         )
 
-        ack_A = self.mcp_client.send_request("notify_match_result", game_over_msg, player_A_endpoint)
-        ack_B = self.mcp_client.send_request("notify_match_result", game_over_msg, player_B_endpoint)
+        ack_A, ack_B = self._fan_out(
+            lambda: self.mcp_client.send_request("notify_match_result", game_over_msg, player_A_endpoint),
+            lambda: self.mcp_client.send_request("notify_match_result", game_over_msg, player_B_endpoint)
+        )
 
         print(f"  Player A acknowledged: {ack_A.get('status')}")
         print(f"  Player B acknowledged: {ack_B.get('status')}")
 
         # Step 5: Report result to League Manager
+        match.transition("REPORTING_RESULT")
         print("\nStep 5: Reporting result to League Manager...")
 
         # Calculate scores (3 for win, 1 for draw, 0 for loss)
@@ -534,16 +531,83 @@ class Referee:
         )
 
         if report_to_league_manager:
-            league_manager_endpoint = f"http://localhost:{self.system_config.network.league_manager_port}/mcp"
+            network = self.system_config.network
+            league_manager_endpoint = network.endpoint_for("league_manager", network.league_manager_port)
             report_ack = self.mcp_client.send_request("report_match_result", match_report, league_manager_endpoint)
             print(f"  League Manager acknowledged: {report_ack.get('status')}")
         else:
             print(f"  Skipping League Manager report (integration test mode)")
 
+        match.transition("MATCH_COMPLETE")
         print(f"\n=== Match {match_id} Complete ===\n")
 
         return result
 
+    def _fan_out(self, *calls):
+        """
+        Run independent calls concurrently and return their results in order.
+
+        Args:
+            *calls: Zero-argument callables (one per player)
+
+        Returns:
+            List of results, in the same order as calls
+
+        Raises:
+            Exception: The first exception raised by any call (after all finish)
+        """
+        futures = [self._fan_out_executor.submit(call) for call in calls]
+        wait_for(futures)
+        return [future.result() for future in futures]
+
+    def _send_with_retry(self, method: str, message: dict, endpoint: str, timeout: int, max_retries: int,
+                         player_label: str, player_id: str, match: MatchState,
+                         action: str, event_suffix: str) -> Optional[dict]:
+        """
+        Send a request to one player, retrying on timeout.
+
+        Args:
+            method: JSON-RPC method name
+            message: Request payload
+            endpoint: Player's MCP endpoint
+            timeout: Per-attempt timeout in seconds
+            max_retries: Retries after the first attempt
+            player_label: "Player A" or "Player B" (console output)
+            player_id: Player ID (log events)
+            match: Match state (its bound logger records the events)
+            action: Message description for console output (e.g., "invitation")
+            event_suffix: Log event suffix (e.g., "GAME_JOIN_ACK" for TIMEOUT_GAME_JOIN_ACK)
+
+        Returns:
+            Response result, or None if every attempt timed out (technical loss)
+
+        Raises:
+            Exception: On any non-timeout error
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                print(f"  Sending {action} to {player_label} (attempt {attempt + 1}/{max_retries + 1})...")
+                return self.mcp_client.send_request(method, message, endpoint, timeout=timeout)
+            except Exception as e:
+                if "timeout" not in str(e).lower():
+                    raise
+                if attempt < max_retries:
+                    print(f"  ⚠️ TIMEOUT: {player_label} did not respond within {timeout}s. Retrying...")
+                    match.logger.log_event(f"TIMEOUT_{event_suffix}", {
+                        "player_id": player_id,
+                        "match_id": match.match_id,
+                        "attempt": attempt + 1,
+                        "will_retry": True
+                    })
+                else:
+                    print(f"  ❌ TECHNICAL LOSS: {player_label} failed to respond after {max_retries} retries")
+                    match.logger.log_event(f"TECHNICAL_LOSS_{event_suffix}", {
+                        "player_id": player_id,
+                        "match_id": match.match_id,
+                        "total_attempts": max_retries + 1
+                    })
+        return None
+
     def _report_technical_loss(self, match_id: str, league_id: str, round_id: int,
                                 result: dict, player_A_id: str, player_B_id: str,
                                 report_to_league_manager: bool = True) -> None:
@@ -589,7 +653,8 @@ class Referee:
         )
 
         if report_to_league_manager:
-            league_manager_endpoint = f"http://localhost:{self.system_config.network.league_manager_port}/mcp"
+            network = self.system_config.network
+            league_manager_endpoint = network.endpoint_for("league_manager", network.league_manager_port)
             report_ack = self.mcp_client.send_request("report_match_result", match_report, league_manager_endpoint)
             print(f"  League Manager acknowledged: {report_ack.get('status')}")
         else:
@@ -598,8 +663,83 @@ class Referee:
         print(f"\n=== Match {match_id} Complete (Technical Loss) ===\n")
 
 
-# Global referee instance
+    def _notify_technical_loss(self, match_id: str, result: dict, player_A_endpoint: str,
+                               player_B_endpoint: str, timeout: int) -> None:
+        """
+        Send GAME_OVER for a technical loss to both players, so they return to IDLE.
+
+        Best effort: the player who lost may be unreachable, so failures are
+        only printed.
+
+        Args:
+            match_id: Match identifier
+            result: Match result with technical loss info
+            player_A_endpoint: Player A's MCP endpoint
+            player_B_endpoint: Player B's MCP endpoint
+            timeout: Per-player timeout in seconds
+        """
+        game_over_msg = self.mcp_client.format_message(
+            message_type="GAME_OVER",
+            sender=f"referee:{self.referee_id}",
+            payload={
+                "auth_token": "tok-ref-placeholder",
+                "match_id": match_id,
+                "game_type": "even_odd",
+                "game_result": {
+                    "status": "TECHNICAL_LOSS",
+                    "winner_player_id": result['winner_id'],
+                    "drawn_number": None,
+                    "number_parity": None,
+                    "reason": result['technical_loss_reason']
+                }
+            }
+        )
+
+        def notify(endpoint: str) -> None:
+            try:
+                self.mcp_client.send_request("notify_match_result", game_over_msg, endpoint, timeout=timeout)
+            except Exception as e:
+                print(f"  ⚠️ GAME_OVER not delivered to {endpoint}: {e}")
+
+        self._fan_out(lambda: notify(player_A_endpoint), lambda: notify(player_B_endpoint))
+
+
+def create_dispatcher(agent: "Referee") -> jsonrpc.MethodDispatcher:
+    """
+    Build the method table for a referee.
+
+    Args:
+        agent: Referee instance the handlers act on
+
+    Returns:
+        Dispatcher with every referee method registered
+    """
+    dispatcher = jsonrpc.MethodDispatcher()
+
+    # Assignments are only queued on the MatchEngine, so the handler is a coroutine:
+    # the asyncio server acknowledges on its loop instead of a worker thread
+    async def match_assignment(params: dict) -> dict:
+        return handlers.handle_match_assignment(agent, params)
+
+    dispatcher.register("match_assignment", match_assignment)
+
+    def acknowledge(method: str, params: dict) -> dict:
+        # For Phase 2, referee methods other than match_assignment are stubs
+        return {
+            "protocol": "league.v2",
+            "message_type": "ACK",
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "status": "OK",
+            "message": f"Referee {agent.referee_id if agent else 'unknown'} received {method}"
+        }
+
+    dispatcher.register_many(["game_join_ack", "choose_parity_response"], acknowledge)
+    return dispatcher
+
+
+# Global referee instance and its method table
 referee = None
+dispatcher = create_dispatcher(referee)
 
 
 @app.route('/mcp', methods=['POST'])
@@ -607,107 +747,45 @@ def handle_mcp_request():
     """
     Handle incoming MCP requests.
 
-    This endpoint receives JSON-RPC 2.0 requests.
+    This endpoint receives JSON-RPC 2.0 requests, single or batched,
+    as JSON or any negotiated binary codec.
     """
-    from datetime import datetime
-
-    try:
-        # Parse JSON request
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32700,
-                    "message": "Parse error: Invalid JSON"
-                },
-                "id": None
-            }), 400
-
-        # Validate JSON-RPC structure
-        if "jsonrpc" not in data or data["jsonrpc"] != "2.0":
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32600,
-                    "message": "Invalid Request: jsonrpc must be '2.0'"
-                },
-                "id": data.get("id")
-            }), 400
-
-        if "method" not in data:
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32600,
-                    "message": "Invalid Request: missing 'method' field"
-                },
-                "id": data.get("id")
-            }), 400
-
-        method = data["method"]
-        params = data.get("params", {})
-        request_id = data.get("id")
-
-        # Route based on method
-        # For Phase 2, we only implement basic routing - handlers are stubs
-        if method in ["match_assignment", "game_join_ack", "choose_parity_response"]:
-            # All referee methods return a simple acknowledgment for now
-            return jsonify({
-                "jsonrpc": "2.0",
-                "result": {
-                    "protocol": "league.v2",
-                    "message_type": "ACK",
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                    "status": "OK",
-                    "message": f"Referee {referee.referee_id if referee else 'unknown'} received {method}"
-                },
-                "id": request_id
-            })
-        else:
-            return jsonify({
-                "jsonrpc": "2.0",
-                "error": {
-                    "code": -32601,
-                    "message": f"Method not found: {method}"
-                },
-                "id": request_id
-            }), 404
-
-    except Exception as e:
-        return jsonify({
-            "jsonrpc": "2.0",
-            "error": {
-                "code": -32603,
-                "message": f"Internal error: {str(e)}"
-            },
-            "id": data.get("id") if 'data' in locals() else None
-        }), 500
+    return mcp_server.handle_http(dispatcher, request.content_type, request.get_data())
 
 
 def main():
     """Main entry point"""
-    global referee
+    global referee, dispatcher
 
     # Referee ID from command line or default
-    referee_id = sys.argv[1] if len(sys.argv) > 1 else "REF01"
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    referee_id = args[0] if args else "REF01"
 
     # Initialize Referee
     referee = Referee(referee_id)
     referee.start_referee()
+    dispatcher = create_dispatcher(referee)
 
     # Determine port based on referee_id
     # REF01 -> 8001, REF02 -> 8002
     port = 8001 if referee_id == "REF01" else 8002
 
+    server_mode = ConfigLoader.get_server_mode(sys.argv[1:])
+
     print(f"\n=== Referee Starting ===")
     print(f"Referee ID: {referee_id}")
     print(f"Port: {port}")
-    print(f"Endpoint: http://localhost:{port}/mcp")
+    print(f"Endpoint: {referee.system_config.network.endpoint_for(referee_id, port)}")
+    print(f"Server mode: {server_mode}")
     print("========================\n")
 
-    app.run(host='0.0.0.0', port=port, debug=False)
+    channel_offset = ConfigLoader.get_channel_port_offset()
+    try:
+        mcp_server.serve(app, dispatcher, port, server_mode,
+                         unix_socket=referee.system_config.network.socket_path(referee_id),
+                         channel_port=port + channel_offset if channel_offset else None)
+    finally:
+        referee.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+"""
+Referee - Match Engine
+
+Runs many matches concurrently on one referee.
+Each match gets its own MatchState and bound logger; a bounded worker pool
+sized by max_concurrent_matches drives Referee.run_match for each assignment.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_for
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+
+@dataclass
+class MatchState:
+    """State of one in-flight match (see state_machines.md, Referee State Machine)"""
+    match_id: str
+    league_id: str
+    round_id: int
+    player_A_id: str
+    player_B_id: str
+    state: str = "WAITING_FOR_PLAYERS"
+    logger: Any = None
+    result: Optional[dict] = None
+    started_at: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+
+    def transition(self, new_state: str) -> None:
+        """
+        Move the match to a new state and log the transition.
+
+        Args:
+            new_state: Target state (e.g., "COLLECTING_CHOICES")
+        """
+        old_state = self.state
+        self.state = new_state
+        if self.logger is not None:
+            self.logger.log_event("MATCH_STATE_TRANSITION", {
+                "old_state": old_state,
+                "new_state": new_state
+            })
+
+
+class MatchEngine:
+    """
+    Concurrent match runner for a single referee.
+
+    Matches that share a player are never run at the same time. Only
+    conflict-free matches are handed to the worker pool; a match whose player
+    is busy (or queued for an earlier match) is deferred without taking a
+    worker, and started when the match holding its player finishes. Each
+    player's matches therefore run one at a time, in submission order.
+    """
+
+    def __init__(self, referee, max_concurrent_matches: int = 5):
+        """
+        Initialize MatchEngine.
+
+        Args:
+            referee: Referee instance whose run_match drives each match
+            max_concurrent_matches: Worker pool size
+        """
+        self.referee = referee
+        self.max_concurrent_matches = max(1, max_concurrent_matches)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_matches,
+            thread_name_prefix=f"referee-{referee.referee_id}-match"
+        )
+        self._busy_players = set()
+        # (players, assignment, report_to_league_manager, future) waiting for a busy player
+        self._deferred: List[tuple] = []
+        self._pending = set()
+        self._guard = threading.Lock()
+        self.closed = False
+
+    @staticmethod
+    def _players(assignment: Dict[str, Any]) -> frozenset:
+        """Players taking part in an assignment"""
+        return frozenset((assignment["player_A_id"], assignment["player_B_id"]))
+
+    def _start(self, players: frozenset, assignment: Dict[str, Any], report_to_league_manager: bool,
+               future: Future) -> None:
+        """Mark the players busy and hand the match to a worker (caller holds self._guard)"""
+        self._busy_players |= players
+        self._executor.submit(self._run_assignment, players, assignment, report_to_league_manager, future)
+
+    def _run_assignment(self, players: frozenset, assignment: Dict[str, Any], report_to_league_manager: bool,
+                        future: Future) -> None:
+        """Run one assignment, resolve its future, then start the deferred matches it unblocks"""
+        try:
+            try:
+                result = self.referee.run_match(
+                    match_id=assignment["match_id"],
+                    player_A_id=assignment["player_A_id"],
+                    player_B_id=assignment["player_B_id"],
+                    player_A_endpoint=assignment["player_A_endpoint"],
+                    player_B_endpoint=assignment["player_B_endpoint"],
+                    league_id=assignment["league_id"],
+                    round_id=assignment["round_id"],
+                    report_to_league_manager=report_to_league_manager
+                )
+            except Exception as e:
+                self.referee.logger.bind(match_id=assignment["match_id"]).log_event("MATCH_FAILED", {
+                    "error": str(e)
+                })
+                result = {"match_id": assignment["match_id"], "error": str(e)}
+            # Resolve before leaving _pending, so shutdown(wait=True) never returns ahead of the result
+            future.set_result(result)
+        finally:
+            with self._guard:
+                self._busy_players -= players
+                self._pending.discard(future)
+                self._start_deferred()
+
+    def _start_deferred(self) -> None:
+        """Start every deferred match whose players are free (caller holds self._guard)"""
+        blocked = set(self._busy_players)
+        still_deferred = []
+        for entry in self._deferred:
+            players = entry[0]
+            if players & blocked:
+                # Earlier deferred matches keep their players reserved, preserving per-player order
+                blocked |= players
+                still_deferred.append(entry)
+            else:
+                blocked |= players
+                self._start(*entry)
+        self._deferred = still_deferred
+
+    def submit(self, assignment: Dict[str, Any], report_to_league_manager: bool = True) -> Future:
+        """
+        Queue one match for execution.
+
+        Args:
+            assignment: Match details (match_id, league_id, round_id, player_A_id,
+                        player_B_id, player_A_endpoint, player_B_endpoint)
+            report_to_league_manager: Forwarded to Referee.run_match
+
+        Returns:
+            Future resolving to the match result (or {"match_id", "error"} on failure)
+
+        Raises:
+            RuntimeError: If the engine has been shut down
+        """
+        players = self._players(assignment)
+        future = Future()
+        future.set_running_or_notify_cancel()
+        with self._guard:
+            if self.closed:
+                raise RuntimeError("match engine shut down")
+            self._pending.add(future)
+            waiting = set().union(*(entry[0] for entry in self._deferred))
+            if players & (self._busy_players | waiting):
+                self._deferred.append((players, assignment, report_to_league_manager, future))
+            else:
+                self._start(players, assignment, report_to_league_manager, future)
+        return future
+
+    def run_matches(self, assignments: Iterable[Dict[str, Any]],
+                    report_to_league_manager: bool = True) -> List[dict]:
+        """
+        Run a batch of matches (e.g., a full round) and wait for all of them.
+
+        Args:
+            assignments: Match details, as for submit()
+            report_to_league_manager: Forwarded to Referee.run_match
+
+        Returns:
+            Match results in the same order as assignments
+        """
+        futures = [self.submit(assignment, report_to_league_manager) for assignment in assignments]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting matches.
+
+        Args:
+            wait: Block until running and deferred matches finish (False drops deferred ones)
+        """
+        with self._guard:
+            self.closed = True
+        if wait:
+            while True:
+                with self._guard:
+                    pending = list(self._pending)
+                if not pending:
+                    break
+                wait_for(pending)
+        else:
+            with self._guard:
+                for *_, future in self._deferred:
+                    self._pending.discard(future)
+                    future.set_exception(RuntimeError("match engine shut down"))
+                self._deferred = []
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,316 @@
+"""
+Async MCP Client
+
+asyncio twin of MCPClient for agents that keep many requests in flight.
+Shares envelope building and id checks with MCPClient (RpcEnvelopeMixin);
+requests go over its own AsyncConnectionPool.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from . import json_codec
+from .config_models import HttpPoolConfig
+from .http_framing import HttpMessage, build_http_message, read_http_message
+from .mcp_client import RpcEnvelopeMixin
+from .transports import UNIX_HTTP_PATH, unix_socket_path
+
+
+class _StreamConnection:
+    """Open asyncio stream pair plus bookkeeping for the pool"""
+
+    __slots__ = ("reader", "writer", "last_used", "reused")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+        self.reused = False
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncConnectionPool:
+    """
+    Per-origin pool of keep-alive asyncio connections.
+
+    At most pool_maxsize requests per origin are on the wire at once; further
+    requests wait for a free connection (the wait counts against their deadline).
+    """
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None):
+        """
+        Initialize AsyncConnectionPool.
+
+        Args:
+            config: Pool settings (defaults to HttpPoolConfig())
+        """
+        self.config = config if config is not None else HttpPoolConfig()
+        self._idle: Dict[str, deque] = {}
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+        self.requests = 0
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self.evictions = 0
+
+    def _limit(self, origin: str) -> asyncio.Semaphore:
+        """Get the per-origin concurrency limit"""
+        limit = self._limits.get(origin)
+        if limit is None:
+            limit = self._limits[origin] = asyncio.Semaphore(self.config.pool_maxsize)
+        return limit
+
+    async def _open(self, parts) -> _StreamConnection:
+        """Open a new connection to an endpoint (TCP, or a Unix socket for unix:// endpoints)"""
+        self.pool_misses += 1
+        if parts.scheme == "unix":
+            reader, writer = await asyncio.open_unix_connection(parts.netloc + parts.path)
+            return _StreamConnection(reader, writer)
+        reader, writer = await asyncio.open_connection(
+            parts.hostname, parts.port or (443 if parts.scheme == "https" else 80),
+            ssl=parts.scheme == "https"
+        )
+        return _StreamConnection(reader, writer)
+
+    def _take_idle(self, origin: str) -> Optional[_StreamConnection]:
+        """Pop a still-usable idle connection, evicting stale ones"""
+        idle = self._idle.get(origin)
+        now = time.monotonic()
+        while idle:
+            conn = idle.pop()
+            if conn.reader.at_eof() or now - conn.last_used >= self.config.idle_timeout_sec:
+                self.evictions += 1
+                conn.close()
+                continue
+            self.pool_hits += 1
+            conn.reused = True
+            return conn
+        return None
+
+    def _release(self, origin: str, conn: _StreamConnection, reusable: bool) -> None:
+        """Return a connection to the pool or close it"""
+        if reusable and self.config.keep_alive:
+            conn.last_used = time.monotonic()
+            self._idle.setdefault(origin, deque()).append(conn)
+        else:
+            conn.close()
+
+    async def request(self, endpoint: str, body: bytes, headers: Dict[str, str]) -> HttpMessage:
+        """
+        POST a body to an endpoint and read the response.
+
+        A request that fails on a reused connection before any response bytes
+        arrive (the peer closed an idle socket) is retried once on a new one.
+
+        Args:
+            endpoint: Target HTTP endpoint
+            body: Request body
+            headers: Extra request headers
+
+        Returns:
+            Parsed HTTP response
+        """
+        parts = urlsplit(endpoint)
+        if unix_socket_path(endpoint) is not None:
+            # The socket file identifies the agent; the HTTP path is fixed
+            origin, path, host = endpoint, UNIX_HTTP_PATH, "localhost"
+        else:
+            origin, path, host = f"{parts.scheme}://{parts.netloc}", parts.path or "/", parts.netloc
+        request_headers = {
+            "Host": host,
+            "Connection": "keep-alive" if self.config.keep_alive else "close",
+            **headers
+        }
+        raw = build_http_message(f"POST {path} HTTP/1.1", request_headers, body)
+
+        async with self._limit(origin):
+            self.requests += 1
+            while True:
+                conn = self._take_idle(origin) or await self._open(parts)
+                reusable = False
+                try:
+                    conn.writer.write(raw)
+                    await conn.writer.drain()
+                    response = await read_http_message(conn.reader)
+                    if response is None:
+                        raise ConnectionResetError("Connection closed by peer")
+                    reusable = response.keep_alive
+                    return response
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    if not conn.reused:
+                        raise
+                finally:
+                    self._release(origin, conn, reusable)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary with endpoints, requests, pool_hits, pool_misses, evictions
+        """
+        return {
+            "endpoints": sum(1 for idle in self._idle.values() if idle),
+            "requests": self.requests,
+            "pool_hits": self.pool_hits,
+            "pool_misses": self.pool_misses,
+            "evictions": self.evictions
+        }
+
+    async def close(self) -> None:
+        """Close all idle connections"""
+        for idle in self._idle.values():
+            while idle:
+                conn = idle.pop()
+                conn.close()
+                try:
+                    await conn.writer.wait_closed()
+                except (ConnectionError, OSError):
+                    pass
+
+
+class AsyncMCPClient(RpcEnvelopeMixin):
+    """
+    Async MCP Communication Client
+
+    Same contract as MCPClient.send_request / send_notification, awaited on an
+    event loop. Each call carries its own deadline; cancelling the awaiting task
+    aborts the call and discards its connection.
+    """
+
+    def __init__(self, pool_config: Optional[HttpPoolConfig] = None):
+        """
+        Initialize async MCP client.
+
+        Args:
+            pool_config: Connection pool settings (defaults to HttpPoolConfig())
+        """
+        super().__init__()
+        self.connection_pool = AsyncConnectionPool(pool_config)
+
+    async def __aenter__(self) -> "AsyncMCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _post(self, payload: Any, endpoint: str) -> HttpMessage:
+        """Serialize a JSON-RPC payload and POST it"""
+        body = json_codec.dumpb(payload)
+        return await self.connection_pool.request(endpoint, body, {"Content-Type": "application/json"})
+
+    async def send_request(self, method: str, params: Dict[str, Any], endpoint: str,
+                           timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send JSON-RPC 2.0 request to specified endpoint and await the response.
+
+        Args:
+            method: JSON-RPC method name (e.g., "register_player")
+            params: Message payload (already formatted with protocol fields)
+            endpoint: Target HTTP endpoint (e.g., "http://localhost:8000/mcp")
+            timeout: Optional deadline in seconds, including time spent waiting
+                     for a pooled connection (uses default if None)
+
+        Returns:
+            Response result object
+
+        Raises:
+            Exception: On network error, timeout, or JSON-RPC error
+        """
+        actual_timeout = timeout if timeout is not None else self.base_timeout
+        rpc_request = self.build_request(method, params)
+
+        try:
+            response = await asyncio.wait_for(self._post(rpc_request, endpoint), actual_timeout)
+        except asyncio.TimeoutError:
+            raise Exception(f"Request timeout after {actual_timeout} seconds")
+        except (OSError, asyncio.IncompleteReadError) as e:
+            raise Exception(f"Connection error: {str(e)}")
+        except ValueError as e:
+            raise Exception(f"HTTP error: {str(e)}")
+
+        # Parse JSON response (even if HTTP error, might contain JSON-RPC error)
+        try:
+            rpc_response = json_codec.loads(response.body)
+        except ValueError:
+            if response.status_code >= 400:
+                raise Exception(f"HTTP error: {response.status_code} for url: {endpoint}")
+            raise Exception("Invalid response: not JSON")
+
+        # Check HTTP status only if we couldn't parse JSON-RPC error
+        if response.status_code >= 400 and not (isinstance(rpc_response, dict) and "error" in rpc_response):
+            raise Exception(f"HTTP error: {response.status_code} for url: {endpoint}")
+
+        return self.unwrap_response(rpc_response, rpc_request["id"])
+
+    async def send_batch(self, calls: List[Tuple[str, Dict[str, Any]]], endpoint: str,
+                         timeout: Optional[float] = None) -> List[Any]:
+        """
+        Send several JSON-RPC 2.0 requests to one endpoint in a single POST.
+
+        Args:
+            calls: List of (method, params) pairs
+            endpoint: Target HTTP endpoint
+            timeout: Optional deadline in seconds for the whole batch (uses default if None)
+
+        Returns:
+            List aligned with calls: each entry is the call's result, or the
+            Exception describing why that call failed
+
+        Raises:
+            Exception: On network error, timeout, or if the whole batch was rejected
+        """
+        if not calls:
+            return []
+
+        actual_timeout = timeout if timeout is not None else self.base_timeout
+        batch = self.build_batch(calls)
+
+        try:
+            response = await asyncio.wait_for(self._post(batch, endpoint), actual_timeout)
+        except asyncio.TimeoutError:
+            raise Exception(f"Request timeout after {actual_timeout} seconds")
+        except (OSError, asyncio.IncompleteReadError) as e:
+            raise Exception(f"Connection error: {str(e)}")
+        except ValueError as e:
+            raise Exception(f"HTTP error: {str(e)}")
+
+        try:
+            rpc_response = json_codec.loads(response.body)
+        except ValueError:
+            raise Exception(f"HTTP error: {response.status_code} for url: {endpoint}")
+
+        return self.unwrap_batch(rpc_response, batch)
+
+    async def send_notification(self, method: str, params: Dict[str, Any], endpoint: str) -> None:
+        """
+        Send JSON-RPC 2.0 notification (no response expected, no id field).
+
+        Args:
+            method: JSON-RPC method name
+            params: Message payload
+            endpoint: Target endpoint
+        """
+        rpc_notification = self.build_notification(method, params)
+        try:
+            await asyncio.wait_for(self._post(rpc_notification, endpoint), 2)
+        except Exception:
+            # Notifications are fire-and-forget, ignore errors
+            pass
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get connection pool counters (see AsyncConnectionPool.stats).
+
+        Returns:
+            Pool statistics dictionary
+        """
+        return self.connection_pool.stats()
+
+    async def aclose(self) -> None:
+        """Close all pooled connections"""
+        await self.connection_pool.close()
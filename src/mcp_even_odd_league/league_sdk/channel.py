@@ -0,0 +1,575 @@
+"""
+MCP Channel
+
+Optional persistent, bidirectional JSON-RPC channel over TCP.
+
+Each frame is a 4-byte big-endian length followed by one UTF-8 JSON-RPC
+message. Either side may send requests at any time and responses are matched
+to requests by id, so any number of calls share one connection. A referee
+running hundreds of concurrent matches keeps one connection per player
+instead of opening a short HTTP request per message, and players can push
+requests back over the same connection.
+"""
+
+import socket
+import struct
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from . import json_codec, jsonrpc
+from .jsonrpc import MethodDispatcher
+
+
+CHANNEL_SCHEME = "channel"
+
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+def encode_frame(message: Any) -> bytes:
+    """
+    Serialize one JSON-RPC message as a length-prefixed frame.
+
+    Args:
+        message: Request, response, notification or batch array
+
+    Returns:
+        Frame bytes
+    """
+    body = json_codec.dumpb(message)
+    if len(body) > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {len(body)} bytes exceeds {MAX_FRAME_SIZE}")
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Read exactly size bytes, or None if the peer closed the connection first"""
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 65536))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_frame(sock: socket.socket) -> Optional[bytes]:
+    """
+    Read one frame body.
+
+    Args:
+        sock: Connected socket
+
+    Returns:
+        Frame body, or None when the connection closed cleanly
+
+    Raises:
+        ValueError: If the frame is larger than MAX_FRAME_SIZE
+        ConnectionError: If the connection closed mid-frame
+    """
+    header = _recv_exact(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {size} bytes exceeds {MAX_FRAME_SIZE}")
+    body = _recv_exact(sock, size)
+    if body is None:
+        raise ConnectionError("Connection closed mid-frame")
+    return body
+
+
+class FramedChannel:
+    """
+    One side of a channel connection.
+
+    A reader thread resolves responses to pending calls by id and hands
+    incoming requests to the local dispatcher on a worker pool, so a slow
+    handler never blocks other traffic on the connection.
+    """
+
+    def __init__(self, sock: socket.socket, dispatcher: Optional[MethodDispatcher] = None,
+                 max_workers: int = 8):
+        """
+        Initialize FramedChannel and start reading.
+
+        Args:
+            sock: Connected socket
+            dispatcher: Method table for requests sent by the peer (None rejects them)
+            max_workers: Concurrent incoming requests handled at once
+        """
+        self.sock = sock
+        self.dispatcher = dispatcher if dispatcher is not None else MethodDispatcher()
+        self.peer = sock.getpeername()
+        self._write_lock = threading.Lock()
+        self._pending: Dict[Any, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._workers = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="channel")
+        self._closed = threading.Event()
+        self.requests_sent = 0
+
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    @classmethod
+    def connect(cls, host: str, port: int, dispatcher: Optional[MethodDispatcher] = None,
+                timeout: float = 5.0) -> "FramedChannel":
+        """
+        Open a channel to a ChannelServer.
+
+        Args:
+            host: Server host
+            port: Server channel port
+            dispatcher: Method table for requests pushed by the server
+            timeout: Connect timeout in seconds
+
+        Returns:
+            Connected FramedChannel
+
+        Raises:
+            OSError: If the connection cannot be opened
+        """
+        sock = socket.create_connection((host, port), timeout=timeout)
+        sock.settimeout(None)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return cls(sock, dispatcher)
+
+    @property
+    def closed(self) -> bool:
+        """True once the connection is gone"""
+        return self._closed.is_set()
+
+    def send(self, message: Any) -> None:
+        """
+        Write one message frame.
+
+        Args:
+            message: JSON-RPC message
+
+        Raises:
+            ConnectionError: If the channel is closed
+        """
+        if self.closed:
+            raise ConnectionError("Channel closed")
+        frame = encode_frame(message)
+        try:
+            with self._write_lock:
+                self.sock.sendall(frame)
+        except OSError as e:
+            self._shutdown(e)
+            raise ConnectionError(f"Channel closed: {e}")
+
+    def start_request(self, message: Dict[str, Any]) -> Future:
+        """
+        Send a request envelope without waiting for its response.
+
+        The caller must forget() the id once done with the returned Future.
+
+        Args:
+            message: Request envelope (must carry an id unique on this channel)
+
+        Returns:
+            Future resolving to the response envelope (or failing with
+            ConnectionError if the channel closes first)
+
+        Raises:
+            ConnectionError: If the channel is closed
+        """
+        request_id = message["id"]
+        future: Future = Future()
+        with self._pending_lock:
+            self._pending[request_id] = future
+            self.requests_sent += 1
+        try:
+            self.send(message)
+        except ConnectionError:
+            self.forget(request_id)
+            raise
+        return future
+
+    def forget(self, request_id: Any) -> None:
+        """Stop waiting for a response (a late one is dropped)"""
+        with self._pending_lock:
+            self._pending.pop(request_id, None)
+
+    def request(self, message: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Send a request envelope and wait for the response with the same id.
+
+        Args:
+            message: Request envelope (must carry an id unique on this channel)
+            timeout: Timeout in seconds
+
+        Returns:
+            Response envelope
+
+        Raises:
+            TimeoutError: If no response arrives in time
+            ConnectionError: If the channel closes before the response arrives
+        """
+        future = self.start_request(message)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            raise TimeoutError(f"No response to {message['id']} within {timeout} seconds")
+        finally:
+            self.forget(message["id"])
+
+    def call(self, method: str, params: Dict[str, Any], timeout: float = 10.0) -> Any:
+        """
+        Call a method on the peer and return its result.
+
+        Args:
+            method: JSON-RPC method name
+            params: Message payload
+            timeout: Timeout in seconds
+
+        Returns:
+            Response result
+
+        Raises:
+            Exception: On JSON-RPC error
+        """
+        response = self.request({"jsonrpc": "2.0", "method": method, "params": params,
+                                 "id": str(uuid.uuid4())}, timeout)
+        if "error" in response:
+            error = response["error"]
+            raise Exception(f"JSON-RPC error {error.get('code', -1)}: {error.get('message', 'Unknown error')}")
+        return response.get("result")
+
+    def _read_loop(self) -> None:
+        """Route incoming frames until the connection closes"""
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                body = read_frame(self.sock)
+                if body is None:
+                    break
+                try:
+                    message = json_codec.loads(body)
+                except ValueError:
+                    self.send(jsonrpc.error_response(jsonrpc.PARSE_ERROR, "Parse error"))
+                    continue
+
+                if isinstance(message, dict) and "method" not in message and "id" in message:
+                    with self._pending_lock:
+                        future = self._pending.get(message["id"])
+                    if future is not None and not future.done():
+                        future.set_result(message)
+                else:
+                    self._workers.submit(self._serve, message)
+        except (OSError, ValueError) as e:
+            error = e
+        finally:
+            self._shutdown(error)
+
+    def _serve(self, message: Any) -> None:
+        """Dispatch a request (or batch) from the peer and send any response"""
+        response, _ = self.dispatcher.handle(message)
+        if response is not None:
+            try:
+                self.send(response)
+            except ConnectionError:
+                pass
+
+    def _shutdown(self, error: Optional[BaseException] = None) -> None:
+        """Mark the channel closed and fail every pending call"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        reason = f"Channel closed: {error}" if error else "Channel closed by peer"
+        for future in pending:
+            if not future.done():
+                future.set_exception(ConnectionError(reason))
+        self._workers.shutdown(wait=False)
+
+    def close(self) -> None:
+        """Close the connection"""
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._shutdown()
+
+
+class ChannelServer:
+    """
+    Accepts channel connections for one agent.
+
+    Every connection gets its own FramedChannel serving the agent's
+    dispatcher; the live channels are kept in channels so the agent can push
+    requests to connected peers. The list is replaced, never changed in
+    place, so it can be iterated without the lock.
+    """
+
+    def __init__(self, dispatcher: MethodDispatcher, host: str = "0.0.0.0", port: int = 0):
+        """
+        Initialize ChannelServer.
+
+        Args:
+            dispatcher: Agent's method table
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.dispatcher = dispatcher
+        self.host = host
+        self.port = port
+        self.channels: List[FramedChannel] = []
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> None:
+        """Bind, listen and accept connections on a background thread"""
+        self._sock = socket.create_server((self.host, self.port))
+        self.port = self._sock.getsockname()[1]
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self) -> None:
+        """Wrap every accepted connection in a FramedChannel"""
+        while True:
+            try:
+                sock, _ = self._sock.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                if self._closed:
+                    sock.close()
+                    return
+                live = [channel for channel in self.channels if not channel.closed]
+                self.channels = live + [FramedChannel(sock, self.dispatcher)]
+
+    def close(self) -> None:
+        """Stop accepting and close every open channel"""
+        with self._lock:
+            self._closed = True
+            channels, self.channels = self.channels, []
+        if self._sock is not None:
+            self._sock.close()
+        for channel in channels:
+            channel.close()
+
+
+class ChannelTransport:
+    """
+    MCPClient transport sending JSON-RPC over persistent channels.
+
+    Endpoints are either channel://host:port, or HTTP endpoints mapped to
+    host:(port + port_offset) when port_offset is set, so agents can keep
+    registering their HTTP contact endpoints. One channel is kept per peer
+    and reopened after it drops. Peers that do not accept a channel
+    connection are served by the fallback transport (e.g. HttpTransport) and
+    retried after retry_interval_sec.
+    """
+
+    def __init__(self, port_offset: int = 0, fallback=None, dispatcher: Optional[MethodDispatcher] = None,
+                 connect_timeout: float = 5.0, retry_interval_sec: float = 30.0):
+        """
+        Initialize ChannelTransport.
+
+        Args:
+            port_offset: Channel port = HTTP port + port_offset (0: only channel:// endpoints)
+            fallback: Transport for endpoints without a reachable channel
+            dispatcher: Method table for requests peers push over the channels
+            connect_timeout: Connect timeout in seconds
+            retry_interval_sec: Delay before retrying a peer whose channel was unreachable
+        """
+        self.port_offset = port_offset
+        self.fallback = fallback
+        self.dispatcher = dispatcher
+        self.connect_timeout = connect_timeout
+        self.retry_interval_sec = retry_interval_sec
+        self._channels: Dict[Tuple[str, int], FramedChannel] = {}
+        self._unreachable: Dict[Tuple[str, int], float] = {}
+        self._connect_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        # Requests sent over channels that were since replaced or closed
+        self._retired_requests = 0
+
+    def _address(self, endpoint: str) -> Optional[Tuple[str, int]]:
+        """Channel (host, port) for an endpoint, or None if it has no channel"""
+        parts = urlsplit(endpoint)
+        if parts.scheme == CHANNEL_SCHEME:
+            return parts.hostname, parts.port
+        if self.port_offset and parts.scheme == "http" and parts.port:
+            return parts.hostname, parts.port + self.port_offset
+        return None
+
+    def _channel(self, endpoint: str) -> Optional[FramedChannel]:
+        """
+        Get the open channel for an endpoint, connecting if needed.
+
+        Returns:
+            FramedChannel, or None if the endpoint should use the fallback
+
+        Raises:
+            Exception: Connection error when there is no fallback
+        """
+        address = self._address(endpoint)
+        if address is None:
+            if self.fallback is None:
+                raise Exception(f"Connection error: no channel for {endpoint}")
+            return None
+
+        with self._lock:
+            channel = self._channels.get(address)
+            if channel is not None and not channel.closed:
+                return channel
+            if self._backing_off(address):
+                return None
+            connect_lock = self._connect_locks.setdefault(address, threading.Lock())
+
+        # Connect holding only this peer's lock: a slow or unreachable peer
+        # delays callers of that peer, not requests to the others.
+        with connect_lock:
+            with self._lock:
+                channel = self._channels.get(address)
+                if channel is not None and not channel.closed:
+                    return channel  # opened by the caller we waited for
+                if self._backing_off(address):
+                    return None
+
+            try:
+                channel = FramedChannel.connect(*address, dispatcher=self.dispatcher, timeout=self.connect_timeout)
+            except OSError as e:
+                if self.fallback is None:
+                    raise Exception(f"Connection error: {str(e)}")
+                with self._lock:
+                    self._unreachable[address] = time.monotonic() + self.retry_interval_sec
+                return None
+
+            with self._lock:
+                self._unreachable.pop(address, None)
+                previous = self._channels.get(address)
+                if previous is not None:
+                    self._retired_requests += previous.requests_sent
+                self._channels[address] = channel
+                self.connections_opened += 1
+            return channel
+
+    def _backing_off(self, address: Tuple[str, int]) -> bool:
+        """True while an unreachable peer should be served by the fallback"""
+        return self.fallback is not None and time.monotonic() < self._unreachable.get(address, 0)
+
+    def post(self, payload: Any, endpoint: str, timeout: float) -> Any:
+        """
+        Send a JSON-RPC payload over the endpoint's channel.
+
+        Batch elements are multiplexed as separate messages and their
+        responses collected into one array, as the HTTP server would return.
+
+        Args:
+            payload: Request envelope or batch array
+            endpoint: channel://host:port, or an HTTP endpoint when port_offset is set
+            timeout: Timeout in seconds (for the whole batch)
+
+        Returns:
+            Response body
+
+        Raises:
+            Exception: On connection error, timeout, or an empty response
+        """
+        channel = self._channel(endpoint)
+        if channel is None:
+            return self.fallback.post(payload, endpoint, timeout)
+
+        batch = payload if isinstance(payload, list) else [payload]
+        deadline = time.monotonic() + timeout
+        responses = []
+        started = []
+        try:
+            for item in batch:
+                if not isinstance(item, dict):
+                    responses.append(jsonrpc.error_response(jsonrpc.INVALID_REQUEST, "Invalid Request"))
+                elif "id" not in item:
+                    self._notify(channel, item)
+                else:
+                    started.append((item["id"], channel.start_request(item)))
+            for _, future in started:
+                responses.append(future.result(max(deadline - time.monotonic(), 0)))
+        except FutureTimeoutError:
+            raise Exception(f"Request timeout after {timeout} seconds")
+        except ConnectionError as e:
+            raise Exception(f"Connection error: {str(e)}")
+        finally:
+            for request_id, _ in started:
+                channel.forget(request_id)
+
+        if not responses:
+            raise Exception("Invalid response: not JSON")
+        return responses if isinstance(payload, list) else responses[0]
+
+    @staticmethod
+    def _notify(channel: FramedChannel, message: Dict[str, Any]) -> None:
+        """Send a notification, ignoring a closed channel"""
+        try:
+            channel.send(message)
+        except ConnectionError:
+            pass
+
+    def notify(self, payload: Dict[str, Any], endpoint: str) -> None:
+        """
+        Send a notification over the endpoint's channel, ignoring any error.
+
+        Args:
+            payload: Notification envelope
+            endpoint: Target endpoint
+        """
+        try:
+            channel = self._channel(endpoint)
+        except Exception:
+            return
+        if channel is None:
+            self.fallback.notify(payload, endpoint)
+            return
+        self._notify(channel, payload)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get channel counters.
+
+        Returns:
+            Dictionary containing:
+            - endpoints: Open channels
+            - requests: Requests sent over channels
+            - pool_hits: Requests that reused an open channel
+            - pool_misses: Channel connections opened
+            - fallback: The fallback transport's stats (only if there is one)
+        """
+        with self._lock:
+            requests_sent = self._retired_requests + sum(channel.requests_sent for channel in self._channels.values())
+            stats = {
+                "endpoints": sum(1 for channel in self._channels.values() if not channel.closed),
+                "requests": requests_sent,
+                "pool_hits": max(requests_sent - self.connections_opened, 0),
+                "pool_misses": self.connections_opened
+            }
+        if self.fallback is not None:
+            stats["fallback"] = self.fallback.stats()
+        return stats
+
+    def close(self) -> None:
+        """Close every channel and the fallback transport"""
+        with self._lock:
+            for channel in self._channels.values():
+                self._retired_requests += channel.requests_sent
+                channel.close()
+            self._channels.clear()
+        if self.fallback is not None:
+            self.fallback.close()
@@ -7,9 +7,9 @@ Based on class_map.md - ConfigLoader class with lazy loading and caching.
 
 import os
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from .config_models import SystemConfig, LeagueConfig, RefereeConfig, PlayerConfig
-from .config_models import NetworkConfig, TimeoutsConfig, ScoringConfig
+from .config_models import NetworkConfig, TimeoutsConfig, ScoringConfig, HttpPoolConfig, LoggingConfig
 
 # Load environment variables from .env file if available
 try:
@@ -22,6 +22,16 @@ except ImportError:
     pass  # python-dotenv not installed, use environment variables directly
 
 
+def _parse_pairs(value: str) -> Dict[str, str]:
+    """Parse "key=value,key=value" environment settings"""
+    pairs = {}
+    for item in value.split(","):
+        if item.strip():
+            key, _, val = item.partition("=")
+            pairs[key.strip()] = val.strip()
+    return pairs
+
+
 class ConfigLoader:
     """Configuration file loader with lazy loading and caching"""
 
@@ -60,7 +70,8 @@ class ConfigLoader:
                     int(os.getenv('PLAYER_P02_PORT', '8102')),
                     int(os.getenv('PLAYER_P03_PORT', '8103')),
                     int(os.getenv('PLAYER_P04_PORT', '8104'))
-                ]
+                ],
+                socket_dir=os.getenv('AGENT_SOCKET_DIR') or None
             )
 
             # Load timeout configuration from environment
@@ -70,11 +81,39 @@ class ConfigLoader:
                 generic_response_timeout_sec=int(os.getenv('TIMEOUT_DEFAULT', '10'))
             )
 
+            # Load HTTP connection pool configuration from environment
+            http_pool = HttpPoolConfig(
+                pool_maxsize=int(os.getenv('HTTP_POOL_MAXSIZE', '10')),
+                idle_timeout_sec=int(os.getenv('HTTP_POOL_IDLE_TIMEOUT', '60')),
+                keep_alive=os.getenv('HTTP_KEEP_ALIVE', 'true').lower() in ('1', 'true', 'yes')
+            )
+
+            # Load log writer configuration from environment
+            log_config = LoggingConfig(
+                buffered=os.getenv('LOG_BUFFERED', 'false').lower() in ('1', 'true', 'yes'),
+                flush_interval_sec=float(os.getenv('LOG_FLUSH_INTERVAL', '1.0')),
+                flush_max_entries=int(os.getenv('LOG_FLUSH_MAX_ENTRIES', '256')),
+                queue_size=int(os.getenv('LOG_QUEUE_SIZE', '10000')),
+                overflow_policy=os.getenv('LOG_OVERFLOW_POLICY', 'drop').strip().lower(),
+                level=os.getenv('LOG_LEVEL', 'DEBUG').strip(),
+                component_levels=_parse_pairs(os.getenv('LOG_COMPONENT_LEVELS', '')),
+                sample_rates={
+                    event_type: float(rate)
+                    for event_type, rate in _parse_pairs(os.getenv('LOG_SAMPLE_RATES', '')).items()
+                },
+                rotate_max_bytes=int(os.getenv('LOG_ROTATE_MAX_BYTES', '0')),
+                rotate_interval_sec=float(os.getenv('LOG_ROTATE_INTERVAL', '0')),
+                rotate_on_round=os.getenv('LOG_ROTATE_ON_ROUND', 'false').lower() in ('1', 'true', 'yes'),
+                compress_rotated=os.getenv('LOG_COMPRESS_ROTATED', 'true').lower() in ('1', 'true', 'yes')
+            )
+
             # Create system config
             self._system = SystemConfig(
                 protocol_version=os.getenv('PROTOCOL_VERSION', 'league.v2'),
                 network=network,
-                timeouts=timeouts
+                timeouts=timeouts,
+                http_pool=http_pool,
+                logging=log_config
             )
         return self._system
 
@@ -188,3 +227,151 @@ class ConfigLoader:
             Maximum number of retries
         """
         return int(os.getenv('MAX_RETRIES', '1'))
+
+    @staticmethod
+    def get_max_concurrent_matches() -> int:
+        """
+        Get the number of matches a referee may run at once.
+
+        Returns:
+            Maximum concurrent matches per referee
+        """
+        return int(os.getenv('MAX_CONCURRENT_MATCHES', '5'))
+
+    @staticmethod
+    def get_server_mode(argv: Optional[List[str]] = None) -> str:
+        """
+        Get how agents serve their /mcp endpoint.
+
+        The --async command-line flag wins over the AGENT_SERVER_MODE
+        environment variable.
+
+        Args:
+            argv: Command-line arguments to check for --async (defaults to none)
+
+        Returns:
+            "flask" (development server) or "async" (asyncio server)
+        """
+        if argv and "--async" in argv:
+            return "async"
+        return os.getenv('AGENT_SERVER_MODE', 'flask').strip().lower()
+
+    @staticmethod
+    def get_server_workers() -> int:
+        """
+        Get how many threads the async server gives blocking (non-coroutine) handlers.
+
+        Returns:
+            Handler threads (bounds concurrent plain handler calls)
+        """
+        return int(os.getenv('AGENT_SERVER_WORKERS', '256'))
+
+    @staticmethod
+    def get_max_body_bytes() -> int:
+        """
+        Get the largest HTTP request body an agent server accepts.
+
+        Returns:
+            Body size limit in bytes (larger requests are answered 413)
+        """
+        return int(os.getenv('AGENT_MAX_BODY_BYTES', str(10 * 1024 * 1024)))
+
+    @staticmethod
+    def get_channel_port_offset() -> int:
+        """
+        Get the offset from an agent's HTTP port to its framed channel port.
+
+        Returns:
+            Port offset (0 means persistent channels are disabled)
+        """
+        return int(os.getenv('AGENT_CHANNEL_PORT_OFFSET', '0'))
+
+    @staticmethod
+    def get_write_behind_sec() -> float:
+        """
+        Get how long repositories coalesce saves before writing them.
+
+        Returns:
+            Delay in seconds (0 means every save is written immediately)
+        """
+        return float(os.getenv('DATA_WRITE_BEHIND_SEC', '0'))
+
+    @staticmethod
+    def get_storage_backend() -> str:
+        """
+        Get where repositories persist league data.
+
+        Returns:
+            "json" (one JSON document per file under SHARED/data) or "sqlite" (DB_PATH)
+        """
+        return os.getenv('STORAGE_BACKEND', 'json').strip().lower()
+
+    @staticmethod
+    def get_db_path() -> Path:
+        """
+        Get the SQLite database used by the sqlite storage backend.
+
+        Returns:
+            Database file path
+        """
+        return Path(os.getenv('DB_PATH', 'SHARED/data/league.db'))
+
+    @staticmethod
+    def get_db_batch_size() -> int:
+        """
+        Get how many SQLite writes are grouped into one transaction.
+
+        Returns:
+            Writes per commit (1 commits every write)
+        """
+        return int(os.getenv('DB_BATCH_SIZE', '100'))
+
+    @staticmethod
+    def get_db_batch_ms() -> float:
+        """
+        Get the longest a SQLite write transaction stays open before it is committed.
+
+        Returns:
+            Milliseconds (bounds how long other processes wait and what a crash can lose)
+        """
+        return float(os.getenv('DB_BATCH_MS', '50'))
+
+    @staticmethod
+    def get_db_busy_timeout_ms() -> float:
+        """
+        Get how long a SQLite write waits for another process's transaction.
+
+        Returns:
+            Milliseconds before "database is locked" is raised
+        """
+        return float(os.getenv('DB_BUSY_TIMEOUT_MS', '5000'))
+
+    @staticmethod
+    def get_event_log_enabled() -> bool:
+        """
+        Get whether the League Manager records match results in an event log.
+
+        Returns:
+            True to persist standings as MATCH_RESULT events plus snapshots
+        """
+        return os.getenv('EVENT_LOG', 'false').lower() in ('1', 'true', 'yes')
+
+    @staticmethod
+    def get_snapshot_every() -> int:
+        """
+        Get how many events the League Manager records between standings snapshots.
+
+        Returns:
+            Events per snapshot (bounds the tail replayed on restart)
+        """
+        return int(os.getenv('EVENT_SNAPSHOT_EVERY', '100'))
+
+    @staticmethod
+    def get_standings_store() -> str:
+        """
+        Get how the League Manager stores per-player standings.
+
+        Returns:
+            "dict" (one dict per player) or "columnar" (parallel integer arrays)
+        """
+        return os.getenv('STANDINGS_STORE', 'dict').strip().lower()
@@ -5,17 +5,24 @@ Dataclass definitions for system configuration.
 Based on class_map.md - Chapter 10 class definitions.
 """
 
+import os
 from dataclasses import dataclass
-from typing import List, Optional
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional
+
+
+# JsonLogger severities, lowest first
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
 
 
 @dataclass
 class NetworkConfig:
-    """Network settings (base_host, ports)"""
+    """Network settings (base_host, ports, optional Unix socket directory)"""
     base_host: str = "localhost"
     league_manager_port: int = 8000
     referee_ports: List[int] = None
     player_ports: List[int] = None
+    socket_dir: Optional[str] = None
 
     def __post_init__(self):
         if self.referee_ports is None:
@@ -23,6 +30,19 @@ class NetworkConfig:
         if self.player_ports is None:
             self.player_ports = [8101, 8102, 8103, 8104]
 
+    def socket_path(self, agent_id: str) -> Optional[str]:
+        """Unix socket file an agent listens on, or None when agents use TCP"""
+        if not self.socket_dir:
+            return None
+        return os.path.join(self.socket_dir, f"{agent_id}.sock")
+
+    def endpoint_for(self, agent_id: str, port: int) -> str:
+        """Endpoint an agent is reached at: unix://{socket_dir}/{agent_id}.sock or http://{base_host}:{port}/mcp"""
+        socket_path = self.socket_path(agent_id)
+        if socket_path is not None:
+            return f"unix://{socket_path}"
+        return f"http://{self.base_host}:{port}/mcp"
+
 
 @dataclass
 class SecurityConfig:
@@ -42,6 +62,67 @@ class TimeoutsConfig:
     generic_response_timeout_sec: int = 10
 
 
+@dataclass
+class HttpPoolConfig:
+    """HTTP connection pool settings (pool size, idle eviction, keep-alive)"""
+    pool_maxsize: int = 10
+    idle_timeout_sec: int = 60
+    keep_alive: bool = True
+
+
+@dataclass
+class LoggingConfig:
+    """JsonLogger filtering (levels, sampling) and write mode (synchronous or buffered)"""
+    buffered: bool = False
+    flush_interval_sec: float = 1.0
+    flush_max_entries: int = 256
+    queue_size: int = 10000
+    overflow_policy: str = "drop"
+    level: str = "DEBUG"
+    component_levels: Dict[str, str] = None
+    sample_rates: Dict[str, float] = None
+    rotate_max_bytes: int = 0
+    rotate_interval_sec: float = 0.0
+    rotate_on_round: bool = False
+    compress_rotated: bool = True
+
+    def __post_init__(self):
+        if self.overflow_policy not in ("drop", "block"):
+            raise ValueError(f"Unknown log overflow policy: {self.overflow_policy} (expected drop or block)")
+        if not self.flush_interval_sec > 0:
+            raise ValueError(f"Log flush interval must be positive, got {self.flush_interval_sec}")
+        if self.component_levels is None:
+            self.component_levels = {}
+        if self.sample_rates is None:
+            self.sample_rates = {}
+        self.level = self.level.upper()
+        self.component_levels = {name: level.upper() for name, level in self.component_levels.items()}
+        for level in [self.level, *self.component_levels.values()]:
+            if level not in LOG_LEVELS:
+                raise ValueError(f"Unknown log level: {level} (expected one of {', '.join(LOG_LEVELS)})")
+        for pattern, rate in self.sample_rates.items():
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f"Sample rate for {pattern} must be between 0 and 1, got {rate}")
+
+    @property
+    def rotates(self) -> bool:
+        """Whether any automatic rotation trigger is configured"""
+        return bool(self.rotate_max_bytes or self.rotate_interval_sec or self.rotate_on_round)
+
+    def level_for(self, component: str) -> str:
+        """Minimum level for a component: exact name, then its kind ("player" for "player:P01"), then the default"""
+        if component in self.component_levels:
+            return self.component_levels[component]
+        return self.component_levels.get(component.split(":", 1)[0], self.level)
+
+    def sample_rate_for(self, event_type: str) -> float:
+        """Fraction of an event type to keep: exact name, then the longest matching glob (e.g. "TIMEOUT_*"), else 1"""
+        if event_type in self.sample_rates:
+            return self.sample_rates[event_type]
+        matches = [pattern for pattern in self.sample_rates if fnmatchcase(event_type, pattern)]
+        return self.sample_rates[max(matches, key=len)] if matches else 1.0
+
+
 @dataclass
 class SystemConfig:
     """Top-level configuration aggregating all settings"""
@@ -49,6 +130,8 @@ class SystemConfig:
     network: NetworkConfig = None
     security: SecurityConfig = None
     timeouts: TimeoutsConfig = None
+    http_pool: HttpPoolConfig = None
+    logging: LoggingConfig = None
 
     def __post_init__(self):
         if self.network is None:
@@ -57,6 +140,10 @@ class SystemConfig:
             self.security = SecurityConfig()
         if self.timeouts is None:
             self.timeouts = TimeoutsConfig()
+        if self.http_pool is None:
+            self.http_pool = HttpPoolConfig()
+        if self.logging is None:
+            self.logging = LoggingConfig()
 
 
 @dataclass
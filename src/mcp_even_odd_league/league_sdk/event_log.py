@@ -0,0 +1,130 @@
+"""
+Event Log
+
+Append-only JSONL event log with snapshots, for state that is a fold over
+events (the League Manager's standings are a fold over MATCH_RESULT events).
+
+Each append writes one line {"seq": N, ...event} and fsyncs it, so a
+recorded event survives a crash at the cost of one small write. A snapshot
+({base}.snapshot.json, written atomically) stores the folded state together
+with the seq and byte offset of the last event it covers; recover() loads the
+snapshot and reads only the events after that offset, so restart time is
+bounded by the snapshot interval rather than the league length.
+
+A line cut short by a crash mid-append is dropped (and truncated away) on
+recovery.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import json_codec
+from .repositories import atomic_write_json
+
+
+class EventLog:
+    """Append-only event log plus its latest snapshot"""
+
+    def __init__(self, path: Path, fsync: bool = True):
+        """
+        Initialize EventLog (nothing is read until recover() or append()).
+
+        Args:
+            path: Log file, e.g. SHARED/data/leagues/<league_id>/events.jsonl
+            fsync: Sync every append to disk (False leaves it to the OS)
+        """
+        self.path = Path(path)
+        self.snapshot_path = self.path.with_name(f"{self.path.stem}.snapshot.json")
+        self.fsync = fsync
+        self.seq = 0
+        self.since_snapshot = 0
+        self._offset = 0
+        self._recovered = False
+        self._file = None
+        self._lock = threading.Lock()
+
+    def recover(self) -> Tuple[Optional[Any], List[Dict[str, Any]]]:
+        """
+        Load the latest snapshot and the events recorded after it.
+
+        Returns:
+            (snapshot state or None, events after the snapshot in order)
+        """
+        with self._lock:
+            state, snapshot_seq, offset = None, 0, 0
+            if self.snapshot_path.exists():
+                snapshot = json_codec.loads(self.snapshot_path.read_bytes())
+                state, snapshot_seq, offset = snapshot["state"], snapshot["seq"], snapshot["offset"]
+
+            events = []
+            if self.path.exists():
+                with open(self.path, "rb") as f:
+                    if offset > os.fstat(f.fileno()).st_size:
+                        offset = 0  # log replaced since the snapshot: replay it all, skipping covered seqs
+                    f.seek(offset)
+                    for line in f:
+                        try:
+                            event = json_codec.loads(line) if line.endswith(b"\n") else None
+                        except ValueError:
+                            event = None
+                        if event is None:
+                            break  # torn final append
+                        offset += len(line)
+                        if event["seq"] > snapshot_seq:
+                            events.append(event)
+                if offset < self.path.stat().st_size:
+                    os.truncate(self.path, offset)
+            else:
+                offset = 0
+
+            self.seq = events[-1]["seq"] if events else snapshot_seq
+            self.since_snapshot = len(events)
+            self._offset = offset
+            self._recovered = True
+            return state, events
+
+    def append(self, event: Dict[str, Any]) -> int:
+        """
+        Durably record one event.
+
+        Args:
+            event: JSON-serializable event (a "seq" field is added)
+
+        Returns:
+            The event's sequence number
+        """
+        if not self._recovered:
+            self.recover()
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "ab")
+            line = json_codec.dumpb({"seq": self.seq + 1, **event}) + b"\n"
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.seq += 1
+            self.since_snapshot += 1
+            self._offset += len(line)
+            return self.seq
+
+    def snapshot(self, state: Any) -> None:
+        """
+        Store the state folded from every event appended so far.
+
+        Args:
+            state: JSON-serializable state
+        """
+        with self._lock:
+            atomic_write_json(self.snapshot_path, {"seq": self.seq, "offset": self._offset, "state": state})
+            self.since_snapshot = 0
+
+    def close(self) -> None:
+        """Close the log file"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
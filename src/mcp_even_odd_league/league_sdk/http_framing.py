@@ -0,0 +1,179 @@
+"""
+HTTP Framing
+
+Minimal HTTP/1.1 message framing over asyncio streams.
+Shared by the asyncio MCP client and server so neither needs a third-party
+HTTP stack. Supports Content-Length, chunked and read-until-close bodies,
+optionally capped at max_body_bytes (BodyTooLarge, answered 413 by servers).
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+MAX_HEADER_BYTES = 64 * 1024
+
+# Default request body cap for servers (see ConfigLoader.get_max_body_bytes)
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+class BodyTooLarge(ValueError):
+    """Message body exceeds the reader's max_body_bytes"""
+
+
+@dataclass
+class HttpMessage:
+    """Parsed HTTP request or response"""
+    start_line: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    @property
+    def version(self) -> str:
+        """HTTP version of the message (e.g., "HTTP/1.1")"""
+        parts = self.start_line.split(" ", 2)
+        return parts[0] if parts[0].startswith("HTTP/") else parts[-1]
+
+    @property
+    def status_code(self) -> int:
+        """Status code of a response message"""
+        return int(self.start_line.split(" ", 2)[1])
+
+    @property
+    def method(self) -> str:
+        """Method of a request message"""
+        return self.start_line.split(" ", 1)[0]
+
+    @property
+    def path(self) -> str:
+        """Target path of a request message"""
+        return self.start_line.split(" ", 2)[1]
+
+    @property
+    def keep_alive(self) -> bool:
+        """Whether the connection may be reused after this message"""
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+
+async def read_http_message(reader: asyncio.StreamReader, is_response: bool = True,
+                            max_body_bytes: Optional[int] = None) -> Optional[HttpMessage]:
+    """
+    Read one HTTP message from a stream.
+
+    Args:
+        reader: Stream to read from
+        is_response: True for responses (body may run until EOF), False for requests
+        max_body_bytes: Largest body accepted (None: unbounded)
+
+    Returns:
+        Parsed HttpMessage, or None if the peer closed the stream before a new message
+
+    Raises:
+        BodyTooLarge: If the body exceeds max_body_bytes (checked before it is read)
+        ValueError: On a malformed start line or framing
+        asyncio.IncompleteReadError: If the stream ends mid-message
+    """
+    start_line = await reader.readline()
+    if not start_line:
+        return None
+
+    headers: Dict[str, str] = {}
+    header_bytes = 0
+    while True:
+        line = await reader.readline()
+        header_bytes += len(line)
+        if header_bytes > MAX_HEADER_BYTES:
+            raise ValueError("HTTP headers too large")
+        if line in (b"\r\n", b"\n"):
+            break
+        if not line:
+            raise asyncio.IncompleteReadError(line, None)
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    message = HttpMessage(start_line.decode("latin-1").rstrip("\r\n"), headers)
+    _validate_start_line(message.start_line, is_response)
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        message.body = await _read_chunked(reader, max_body_bytes)
+    elif "content-length" in headers:
+        length = int(headers["content-length"])
+        if length < 0:
+            raise ValueError("Negative Content-Length")
+        _check_body_size(length, max_body_bytes)
+        message.body = await reader.readexactly(length)
+    elif is_response and message.status_code not in (204, 304):
+        message.body = await _read_until_close(reader, max_body_bytes)
+        message.headers["connection"] = "close"
+
+    return message
+
+
+def _validate_start_line(start_line: str, is_response: bool) -> None:
+    """Raise ValueError unless start_line is a well-formed status line or request line"""
+    parts = start_line.split(" ", 2)
+    if is_response:
+        if len(parts) < 2 or not parts[0].startswith("HTTP/") or not (parts[1].isdigit() and len(parts[1]) == 3):
+            raise ValueError(f"Malformed HTTP status line: {start_line!r}")
+    elif len(parts) != 3 or not all(parts) or not parts[2].startswith("HTTP/"):
+        raise ValueError(f"Malformed HTTP request line: {start_line!r}")
+
+
+def _check_body_size(size: int, max_body_bytes: Optional[int]) -> None:
+    """Raise BodyTooLarge if size exceeds max_body_bytes"""
+    if max_body_bytes is not None and size > max_body_bytes:
+        raise BodyTooLarge(f"HTTP body of {size} bytes exceeds the {max_body_bytes} byte limit")
+
+
+async def _read_chunked(reader: asyncio.StreamReader, max_body_bytes: Optional[int] = None) -> bytes:
+    """Read a chunked transfer-encoded body"""
+    chunks = []
+    total = 0
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            # Skip trailers up to the terminating blank line
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        total += size
+        _check_body_size(total, max_body_bytes)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+async def _read_until_close(reader: asyncio.StreamReader, max_body_bytes: Optional[int] = None) -> bytes:
+    """Read a body delimited by the peer closing the stream"""
+    if max_body_bytes is None:
+        return await reader.read()
+    body = await reader.read(max_body_bytes + 1)
+    while len(body) <= max_body_bytes:
+        more = await reader.read(max_body_bytes + 1 - len(body))
+        if not more:
+            return body
+        body += more
+    _check_body_size(len(body), max_body_bytes)
+
+
+def build_http_message(start_line: str, headers: Dict[str, str], body: bytes = b"") -> bytes:
+    """
+    Serialize an HTTP message.
+
+    Args:
+        start_line: Request line or status line
+        headers: Header names and values (Content-Length is added automatically)
+        body: Message body
+
+    Returns:
+        Raw bytes ready to write to a stream
+    """
+    lines = [start_line]
+    for name, value in headers.items():
+        lines.append(f"{name}: {value}")
+    lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
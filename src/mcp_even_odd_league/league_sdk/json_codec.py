@@ -0,0 +1,108 @@
+"""
+JSON Codec
+
+Single JSON encode/decode entry point for the SDK (log lines, JSON-RPC
+bodies, channel frames). The fastest installed library is picked at import
+time: orjson, then ujson, then the standard library.
+
+Output is the same whichever backend is active:
+- compact separators, UTF-8 text (non-ASCII is not escaped)
+- naive datetimes as ISO 8601 with a "Z" suffix (the SDK's UTC convention),
+  aware datetimes and dates as plain ISO 8601
+- non-string dict keys converted to strings
+- anything else unserializable raises TypeError
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - exercised only with ujson
+    ujson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode types JSON has no native form for"""
+    if isinstance(obj, datetime):
+        return obj.isoformat() + "Z" if obj.tzinfo is None else obj.isoformat()
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+    # Datetimes go through _default so every backend formats them alike
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _dumpb(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+    _loads = orjson.loads
+elif ujson is not None:  # pragma: no cover - exercised only with ujson and without orjson
+    BACKEND = "ujson"
+
+    def _dumpb(obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                           default=_default).encode("utf-8")
+
+    _loads = ujson.loads
+else:  # pragma: no cover - exercised only without orjson
+    BACKEND = "json"
+
+    def _dumpb(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+    _loads = json.loads
+
+
+def dumpb(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-compatible object (datetimes allowed)
+
+    Returns:
+        Compact JSON bytes
+
+    Raises:
+        TypeError: If obj contains an unserializable value
+    """
+    return _dumpb(obj)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string (see dumpb).
+
+    Args:
+        obj: JSON-compatible object (datetimes allowed)
+
+    Returns:
+        Compact JSON text
+    """
+    return _dumpb(obj).decode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or UTF-8 bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded object
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    return _loads(data)
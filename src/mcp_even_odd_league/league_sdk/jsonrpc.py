@@ -0,0 +1,333 @@
+"""
+JSON-RPC Helpers
+
+Server-side JSON-RPC 2.0 envelope, batch handling and method dispatch
+shared by all agents.
+"""
+
+import asyncio
+import inspect
+import threading
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Standard JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+
+def error_response(code: int, message: str, request_id: Any = None) -> Dict[str, Any]:
+    """
+    Build a JSON-RPC 2.0 error envelope.
+
+    Args:
+        code: JSON-RPC error code
+        message: Human-readable error message
+        request_id: Id of the failed request (None if unknown)
+
+    Returns:
+        Error response envelope
+    """
+    return {
+        "jsonrpc": "2.0",
+        "error": {
+            "code": code,
+            "message": message
+        },
+        "id": request_id
+    }
+
+
+def result_response(result: Any, request_id: Any) -> Dict[str, Any]:
+    """
+    Build a JSON-RPC 2.0 success envelope.
+
+    Args:
+        result: Result payload
+        request_id: Id of the request being answered
+
+    Returns:
+        Success response envelope
+    """
+    return {
+        "jsonrpc": "2.0",
+        "result": result,
+        "id": request_id
+    }
+
+
+def _element_error(item: Any) -> Optional[Dict[str, Any]]:
+    """Return the Invalid Request error for a batch element that is not a request object, else None"""
+    if not isinstance(item, dict):
+        return error_response(INVALID_REQUEST, "Invalid Request: batch element must be an object")
+    if item.get("jsonrpc") != "2.0" or not isinstance(item.get("method"), str):
+        return error_response(INVALID_REQUEST, "Invalid Request: batch element is not a JSON-RPC 2.0 request",
+                              item.get("id"))
+    return None
+
+
+def _empty_batch_response() -> Dict[str, Any]:
+    """Error for an empty batch: a single response object, not an array"""
+    return error_response(INVALID_REQUEST, "Invalid Request: empty batch")
+
+
+def _collect_batch(batch: List[Any], errors: List[Optional[Dict[str, Any]]],
+                   responses: Iterable[Dict[str, Any]]) -> Tuple[Optional[List[Dict[str, Any]]], int]:
+    """
+    Pair per-element responses with the batch, dropping notifications.
+
+    Args:
+        batch: Parsed batch array
+        errors: _element_error() of each element
+        responses: One response per valid element of batch, in order
+
+    Returns:
+        Tuple of (response array or None, HTTP status)
+    """
+    responses = iter(responses)
+    collected = []
+    for item, error in zip(batch, errors):
+        if error is not None:
+            # Invalid elements are answered even without an id; only notifications are silent
+            collected.append(error)
+            continue
+
+        response = next(responses)
+        if "id" in item:
+            collected.append(response)
+
+    if not collected:
+        return None, 204
+    return collected, 200
+
+
+def dispatch_batch(batch: List[Any],
+                   process_single: Callable[[Any], Tuple[Dict[str, Any], int]]) -> Tuple[Optional[Any], int]:
+    """
+    Process a JSON-RPC 2.0 batch array.
+
+    Every valid element is handled by process_single exactly as a standalone
+    request would be. Notifications (valid elements without an "id") produce
+    no entry in the response array; if the batch holds only notifications, no
+    body is returned. Invalid elements get an Invalid Request error each, and
+    an empty batch gets a single Invalid Request error object.
+
+    Args:
+        batch: Parsed batch array
+        process_single: Callable returning (response_envelope, http_status) for one request
+
+    Returns:
+        Tuple of (body, HTTP status): the response array with status 200; None
+        with 204 when every element was a notification; or the single error
+        object with 400 for an empty batch
+    """
+    if not batch:
+        return _empty_batch_response(), 400
+
+    errors = [_element_error(item) for item in batch]
+    responses = (process_single(item)[0] for item, error in zip(batch, errors) if error is None)
+    return _collect_batch(batch, errors, responses)
+
+
+async def dispatch_batch_async(batch: List[Any],
+                               process_single: Callable[[Any], Awaitable[Tuple[Dict[str, Any], int]]]
+                               ) -> Tuple[Optional[Any], int]:
+    """
+    Process a JSON-RPC 2.0 batch array, running its elements concurrently.
+
+    Same contract as dispatch_batch; process_single is a coroutine function.
+
+    Args:
+        batch: Parsed batch array
+        process_single: Coroutine function returning (response_envelope, http_status)
+
+    Returns:
+        Tuple of (body, HTTP status), as for dispatch_batch
+    """
+    if not batch:
+        return _empty_batch_response(), 400
+
+    errors = [_element_error(item) for item in batch]
+    results = await asyncio.gather(*(process_single(item) for item, error in zip(batch, errors) if error is None))
+    return _collect_batch(batch, errors, (response for response, _ in results))
+
+
+class _ThreadLoop:
+    """Event loop owned by one thread, closed when the thread exits"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+
+    def __del__(self):
+        self.loop.close()
+
+
+_thread_loops = threading.local()
+
+
+def _run_sync(awaitable: Awaitable) -> Any:
+    """
+    Run a coroutine handler's result to completion from synchronous code.
+
+    Each calling thread reuses its own event loop: a fresh asyncio.run() per
+    request costs ~15x more than the handlers themselves.
+    """
+    owner = getattr(_thread_loops, "owner", None)
+    if owner is None:
+        owner = _thread_loops.owner = _ThreadLoop()
+    return owner.loop.run_until_complete(awaitable)
+
+
+class MethodDispatcher:
+    """
+    Table-driven JSON-RPC 2.0 method dispatcher.
+
+    Agents register one callable per method at startup; each callable takes
+    the request params and returns the result object. Envelope validation,
+    method lookup and error envelopes are handled here for every agent.
+    Handlers may be plain functions or coroutine functions; both work under
+    the Flask server (handle) and the asyncio server (handle_async).
+    """
+
+    def __init__(self):
+        """Initialize an empty method table."""
+        self._methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+
+    def register(self, method: str, handler: Callable[[Dict[str, Any]], Any]) -> None:
+        """
+        Register the handler for a method.
+
+        Args:
+            method: JSON-RPC method name
+            handler: Callable taking params and returning the result
+        """
+        self._methods[method] = handler
+
+    def register_many(self, methods: Iterable[str], handler: Callable[[str, Dict[str, Any]], Any]) -> None:
+        """
+        Register one handler for several methods.
+
+        Args:
+            methods: JSON-RPC method names
+            handler: Callable taking (method, params) and returning the result
+        """
+        for method in methods:
+            self.register(method, partial(handler, method))
+
+    @property
+    def methods(self) -> List[str]:
+        """Registered method names"""
+        return list(self._methods)
+
+    def _resolve(self, data: Any) -> Tuple[Optional[Callable], Any]:
+        """
+        Validate a request envelope and look up its handler.
+
+        Returns:
+            (handler, None) when the request is valid, else (None, (error_envelope, status))
+        """
+        if not data or not isinstance(data, dict):
+            return None, (error_response(PARSE_ERROR, "Parse error: Invalid JSON"), 400)
+
+        request_id = data.get("id")
+
+        # Validate JSON-RPC structure
+        if data.get("jsonrpc") != "2.0":
+            return None, (error_response(INVALID_REQUEST, "Invalid Request: jsonrpc must be '2.0'", request_id), 400)
+
+        if "method" not in data:
+            return None, (error_response(INVALID_REQUEST, "Invalid Request: missing 'method' field", request_id), 400)
+
+        method = data["method"]
+        handler = self._methods.get(method)
+        if handler is None:
+            return None, (error_response(METHOD_NOT_FOUND, f"Method not found: {method}", request_id), 404)
+
+        return handler, None
+
+    def dispatch(self, data: Any) -> Tuple[Dict[str, Any], int]:
+        """
+        Process one JSON-RPC 2.0 request.
+
+        Args:
+            data: Parsed request object
+
+        Returns:
+            Tuple of (response envelope, HTTP status)
+        """
+        handler, error = self._resolve(data)
+        if handler is None:
+            return error
+
+        try:
+            result = handler(data.get("params", {}))
+            if inspect.isawaitable(result):
+                result = _run_sync(result)
+        except Exception as e:
+            return error_response(INTERNAL_ERROR, f"Internal error: {str(e)}", data.get("id")), 500
+
+        return result_response(result, data.get("id")), 200
+
+    async def dispatch_async(self, data: Any, executor: Optional[Executor] = None) -> Tuple[Dict[str, Any], int]:
+        """
+        Process one JSON-RPC 2.0 request on an event loop.
+
+        Coroutine handlers are awaited directly. Plain handlers run in
+        executor so blocking handler code (file I/O, outbound MCP calls) never
+        stalls other requests; at most its worker count of them run at once.
+
+        Args:
+            data: Parsed request object
+            executor: Pool for plain handlers (None uses the loop's default
+                      executor, capped at min(32, CPUs + 4) workers)
+
+        Returns:
+            Tuple of (response envelope, HTTP status)
+        """
+        handler, error = self._resolve(data)
+        if handler is None:
+            return error
+
+        params = data.get("params", {})
+        try:
+            if asyncio.iscoroutinefunction(handler):
+                result = await handler(params)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(executor, handler, params)
+        except Exception as e:
+            return error_response(INTERNAL_ERROR, f"Internal error: {str(e)}", data.get("id")), 500
+
+        return result_response(result, data.get("id")), 200
+
+    def handle(self, data: Any) -> Tuple[Optional[Any], int]:
+        """
+        Process a request body that may be a single request or a batch.
+
+        Args:
+            data: Parsed request body
+
+        Returns:
+            Tuple of (response body or None when there is nothing to send, HTTP status)
+        """
+        if isinstance(data, list):
+            return dispatch_batch(data, self.dispatch)
+        return self.dispatch(data)
+
+    async def handle_async(self, data: Any, executor: Optional[Executor] = None) -> Tuple[Optional[Any], int]:
+        """
+        Async counterpart of handle(); batch elements run concurrently.
+
+        Args:
+            data: Parsed request body
+            executor: Pool for plain handlers (see dispatch_async)
+
+        Returns:
+            Tuple of (response body or None when there is nothing to send, HTTP status)
+        """
+        if isinstance(data, list):
+            return await dispatch_batch_async(data, partial(self.dispatch_async, executor=executor))
+        return await self.dispatch_async(data, executor)
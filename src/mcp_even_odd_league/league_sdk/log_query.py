@@ -0,0 +1,444 @@
+"""
+Log Query
+
+Indexed lookups over JsonLogger JSONL logs (active files and rotated segments).
+
+Every log file gets a sidecar index ({file}.idx.json) holding one row per
+entry: timestamp, event_type, match_id, conversation_id and where the entry's
+bytes live, plus postings that map each match_id, conversation_id and
+event_type value to the numbers of its rows. Queries look up the postings of
+their filters, check only those rows and then read only the matching
+entries: by memory-mapped slices for plain files, and by decompressing just
+the containing block for gzipped segments.
+
+Rotated segments are indexed by the logger's background thread when they are
+rotated; compression writes them as a sequence of independent gzip members
+(BLOCK_SIZE bytes of log each) so any entry can be reached without inflating
+the whole segment. Active files are indexed on first query and extended
+incrementally as they grow. Segment manifests let whole segments outside a
+time range be skipped without opening them.
+
+Usage:
+    python -m mcp_even_odd_league.league_sdk.log_query --match R1M1
+    python -m mcp_even_odd_league.league_sdk.log_query --conversation conv-abc --root SHARED/logs
+    python -m mcp_even_odd_league.league_sdk.log_query --event "TIMEOUT_*" --since 2025-01-01T10:00:00Z
+"""
+
+import argparse
+import gzip
+import mmap
+import os
+import sys
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import json_codec
+
+
+INDEX_SUFFIX = ".idx.json"
+INDEX_VERSION = 2
+
+# Uncompressed bytes per gzip member in compressed segments
+BLOCK_SIZE = 64 * 1024
+
+# Index row layout
+TIMESTAMP, EVENT_TYPE, MATCH_ID, CONVERSATION_ID, BLOCK, OFFSET, LENGTH = range(7)
+
+# Row columns with postings (value -> row numbers) in the index
+POSTED_COLUMNS = {"match_id": MATCH_ID, "conversation_id": CONVERSATION_ID, "event_type": EVENT_TYPE}
+
+GLOB_CHARS = frozenset("*?[")
+
+
+def index_path(log_path: Path) -> Path:
+    """Sidecar index file for a log file"""
+    return log_path.with_name(log_path.name + INDEX_SUFFIX)
+
+
+def _compressed_path(log_path: Path) -> Path:
+    """Gzipped form of a rotated segment"""
+    return log_path.with_name(log_path.name + ".gz")
+
+
+def _field(entry: Dict[str, Any], name: str) -> Optional[str]:
+    """Indexed field from the entry's top level (bound context) or its data"""
+    value = entry.get(name)
+    if value is None and isinstance(entry.get("data"), dict):
+        value = entry["data"].get(name)
+    return value
+
+
+def _row(line: bytes, block: Optional[int], offset: int) -> Optional[list]:
+    """Index row for one log line, or None if the line is not a log entry"""
+    try:
+        entry = json_codec.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict):
+        return None
+    return [entry.get("timestamp"), entry.get("event_type"), _field(entry, "match_id"),
+            _field(entry, "conversation_id"), block, offset, len(line)]
+
+
+def _add_postings(postings: Dict[str, Dict[str, List[int]]], rows: List[list],
+                  start: int) -> Dict[str, Dict[str, List[int]]]:
+    """Post rows[start:] under their match_id, conversation_id and event_type values"""
+    for name, column in POSTED_COLUMNS.items():
+        values = postings.setdefault(name, {})
+        for number in range(start, len(rows)):
+            value = rows[number][column]
+            if value is not None:
+                values.setdefault(str(value), []).append(number)
+    return postings
+
+
+def _save_index(path: Path, index: Dict[str, Any]) -> Dict[str, Any]:
+    """Write an index next to its log atomically"""
+    target = index_path(path)
+    tmp_path = target.with_name(target.name + ".tmp")
+    tmp_path.write_bytes(json_codec.dumpb(index))
+    os.replace(tmp_path, target)
+    return index
+
+
+def _scan_lines(data, start: int, end: int, block: Optional[int] = None) -> Iterator[list]:
+    """Index rows for the complete lines of data[start:end]"""
+    position = start
+    while position < end:
+        newline = data.find(b"\n", position, end)
+        if newline == -1:
+            break  # a partially written last line is indexed next time
+        row = _row(data[position:newline], block, position)
+        if row is not None:
+            yield row
+        position = newline + 1
+
+
+def build_index(path: Path, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Index a plain JSONL log, extending a previous index of the same file if given.
+
+    Args:
+        path: Log file
+        previous: Index built earlier for this file (reused if the file only grew)
+
+    Returns:
+        The saved index
+    """
+    stat = path.stat()
+    rows: List[list] = []
+    postings: Dict[str, Dict[str, List[int]]] = {}
+    start = 0
+    if previous and previous.get("inode") == stat.st_ino and previous["size"] <= stat.st_size:
+        rows, postings, start = previous["rows"], previous["postings"], previous["size"]
+    indexed = len(rows)
+
+    size = start
+    if stat.st_size > start:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = data.rfind(b"\n", start) + 1
+            if end > start:
+                rows.extend(_scan_lines(data, start, end))
+                size = end
+
+    return _save_index(path, {"version": INDEX_VERSION, "file": path.name, "inode": stat.st_ino,
+                              "size": size, "blocks": None, "rows": rows,
+                              "postings": _add_postings(postings, rows, indexed)})
+
+
+def compress_segment(source: Path, target: Path, block_size: int = BLOCK_SIZE) -> Dict[str, Any]:
+    """
+    Gzip a rotated segment as independent blocks and index it.
+
+    The output is an ordinary (multi-member) gzip file.
+
+    Args:
+        source: Plain JSONL segment
+        target: .gz file to create
+        block_size: Uncompressed bytes per gzip member
+
+    Returns:
+        The saved index of target
+    """
+    rows: List[list] = []
+    blocks: List[List[int]] = []
+    tmp_path = target.with_name(target.name + ".tmp")
+
+    with open(source, "rb") as src, open(tmp_path, "wb") as dst:
+        buffer = bytearray()
+
+        def write_block() -> None:
+            member = gzip.compress(bytes(buffer), mtime=0)
+            blocks.append([dst.tell(), len(member)])
+            dst.write(member)
+            buffer.clear()
+
+        for line in src:
+            row = _row(line, len(blocks), len(buffer))
+            buffer += line
+            if row is not None:
+                rows.append(row)
+            if len(buffer) >= block_size:
+                write_block()
+        if buffer:
+            write_block()
+
+    os.replace(tmp_path, target)
+    return _save_index(target, {"version": INDEX_VERSION, "file": target.name, "inode": target.stat().st_ino,
+                                "size": target.stat().st_size, "blocks": blocks, "rows": rows,
+                                "postings": _add_postings({}, rows, 0)})
+
+
+def _index_gzip(path: Path) -> Dict[str, Any]:
+    """Index a gzip file not written by compress_segment (treated as one block)"""
+    with gzip.open(path, "rb") as f:
+        data = f.read()
+    rows = list(_scan_lines(data, 0, len(data), block=0))
+    stat = path.stat()
+    return _save_index(path, {"version": INDEX_VERSION, "file": path.name, "inode": stat.st_ino,
+                              "size": stat.st_size, "blocks": [[0, stat.st_size]], "rows": rows,
+                              "postings": _add_postings({}, rows, 0)})
+
+
+def is_current(path: Path, index: Dict[str, Any]) -> bool:
+    """Whether an index still describes a log file (same file, nothing appended since)"""
+    stat = path.stat()
+    if index["inode"] != stat.st_ino:
+        return False
+    return index["blocks"] is not None or index["size"] == stat.st_size
+
+
+def load_index(path: Path, rebuild: bool = False) -> Dict[str, Any]:
+    """
+    Get a log file's index, building or extending it when missing or stale.
+
+    Args:
+        path: Plain .jsonl or gzipped .jsonl.gz log file
+        rebuild: Ignore any existing index
+
+    Returns:
+        Index dictionary
+    """
+    index = None
+    if not rebuild and index_path(path).exists():
+        try:
+            index = json_codec.loads(index_path(path).read_bytes())
+        except ValueError:
+            index = None
+        if index is not None and index.get("version") != INDEX_VERSION:
+            index = None
+
+    if index is not None and is_current(path, index):
+        return index
+    if path.suffix == ".gz":
+        return _index_gzip(path)
+    return build_index(path, index)
+
+
+def _matches(row: list, match_id: Optional[str], conversation_id: Optional[str],
+             event_type: Optional[str], since: Optional[str], until: Optional[str]) -> bool:
+    """Whether an index row satisfies every given filter"""
+    if match_id is not None and row[MATCH_ID] != match_id:
+        return False
+    if conversation_id is not None and row[CONVERSATION_ID] != conversation_id:
+        return False
+    if event_type is not None and not (row[EVENT_TYPE] and fnmatchcase(row[EVENT_TYPE], event_type)):
+        return False
+    timestamp = row[TIMESTAMP] or ""
+    if since is not None and timestamp < since:
+        return False
+    if until is not None and timestamp > until:
+        return False
+    return True
+
+
+def candidate_rows(index: Dict[str, Any], match_id: Optional[str], conversation_id: Optional[str],
+                   event_type: Optional[str]) -> Optional[List[int]]:
+    """
+    Row numbers that may match the field filters, from the index postings.
+
+    An event_type glob is expanded against the distinct event types. Only
+    the smallest posting list is returned; callers still check each row.
+
+    Args:
+        index: Log file index
+        match_id: match_id filter
+        conversation_id: conversation_id filter
+        event_type: Event type or glob filter
+
+    Returns:
+        Candidate row numbers in file order, or None if no field filter is given
+    """
+    postings = index["postings"]
+    candidates = []
+    for name, value in (("match_id", match_id), ("conversation_id", conversation_id)):
+        if value is not None:
+            candidates.append(postings[name].get(str(value), []))
+    if event_type is not None:
+        if GLOB_CHARS.isdisjoint(event_type):
+            candidates.append(postings["event_type"].get(event_type, []))
+        else:
+            candidates.append(sorted(number for name, numbers in postings["event_type"].items()
+                                     if fnmatchcase(name, event_type) for number in numbers))
+    if not candidates:
+        return None
+    return min(candidates, key=len)
+
+
+def read_rows(path: Path, index: Dict[str, Any], rows: List[list]) -> List[Dict[str, Any]]:
+    """
+    Read the entries behind index rows, touching only their bytes or blocks.
+
+    Args:
+        path: Log file the index belongs to
+        index: Its index
+        rows: Rows to read
+
+    Returns:
+        Decoded log entries, in row order
+    """
+    if not rows:
+        return []
+
+    with open(path, "rb") as f:
+        if index["blocks"] is None:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return [json_codec.loads(data[row[OFFSET]:row[OFFSET] + row[LENGTH]]) for row in rows]
+
+        entries = []
+        cached_block, block_data = None, b""
+        for row in rows:
+            if row[BLOCK] != cached_block:
+                offset, length = index["blocks"][row[BLOCK]]
+                f.seek(offset)
+                block_data = gzip.decompress(f.read(length))
+                cached_block = row[BLOCK]
+            entries.append(json_codec.loads(block_data[row[OFFSET]:row[OFFSET] + row[LENGTH]]))
+        return entries
+
+
+class LogQuery:
+    """
+    Query every JsonLogger log under a logs root.
+
+    Covers active files (*.jsonl) and rotated segments (*.jsonl, *.jsonl.gz);
+    segments whose manifest time range lies outside the query are skipped.
+    """
+
+    def __init__(self, logs_root: Path = Path("SHARED/logs")):
+        """
+        Initialize LogQuery.
+
+        Args:
+            logs_root: Directory JsonLogger writes under
+        """
+        self.logs_root = Path(logs_root)
+        # Indexes kept between queries, revalidated against the files each time
+        self._indexes: Dict[Path, Dict[str, Any]] = {}
+
+    def _segment_ranges(self) -> Dict[Path, Tuple[Optional[str], Optional[str]]]:
+        """Time range of every segment listed in a manifest"""
+        ranges = {}
+        for manifest_path in self.logs_root.rglob("*.manifest.json"):
+            try:
+                manifest = json_codec.loads(manifest_path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            for segment in manifest.get("segments", []):
+                ranges[manifest_path.with_name(segment["file"])] = (
+                    segment.get("first_timestamp"), segment.get("last_timestamp"))
+        return ranges
+
+    def log_files(self, since: Optional[str] = None, until: Optional[str] = None) -> List[Path]:
+        """
+        List log files that may hold entries in a time range.
+
+        Args:
+            since: Earliest timestamp of interest (ISO 8601)
+            until: Latest timestamp of interest (ISO 8601)
+
+        Returns:
+            Candidate log files
+        """
+        ranges = self._segment_ranges()
+        files = []
+        for path in sorted(self.logs_root.rglob("*.jsonl*")):
+            if not (path.name.endswith(".jsonl") or path.name.endswith(".jsonl.gz")):
+                continue
+            if path.suffix == ".jsonl" and _compressed_path(path).exists():
+                continue  # compression finished, plain segment not yet removed
+            first, last = ranges.get(path, (None, None))
+            if since is not None and last is not None and last < since:
+                continue
+            if until is not None and first is not None and first > until:
+                continue
+            files.append(path)
+        return files
+
+    def _query_file(self, path: Path, filters: Tuple, reindex: bool) -> List[Dict[str, Any]]:
+        """Matching entries of one log file (FileNotFoundError if it is gone)"""
+        index = self._indexes.get(path)
+        if reindex or index is None or not is_current(path, index):
+            index = self._indexes[path] = load_index(path, rebuild=reindex)
+        numbers = candidate_rows(index, *filters[:3])
+        rows = index["rows"] if numbers is None else [index["rows"][number] for number in numbers]
+        return read_rows(path, index, [row for row in rows if _matches(row, *filters)])
+
+    def query(self, match_id: Optional[str] = None, conversation_id: Optional[str] = None,
+              event_type: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None, reindex: bool = False) -> List[Dict[str, Any]]:
+        """
+        Find log entries across all agents.
+
+        Args:
+            match_id: Entries for this match
+            conversation_id: Entries for this conversation
+            event_type: Event type or glob (e.g. "TIMEOUT_*")
+            since: Earliest timestamp (inclusive)
+            until: Latest timestamp (inclusive)
+            reindex: Rebuild every index first
+
+        Returns:
+            Matching entries ordered by timestamp
+        """
+        filters = (match_id, conversation_id, event_type, since, until)
+        files = self.log_files(since, until)
+        results = []
+        for path in files:
+            try:
+                results.extend(self._query_file(path, filters, reindex))
+            except FileNotFoundError:
+                # Compressed while we looked: its entries now live in the .gz
+                if path.suffix == ".jsonl":
+                    try:
+                        results.extend(self._query_file(_compressed_path(path), filters, reindex))
+                    except FileNotFoundError:
+                        pass
+        for path in set(self._indexes) - set(files):
+            del self._indexes[path]
+        results.sort(key=lambda entry: entry.get("timestamp") or "")
+        return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print matching log entries as JSON lines"""
+    parser = argparse.ArgumentParser(description="Query JsonLogger logs through their indexes")
+    parser.add_argument("--root", default="SHARED/logs", help="logs root (default: SHARED/logs)")
+    parser.add_argument("--match", dest="match_id", help="match_id to find")
+    parser.add_argument("--conversation", dest="conversation_id", help="conversation_id to find")
+    parser.add_argument("--event", dest="event_type", help="event type or glob, e.g. 'TIMEOUT_*'")
+    parser.add_argument("--since", help="earliest timestamp (ISO 8601)")
+    parser.add_argument("--until", help="latest timestamp (ISO 8601)")
+    parser.add_argument("--reindex", action="store_true", help="rebuild indexes before querying")
+    args = parser.parse_args(argv)
+
+    entries = LogQuery(Path(args.root)).query(args.match_id, args.conversation_id, args.event_type,
+                                              args.since, args.until, reindex=args.reindex)
+    for entry in entries:
+        sys.stdout.write(json_codec.dumps(entry) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,17 +3,444 @@ JSON Logger
 
 Structured JSON Lines logging.
 Based on class_map.md - JsonLogger class for JSONL format logging.
+
+Entries below the component's minimum level, or not picked by their event
+type's sample rate, are discarded before anything is built or serialized.
+
+By default every entry is appended synchronously. With LoggingConfig.buffered,
+entries are queued to one background writer per log file, which keeps the
+file open and appends in batches (on size, on interval, and at exit).
+
+Logs can be rotated by size, age or league round (see LoggingConfig.rotate_*
+and JsonLogger.rotate). Rotated segments are gzipped in the background and
+listed with their time ranges in {name}.log.manifest.json next to the log.
 """
 
+import atexit
+import copy
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+from . import json_codec, log_query
+from .config_models import LOG_LEVELS, LoggingConfig
+
+
+class RotatingLogFile:
+    """
+    Open append handle on one JSONL log, rotated into numbered segments.
+
+    The active file keeps its name ({base}.jsonl). Rotation renames it to
+    {base}.{seq:06d}.jsonl, records the segment (time range, entry count,
+    size, reason) in {base}.manifest.json, and gzips it on a background
+    thread, which also writes the segment's log_query index. The active file
+    is never listed in the manifest.
+    """
+
+    def __init__(self, path: Path, config: LoggingConfig):
+        """
+        Initialize RotatingLogFile and open the active file.
+
+        Args:
+            path: Active log file (parent directories are created)
+            config: Rotation thresholds and compression setting
+        """
+        self.path = path
+        self.config = config
+        self.base_name = path.name[:-len(".jsonl")] if path.name.endswith(".jsonl") else path.name
+        self.manifest_path = path.with_name(f"{self.base_name}.manifest.json")
+        self._lock = threading.Lock()
+        self._manifest_lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._open()
+
+    def _open(self) -> None:
+        """Open the active file and reset the segment statistics"""
+        self._file = open(self.path, "a", encoding="utf-8")
+        self.size = self._file.tell()
+        self.entries = 0
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+        # Entries already in the file are counted only if the segment is rotated
+        self._stats_known = self.size == 0
+        self.opened_at = time.monotonic()
+
+    def write(self, entries: List[Tuple[Optional[str], str]]) -> None:
+        """
+        Append entries, then rotate if the size or age limit is reached.
+
+        Args:
+            entries: (timestamp, serialized line) pairs, oldest first
+        """
+        if not entries:
+            return
+        data = "\n".join(line for _, line in entries) + "\n"
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            self.size += len(data) if data.isascii() else len(data.encode("utf-8"))
+            self.entries += len(entries)
+            for timestamp, _ in entries:
+                if timestamp is not None:
+                    if self.first_timestamp is None:
+                        self.first_timestamp = timestamp
+                    self.last_timestamp = timestamp
+
+            max_bytes, interval = self.config.rotate_max_bytes, self.config.rotate_interval_sec
+            if max_bytes and self.size >= max_bytes:
+                self._rotate("size")
+            elif interval and time.monotonic() - self.opened_at >= interval:
+                self._rotate("time")
+
+    def rotate(self, reason: str = "manual") -> Optional[Path]:
+        """
+        Close the active file as a segment and start a new one.
+
+        Args:
+            reason: Why the segment ended (recorded in the manifest)
+
+        Returns:
+            Path of the (uncompressed) segment, or None if the active file was empty
+        """
+        with self._lock:
+            return self._rotate(reason)
+
+    def _rotate(self, reason: str) -> Optional[Path]:
+        if self.size == 0:
+            return None
+        self._file.close()
+        if not self._stats_known:
+            self.entries, self.first_timestamp, self.last_timestamp = _scan_segment(self.path)
+
+        with self._manifest_lock:
+            manifest = self._load_manifest()
+            seq = max((segment["seq"] for segment in manifest["segments"]), default=0) + 1
+            segment_path = self.path.with_name(f"{self.base_name}.{seq:06d}.jsonl")
+            os.replace(self.path, segment_path)
+            manifest["segments"].append({
+                "seq": seq,
+                "file": segment_path.name,
+                "first_timestamp": self.first_timestamp,
+                "last_timestamp": self.last_timestamp,
+                "entries": self.entries,
+                "bytes": self.size,
+                "compressed": False,
+                "reason": reason
+            })
+            self._save_manifest(manifest)
+
+        self._open()
+        if self.config.compress_rotated:
+            _compressor().submit(self._compress, segment_path, seq)
+        else:
+            _compressor().submit(log_query.build_index, segment_path)
+        return segment_path
+
+    def _compress(self, segment_path: Path, seq: int) -> None:
+        """Gzip and index one segment and point its manifest entry at the compressed file"""
+        gz_path = segment_path.with_name(segment_path.name + ".gz")
+        log_query.compress_segment(segment_path, gz_path)
+
+        with self._manifest_lock:
+            manifest = self._load_manifest()
+            for segment in manifest["segments"]:
+                if segment["seq"] == seq:
+                    segment["file"] = gz_path.name
+                    segment["compressed"] = True
+                    segment["compressed_bytes"] = gz_path.stat().st_size
+            self._save_manifest(manifest)
+        segment_path.unlink()
+        log_query.index_path(segment_path).unlink(missing_ok=True)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if self.manifest_path.exists():
+            return json_codec.loads(self.manifest_path.read_bytes())
+        return {"log": self.path.name, "segments": []}
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Replace the manifest atomically so readers never see a partial file"""
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        tmp_path.write_bytes(json_codec.dumpb(manifest))
+        os.replace(tmp_path, self.manifest_path)
+
+    def close(self) -> None:
+        """Close the active file"""
+        with self._lock:
+            self._file.close()
+
+
+def _scan_segment(path: Path) -> Tuple[int, Optional[str], Optional[str]]:
+    """Count entries and read the first/last timestamps of a log written before this process"""
+    entries, first_line, last_line = 0, None, None
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                entries += 1
+                first_line = first_line or line
+                last_line = line
+
+    def timestamp(line: Optional[bytes]) -> Optional[str]:
+        try:
+            return json_codec.loads(line).get("timestamp") if line else None
+        except ValueError:
+            return None
+
+    return entries, timestamp(first_line), timestamp(last_line)
+
+
+_compress_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _compressor() -> ThreadPoolExecutor:
+    """Single background thread that compresses and indexes rotated segments"""
+    global _compress_executor
+    with _files_lock:
+        if _compress_executor is None:
+            _compress_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+        return _compress_executor
+
+
+class _Rotate:
+    """Queue marker asking the writer thread to rotate after the lines before it"""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+
+
+class BackgroundLogWriter:
+    """
+    Appends queued JSON lines to one file from a daemon thread.
+
+    Lines go to the file's shared RotatingLogFile, whose handle stays open
+    and which rotates it as configured. Pending lines are
+    written when flush_max_entries accumulate, when flush_interval_sec has
+    passed since the last write, on flush(), and on close().
+    """
+
+    def __init__(self, path: Path, config: LoggingConfig):
+        """
+        Initialize BackgroundLogWriter and start its thread.
+
+        Args:
+            path: Log file to append to (parent directories are created)
+            config: Flush thresholds, queue bound and overflow policy
+        """
+        self.path = path
+        self.config = config
+        self.dropped = 0
+        self.written = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=config.queue_size)
+        self._closed = False
+
+        self._file = get_log_file(path, config)
+        self._thread = threading.Thread(target=self._run, name=f"log-writer:{path.name}", daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called"""
+        return self._closed
+
+    def write(self, line: str, timestamp: Optional[str] = None) -> bool:
+        """
+        Queue one line (without trailing newline).
+
+        Under the "drop" policy a full queue discards the line; under "block"
+        the caller waits for space.
+
+        Args:
+            line: Serialized log entry
+            timestamp: Entry timestamp (for the rotation manifest)
+
+        Returns:
+            True if queued, False if dropped
+        """
+        if self.config.overflow_policy == "block":
+            self._queue.put((timestamp, line))
+            return True
+        try:
+            self._queue.put_nowait((timestamp, line))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write everything queued so far to disk.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the queued lines were written within the timeout
+        """
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def rotate(self, reason: str = "manual") -> None:
+        """
+        Rotate the file once the lines queued so far are written.
+
+        Args:
+            reason: Why the segment ended (recorded in the manifest)
+        """
+        self._queue.put(_Rotate(reason))
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush pending lines and stop the thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _write_batch(self, batch: List[Tuple[Optional[str], str]]) -> None:
+        """Append pending lines"""
+        if batch:
+            self._file.write(batch)
+            self.written += len(batch)
+            batch.clear()
+
+    def _run(self) -> None:
+        """Writer thread: batch lines from the queue until the close sentinel"""
+        interval = self.config.flush_interval_sec
+        max_entries = self.config.flush_max_entries
+        batch: List[Tuple[Optional[str], str]] = []
+        deadline = time.monotonic() + interval
+
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    item = ()
+
+                if item is None:
+                    break
+                if isinstance(item, threading.Event):
+                    self._write_batch(batch)
+                    item.set()
+                    continue
+                if isinstance(item, _Rotate):
+                    self._write_batch(batch)
+                    self._file.rotate(item.reason)
+                    continue
+                if item:
+                    batch.append(item)
+
+                if len(batch) >= max_entries or time.monotonic() >= deadline:
+                    self._write_batch(batch)
+                    deadline = time.monotonic() + interval
+        finally:
+            self._write_batch(batch)
+            # Release anyone still waiting on a flush
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
+
+
+_writers: Dict[Path, BackgroundLogWriter] = {}
+_writers_lock = threading.Lock()
+_files: Dict[Path, RotatingLogFile] = {}
+_files_lock = threading.Lock()
+
+
+def get_log_file(path: Path, config: LoggingConfig) -> RotatingLogFile:
+    """
+    Get the shared open file for a log, opening it if needed.
+
+    Args:
+        path: Log file
+        config: Settings used if the file is opened
+
+    Returns:
+        RotatingLogFile for path
+    """
+    log_file = _files.get(path)
+    if log_file is not None:
+        return log_file
+    with _files_lock:
+        log_file = _files.get(path)
+        if log_file is None:
+            log_file = _files[path] = RotatingLogFile(path, config)
+        return log_file
+
+
+def get_log_writer(path: Path, config: LoggingConfig) -> BackgroundLogWriter:
+    """
+    Get the shared background writer for a log file, starting one if needed.
+
+    Args:
+        path: Log file
+        config: Settings used if a new writer is started
+
+    Returns:
+        Open BackgroundLogWriter for path
+    """
+    writer = _writers.get(path)
+    if writer is not None and not writer.closed:
+        return writer
+    with _writers_lock:
+        writer = _writers.get(path)
+        if writer is None or writer.closed:
+            writer = BackgroundLogWriter(path, config)
+            _writers[path] = writer
+        return writer
+
+
+def close_log_writers(timeout: Optional[float] = 5.0) -> None:
+    """
+    Flush and close every background writer and open log file, and wait for
+    pending segment compression (registered to run at exit).
+
+    Args:
+        timeout: Maximum seconds to wait for each writer thread
+    """
+    global _compress_executor
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close(timeout)
+
+    with _files_lock:
+        files = list(_files.values())
+        _files.clear()
+        executor, _compress_executor = _compress_executor, None
+    for log_file in files:
+        log_file.close()
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+atexit.register(close_log_writers)
+
 
 class JsonLogger:
     """Structured JSONL logging"""
 
-    def __init__(self, component: str, league_id: Optional[str] = None, logs_root: Path = None):
+    def __init__(self, component: str, league_id: Optional[str] = None, logs_root: Path = None,
+                 config: Optional[LoggingConfig] = None):
         """
         Initialize JsonLogger.
 
@@ -21,9 +448,15 @@ class JsonLogger:
             component: Component name (e.g., "league_manager", "referee:REF01", "player:P01")
             league_id: Optional league identifier
             logs_root: Root directory for log files (defaults to SHARED/logs)
+            config: Write mode (defaults to synchronous appends)
         """
         self.component = component
         self.league_id = league_id
+        self.context = {}
+        self.config = config or LoggingConfig()
+        self.min_level = LOG_LEVELS[self.config.level_for(component)]
+        # event_type -> sample rate, shared with bound children
+        self._sample_rates: Dict[str, float] = {}
 
         if logs_root is None:
             # TODO: Set default to SHARED/logs
@@ -40,6 +473,45 @@ class JsonLogger:
         else:
             self.log_path = self.logs_root / "system" / f"{component}.log.jsonl"
 
+    def bind(self, **context) -> "JsonLogger":
+        """
+        Create a child logger that stamps context fields on every entry.
+
+        The child writes to the same file; entries carry the bound fields
+        (e.g., match_id) at top level so concurrent matches stay separable.
+
+        Args:
+            **context: Fields to add to every entry
+
+        Returns:
+            New JsonLogger sharing this logger's destination
+        """
+        child = copy.copy(self)
+        child.context = {**self.context, **context}
+        return child
+
+    def _sample_rate(self, event_type: str) -> float:
+        """Configured sample rate for an event type (cached)"""
+        rate = self._sample_rates.get(event_type)
+        if rate is None:
+            rate = self._sample_rates[event_type] = self.config.sample_rate_for(event_type)
+        return rate
+
+    def is_enabled(self, level: str = "INFO", event_type: Optional[str] = None) -> bool:
+        """
+        Check whether an entry could be written, to skip building expensive details.
+
+        Args:
+            level: Log level of the entry
+            event_type: Event type (None checks the level only)
+
+        Returns:
+            False if the level is below the minimum or the event's sample rate is 0
+        """
+        if LOG_LEVELS.get(level, 20) < self.min_level:
+            return False
+        return event_type is None or self._sample_rate(event_type) > 0.0
+
     def log(self, event_type: str, level: str = "INFO", **details) -> None:
         """
         Log an event.
@@ -49,23 +521,75 @@ class JsonLogger:
             level: Log level (DEBUG, INFO, WARNING, ERROR)
             **details: Additional key-value pairs to include in log entry
         """
-        import json
-
-        # Ensure log directory exists
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        if LOG_LEVELS.get(level, 20) < self.min_level:
+            return
+        rate = self._sample_rates.get(event_type)
+        if rate is None:
+            rate = self._sample_rate(event_type)
+        if rate < 1.0 and (rate <= 0.0 or random.random() >= rate):
+            return
 
         # Create log entry
         log_entry = {
             "timestamp": datetime.utcnow().isoformat() + "Z",
-            "agent_id": self.component,
-            "level": level,
-            "event_type": event_type,
-            "data": details
+            "agent_id": self.component
         }
+        if self.context:
+            log_entry.update(self.context)
+        log_entry["level"] = level
+        log_entry["event_type"] = event_type
+        if rate < 1.0:
+            # Lets readers scale sampled counts back up
+            log_entry["sample_rate"] = rate
+        log_entry["data"] = details
+
+        line = json_codec.dumps(log_entry)
+        if self.config.buffered:
+            get_log_writer(self.log_path, self.config).write(line, log_entry["timestamp"])
+            return
+        if self.config.rotates:
+            get_log_file(self.log_path, self.config).write([(log_entry["timestamp"], line)])
+            return
 
         # Append to log file as JSON line
-        with open(self.log_path, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until buffered entries are on disk (no-op in synchronous mode).
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if everything logged so far has been written
+        """
+        if not self.config.buffered:
+            return True
+        writer = _writers.get(self.log_path)
+        return writer.flush(timeout) if writer is not None else True
+
+    def rotate(self, reason: str = "manual") -> None:
+        """
+        Start a new log segment (e.g. at a league round boundary).
+
+        In buffered mode the rotation happens after entries already queued.
+
+        Args:
+            reason: Why the segment ended (recorded in the manifest)
+        """
+        if self.config.buffered:
+            get_log_writer(self.log_path, self.config).rotate(reason)
+        elif self.config.rotates:
+            get_log_file(self.log_path, self.config).rotate(reason)
+        elif self.log_path.exists():
+            log_file = RotatingLogFile(self.log_path, self.config)
+            try:
+                log_file.rotate(reason)
+            finally:
+                log_file.close()
 
     def log_event(self, event_type: str, data: Optional[dict] = None) -> None:
         """
@@ -77,6 +601,8 @@ class JsonLogger:
 
         This method is called by agents (Referee/Player) for Phase 4 logging.
         """
+        if self.min_level > LOG_LEVELS["INFO"]:
+            return
         if data is None:
             data = {}
 
@@ -85,19 +611,23 @@ class JsonLogger:
 
     def debug(self, event_type: str, **details) -> None:
         """Log debug event"""
-        self.log(event_type, level="DEBUG", **details)
+        if self.min_level <= LOG_LEVELS["DEBUG"]:
+            self.log(event_type, level="DEBUG", **details)
 
     def info(self, event_type: str, **details) -> None:
         """Log info event"""
-        self.log(event_type, level="INFO", **details)
+        if self.min_level <= LOG_LEVELS["INFO"]:
+            self.log(event_type, level="INFO", **details)
 
     def warning(self, event_type: str, **details) -> None:
         """Log warning event"""
-        self.log(event_type, level="WARNING", **details)
+        if self.min_level <= LOG_LEVELS["WARNING"]:
+            self.log(event_type, level="WARNING", **details)
 
     def error(self, event_type: str, **details) -> None:
         """Log error event"""
-        self.log(event_type, level="ERROR", **details)
+        if self.min_level <= LOG_LEVELS["ERROR"]:
+            self.log(event_type, level="ERROR", **details)
 
     def log_message_sent(self, message_type: str, recipient: str, **details) -> None:
         """
@@ -5,20 +5,24 @@ Protocol-compliant messaging infrastructure.
 Based on interfaces.md - MCPClientInterface.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import uuid
 
+from .config_models import HttpPoolConfig
+from .transports import HttpSessionPool, HttpTransport, LoopbackTransport  # noqa: F401 (re-exported)
 
-class MCPClient:
+
+class RpcEnvelopeMixin:
     """
-    MCP Communication Client
+    JSON-RPC 2.0 envelope building and response checks.
 
-    Handles JSON-RPC 2.0 formatting, HTTP transport, and timeout enforcement.
+    Shared by MCPClient and AsyncMCPClient, which differ only in how payloads
+    reach the peer. Hosts call __init__ to set the protocol defaults.
     """
 
     def __init__(self):
-        """Initialize MCP client"""
+        """Initialize protocol version and default timeout."""
         self.protocol_version = "league.v2"
         self.base_timeout = 10  # seconds
         self.jsonrpc_version = "2.0"
@@ -30,126 +34,127 @@ class MCPClient:
         Args:
             protocol_version: Protocol version (e.g., "league.v2")
             base_timeout: Default timeout in seconds
-
-        TODO: Implement HTTP client initialization
         """
         self.protocol_version = protocol_version
         self.base_timeout = base_timeout
-        # TODO: Initialize HTTP client library (requests, httpx, etc.)
 
-    def send_request(self, method: str, params: Dict[str, Any], endpoint: str, timeout: Optional[int] = None) -> Dict[str, Any]:
+    def build_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Send JSON-RPC 2.0 request to specified endpoint and wait for response.
+        Build a JSON-RPC 2.0 request envelope with a fresh unique id.
 
         Args:
-            method: JSON-RPC method name (e.g., "register_player")
-            params: Message payload (already formatted with protocol fields)
-            endpoint: Target HTTP endpoint (e.g., "http://localhost:8000/mcp")
-            timeout: Optional timeout override (uses default if None)
+            method: JSON-RPC method name
+            params: Message payload
 
         Returns:
-            Response result object
-
-        Raises:
-            Exception: On network error, timeout, or JSON-RPC error
+            Request envelope dictionary
         """
-        import requests
-
-        # Use provided timeout or default
-        actual_timeout = timeout if timeout is not None else self.base_timeout
-
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
-
-        # Construct JSON-RPC 2.0 request envelope
-        rpc_request = {
+        return {
             "jsonrpc": self.jsonrpc_version,
             "method": method,
             "params": params,
-            "id": request_id
+            "id": str(uuid.uuid4())
         }
 
-        try:
-            # Send POST request to endpoint
-            response = requests.post(
-                endpoint,
-                json=rpc_request,
-                headers={"Content-Type": "application/json"},
-                timeout=actual_timeout
-            )
-
-            # Parse JSON response (even if HTTP error, might contain JSON-RPC error)
-            try:
-                rpc_response = response.json()
-            except ValueError:
-                # Not JSON, check HTTP status
-                response.raise_for_status()
-                raise Exception("Invalid response: not JSON")
-
-            # Check HTTP status only if we couldn't parse JSON-RPC error
-            if response.status_code >= 400 and "error" not in rpc_response:
-                response.raise_for_status()
-
-            # Validate JSON-RPC response structure
-            if "jsonrpc" not in rpc_response or rpc_response["jsonrpc"] != "2.0":
-                raise Exception("Invalid JSON-RPC response: missing or invalid 'jsonrpc' field")
-
-            if "id" not in rpc_response or rpc_response["id"] != request_id:
-                raise Exception("Invalid JSON-RPC response: missing or mismatched 'id' field")
-
-            # Check for error
-            if "error" in rpc_response:
-                error = rpc_response["error"]
-                error_code = error.get("code", -1)
-                error_message = error.get("message", "Unknown error")
-                error_data = error.get("data", None)
-                raise Exception(f"JSON-RPC error {error_code}: {error_message} (data: {error_data})")
-
-            # Return result
-            if "result" not in rpc_response:
-                raise Exception("Invalid JSON-RPC response: missing 'result' field")
-
-            return rpc_response["result"]
-
-        except requests.exceptions.Timeout:
-            raise Exception(f"Request timeout after {actual_timeout} seconds")
-        except requests.exceptions.ConnectionError as e:
-            raise Exception(f"Connection error: {str(e)}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"HTTP error: {str(e)}")
-        except ValueError as e:
-            raise Exception(f"Invalid JSON response: {str(e)}")
-
-    def send_notification(self, method: str, params: Dict[str, Any], endpoint: str) -> None:
+    def build_notification(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Send JSON-RPC 2.0 notification (no response expected, no id field).
+        Build a JSON-RPC 2.0 notification envelope (no id field).
 
         Args:
             method: JSON-RPC method name
             params: Message payload
-            endpoint: Target endpoint
-        """
-        import requests
 
-        # Construct JSON-RPC 2.0 notification (without id field)
-        rpc_notification = {
+        Returns:
+            Notification envelope dictionary
+        """
+        return {
             "jsonrpc": self.jsonrpc_version,
             "method": method,
             "params": params
         }
 
-        try:
-            # Send POST request (fire-and-forget, short timeout)
-            requests.post(
-                endpoint,
-                json=rpc_notification,
-                headers={"Content-Type": "application/json"},
-                timeout=2  # Short timeout for notifications
-            )
-            # Do not wait for or process response
-        except Exception:
-            # Notifications are fire-and-forget, ignore errors
-            pass
+    def unwrap_response(self, rpc_response: Any, request_id: str) -> Dict[str, Any]:
+        """
+        Validate a JSON-RPC 2.0 response envelope and return its result.
+
+        Args:
+            rpc_response: Parsed response envelope
+            request_id: Id of the request the response must answer
+
+        Returns:
+            Response result object
+
+        Raises:
+            Exception: On malformed envelope, mismatched id, or JSON-RPC error
+        """
+        if not isinstance(rpc_response, dict):
+            raise Exception("Invalid JSON-RPC response: expected an object")
+
+        # Validate JSON-RPC response structure
+        if "jsonrpc" not in rpc_response or rpc_response["jsonrpc"] != "2.0":
+            raise Exception("Invalid JSON-RPC response: missing or invalid 'jsonrpc' field")
+
+        if "id" not in rpc_response or rpc_response["id"] != request_id:
+            raise Exception("Invalid JSON-RPC response: missing or mismatched 'id' field")
+
+        # Check for error
+        if "error" in rpc_response:
+            error = rpc_response["error"]
+            error_code = error.get("code", -1)
+            error_message = error.get("message", "Unknown error")
+            error_data = error.get("data", None)
+            raise Exception(f"JSON-RPC error {error_code}: {error_message} (data: {error_data})")
+
+        # Return result
+        if "result" not in rpc_response:
+            raise Exception("Invalid JSON-RPC response: missing 'result' field")
+
+        return rpc_response["result"]
+
+    def build_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Build a JSON-RPC 2.0 batch array, one request envelope per call.
+
+        Args:
+            calls: List of (method, params) pairs
+
+        Returns:
+            Batch array of request envelopes
+        """
+        return [self.build_request(method, params) for method, params in calls]
+
+    def unwrap_batch(self, rpc_response: Any, batch: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Match batch responses to their requests by id.
+
+        Args:
+            rpc_response: Parsed batch response array
+            batch: Request envelopes that were sent
+
+        Returns:
+            List aligned with batch: each entry is the call's result, or the
+            Exception describing why that call failed
+
+        Raises:
+            Exception: If the server rejected the batch as a whole
+        """
+        if isinstance(rpc_response, dict) and "error" in rpc_response:
+            error = rpc_response["error"]
+            raise Exception(f"JSON-RPC error {error.get('code', -1)}: {error.get('message', 'Unknown error')}")
+        if not isinstance(rpc_response, list):
+            raise Exception("Invalid JSON-RPC response: expected a batch array")
+
+        by_id = {item.get("id"): item for item in rpc_response if isinstance(item, dict)}
+        results = []
+        for rpc_request in batch:
+            request_id = rpc_request["id"]
+            try:
+                if request_id not in by_id:
+                    raise Exception("Invalid JSON-RPC response: missing or mismatched 'id' field")
+                results.append(self.unwrap_response(by_id[request_id], request_id))
+            except Exception as e:
+                results.append(e)
+        return results
 
     def format_message(self, message_type: str, sender: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -173,6 +178,138 @@ class MCPClient:
         message.update(payload)
         return message
 
+    def generate_conversation_id(self, prefix: str) -> str:
+        """
+        Generate unique conversation ID for message tracing.
+
+        Args:
+            prefix: Prefix for conversation ID (e.g., "conv-round-1")
+
+        Returns:
+            Unique conversation ID string
+        """
+        unique_id = str(uuid.uuid4())[:8]
+        return f"{prefix}-{unique_id}"
+
+    def set_timeout(self, timeout_seconds: int) -> None:
+        """
+        Set default timeout for future requests.
+
+        Args:
+            timeout_seconds: Timeout in seconds
+        """
+        self.base_timeout = timeout_seconds
+
+
+class MCPClient(RpcEnvelopeMixin):
+    """
+    MCP Communication Client
+
+    Handles JSON-RPC 2.0 formatting, transport, and timeout enforcement.
+    Payloads go over HTTP by default; pass a LoopbackTransport to reach
+    agents running in the same process without HTTP.
+    """
+
+    def __init__(self, pool_config: Optional[HttpPoolConfig] = None, transport=None):
+        """
+        Initialize MCP client.
+
+        Args:
+            pool_config: HTTP connection pool settings (defaults to HttpPoolConfig())
+            transport: Message transport (defaults to HttpTransport(pool_config))
+        """
+        super().__init__()
+        self.transport = transport if transport is not None else HttpTransport(pool_config)
+
+    @property
+    def session_pool(self) -> Optional[HttpSessionPool]:
+        """HTTP session pool of the transport (None if it has none)"""
+        return getattr(self.transport, "session_pool", None)
+
+    def _post(self, payload: Any, endpoint: str, timeout: float) -> Any:
+        """
+        Deliver a JSON-RPC payload through the transport and return the parsed response.
+
+        Args:
+            payload: Request envelope or batch array
+            endpoint: Target endpoint
+            timeout: Timeout in seconds
+
+        Returns:
+            Parsed response body
+
+        Raises:
+            Exception: On network error, timeout, or non-JSON response
+        """
+        return self.transport.post(payload, endpoint, timeout)
+
+    def send_request(self, method: str, params: Dict[str, Any], endpoint: str, timeout: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Send JSON-RPC 2.0 request to specified endpoint and wait for response.
+
+        Args:
+            method: JSON-RPC method name (e.g., "register_player")
+            params: Message payload (already formatted with protocol fields)
+            endpoint: Target HTTP endpoint (e.g., "http://localhost:8000/mcp")
+            timeout: Optional timeout override (uses default if None)
+
+        Returns:
+            Response result object
+
+        Raises:
+            Exception: On network error, timeout, or JSON-RPC error
+        """
+        # Use provided timeout or default
+        actual_timeout = timeout if timeout is not None else self.base_timeout
+
+        # Construct JSON-RPC 2.0 request envelope
+        rpc_request = self.build_request(method, params)
+
+        rpc_response = self._post(rpc_request, endpoint, actual_timeout)
+        return self.unwrap_response(rpc_response, rpc_request["id"])
+
+    def send_batch(self, calls: List[Tuple[str, Dict[str, Any]]], endpoint: str,
+                   timeout: Optional[int] = None) -> List[Any]:
+        """
+        Send several JSON-RPC 2.0 requests to one endpoint in a single POST.
+
+        Calls are independent: one failing call does not affect the others.
+
+        Args:
+            calls: List of (method, params) pairs
+            endpoint: Target HTTP endpoint
+            timeout: Optional timeout override for the whole batch (uses default if None)
+
+        Returns:
+            List aligned with calls: each entry is the call's result, or the
+            Exception describing why that call failed
+
+        Raises:
+            Exception: On network error, timeout, or if the whole batch was rejected
+        """
+        if not calls:
+            return []
+
+        actual_timeout = timeout if timeout is not None else self.base_timeout
+        batch = self.build_batch(calls)
+        rpc_response = self._post(batch, endpoint, actual_timeout)
+        return self.unwrap_batch(rpc_response, batch)
+
+    def send_notification(self, method: str, params: Dict[str, Any], endpoint: str) -> None:
+        """
+        Send JSON-RPC 2.0 notification (no response expected, no id field).
+
+        Args:
+            method: JSON-RPC method name
+            params: Message payload
+            endpoint: Target endpoint
+        """
+        # Construct JSON-RPC 2.0 notification (without id field)
+        rpc_notification = self.build_notification(method, params)
+
+        # Fire-and-forget: the transport ignores the response and any error
+        self.transport.notify(rpc_notification, endpoint)
+
     def validate_response(self, response: Dict[str, Any], expected_message_type: Optional[str] = None) -> Dict[str, Any]:
         """
         Validate JSON-RPC response structure and protocol fields.
@@ -195,24 +332,30 @@ class MCPClient:
         # TODO: Return result or raise error
         pass
 
-    def generate_conversation_id(self, prefix: str) -> str:
+    def set_endpoint_codecs(self, endpoint: str, content_types: Optional[List[str]]) -> None:
         """
-        Generate unique conversation ID for message tracing.
+        Record the message encodings a peer advertised (e.g., at registration).
 
-        Args:
-            prefix: Prefix for conversation ID (e.g., "conv-round-1")
+        Later requests to the endpoint use the most preferred codec both sides
+        support (see message_codecs); transports without codecs ignore this.
 
-        Returns:
-            Unique conversation ID string
+        Args:
+            endpoint: Peer endpoint
+            content_types: Media types the peer accepts (None: JSON only)
         """
-        unique_id = str(uuid.uuid4())[:8]
-        return f"{prefix}-{unique_id}"
+        set_codecs = getattr(self.transport, "set_codecs", None)
+        if set_codecs is not None:
+            set_codecs(endpoint, content_types)
 
-    def set_timeout(self, timeout_seconds: int) -> None:
+    def pool_stats(self) -> Dict[str, int]:
         """
-        Set default timeout for future requests.
+        Get transport counters (see HttpSessionPool.stats / LoopbackTransport.stats).
 
-        Args:
-            timeout_seconds: Timeout in seconds
+        Returns:
+            Pool statistics dictionary
         """
-        self.base_timeout = timeout_seconds
+        return self.transport.stats()
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.transport.close()
@@ -0,0 +1,239 @@
+"""
+MCP Server
+
+Serving modes for agent /mcp endpoints.
+"flask" runs the agent's Flask app on the development server; "async" runs
+AsyncMCPServer, an asyncio HTTP/1.1 keep-alive server that feeds the same
+MethodDispatcher, so both modes share every handler module.
+
+Either mode can listen on a Unix domain socket instead of a TCP port, for
+agents sharing a host (see NetworkConfig.socket_dir), and can additionally
+accept persistent framed channels (see channel.ChannelServer).
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, Optional, Tuple
+
+from . import message_codecs
+from .channel import ChannelServer
+from .config_loader import ConfigLoader
+from .http_framing import DEFAULT_MAX_BODY_BYTES, BodyTooLarge, build_http_message, read_http_message
+from .jsonrpc import MethodDispatcher
+
+
+SERVER_MODES = ("flask", "async")
+
+# Threads for plain (blocking) handlers in AsyncMCPServer; see ConfigLoader.get_server_workers
+DEFAULT_SERVER_WORKERS = 256
+
+
+def _http_reply(codec: Optional[message_codecs.Codec], response: Any, status: int) -> Tuple[bytes, int, Dict[str, str]]:
+    """Encode a dispatcher result as (body, status, headers), in the request's codec"""
+    if codec is None:
+        return b"", 415, {"Accept": ", ".join(message_codecs.supported_content_types())}
+    if response is None:
+        return b"", status, {}
+    return codec.encode(response), status, {"Content-Type": codec.content_type}
+
+
+def handle_http(dispatcher: MethodDispatcher, content_type: Optional[str],
+                body: bytes) -> Tuple[bytes, int, Dict[str, str]]:
+    """
+    Answer one /mcp POST body.
+
+    The body is decoded with the codec named by its Content-Type (JSON when
+    unspecified) and the response is encoded the same way; an unsupported
+    binary Content-Type is answered 415.
+
+    Args:
+        dispatcher: Agent's method table
+        content_type: Request Content-Type header
+        body: Raw request body
+
+    Returns:
+        Tuple of (response body, HTTP status, response headers)
+    """
+    codec, data = message_codecs.decode_request(content_type, body)
+    if codec is None:
+        return _http_reply(None, None, 415)
+    response, status = dispatcher.handle(data)
+    return _http_reply(codec, response, status)
+
+
+async def handle_http_async(dispatcher: MethodDispatcher, content_type: Optional[str], body: bytes,
+                            executor: Optional[ThreadPoolExecutor] = None) -> Tuple[bytes, int, Dict[str, str]]:
+    """Async counterpart of handle_http(); plain handlers run in executor"""
+    codec, data = message_codecs.decode_request(content_type, body)
+    if codec is None:
+        return _http_reply(None, None, 415)
+    response, status = await dispatcher.handle_async(data, executor)
+    return _http_reply(codec, response, status)
+
+
+class AsyncMCPServer:
+    """
+    asyncio JSON-RPC 2.0 server for one agent.
+
+    Each connection is served by its own task and kept open between requests.
+    Coroutine handlers cost one task per call; plain handlers block a thread
+    of the server's own pool, so at most `workers` of them run at once.
+    """
+
+    def __init__(self, dispatcher: MethodDispatcher, host: str = "0.0.0.0", port: int = 0,
+                 path: str = "/mcp", unix_socket: Optional[str] = None,
+                 workers: int = DEFAULT_SERVER_WORKERS, max_body_bytes: int = DEFAULT_MAX_BODY_BYTES):
+        """
+        Initialize AsyncMCPServer.
+
+        Args:
+            dispatcher: Method table requests are dispatched through
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            path: HTTP path serving JSON-RPC requests
+            unix_socket: Socket file to listen on instead of host/port
+            workers: Threads running plain (blocking) handlers concurrently
+            max_body_bytes: Largest request body accepted (larger requests get 413)
+        """
+        self.dispatcher = dispatcher
+        self.workers = workers
+        self.max_body_bytes = max_body_bytes
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.host = host
+        self.port = port
+        self.path = path
+        self.unix_socket = unix_socket
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Bind the listening socket and start accepting connections"""
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="mcp-handler")
+        if self.unix_socket is not None:
+            # A socket file left by a previous run would make bind() fail
+            if os.path.exists(self.unix_socket):
+                os.unlink(self.unix_socket)
+            self._server = await asyncio.start_unix_server(self._serve_connection, self.unix_socket)
+            return
+        self._server = await asyncio.start_server(self._serve_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start (if needed) and serve until cancelled"""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self.unix_socket is not None and os.path.exists(self.unix_socket):
+            os.unlink(self.unix_socket)
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it"""
+        try:
+            while True:
+                try:
+                    message = await read_http_message(reader, is_response=False,
+                                                      max_body_bytes=self.max_body_bytes)
+                except BodyTooLarge:
+                    # The body is left unread, so the connection cannot be reused
+                    writer.write(self._response(413, b"", keep_alive=False))
+                    break
+                except (ValueError, asyncio.IncompleteReadError):
+                    writer.write(self._response(400, b"", keep_alive=False))
+                    break
+                if message is None:
+                    break
+
+                status, body, headers = await self._handle(message.method, message.path,
+                                                           message.headers.get("content-type"), message.body)
+                writer.write(self._response(status, body, message.keep_alive, headers))
+                await writer.drain()
+                if not message.keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, method: str, path: str, content_type: Optional[str], body: bytes) -> tuple:
+        """
+        Run one HTTP request through the dispatcher.
+
+        Returns:
+            Tuple of (HTTP status, response body, response headers)
+        """
+        if path.split("?", 1)[0] != self.path:
+            return 404, b"", {}
+        if method != "POST":
+            return 405, b"", {}
+
+        body, status, headers = await handle_http_async(self.dispatcher, content_type, body, self._executor)
+        return status, body, headers
+
+    @staticmethod
+    def _response(status: int, body: bytes, keep_alive: bool, headers: Optional[Dict[str, str]] = None) -> bytes:
+        """Serialize an HTTP/1.1 response"""
+        return build_http_message(
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+            {"Connection": "keep-alive" if keep_alive else "close", **(headers or {})},
+            body
+        )
+
+
+def serve(app, dispatcher: MethodDispatcher, port: int, mode: str = "flask", host: str = "0.0.0.0",
+          unix_socket: Optional[str] = None, channel_port: Optional[int] = None,
+          workers: Optional[int] = None, max_body_bytes: Optional[int] = None) -> None:
+    """
+    Serve an agent's /mcp endpoint until interrupted.
+
+    Args:
+        app: Agent's Flask app (used in "flask" mode)
+        dispatcher: Agent's method table (used in "async" mode)
+        port: Port to listen on
+        mode: "flask" or "async"
+        host: Interface to bind
+        unix_socket: Socket file to listen on instead of host/port
+        channel_port: Also accept framed channels on this port (None disables)
+        workers: Handler threads in "async" mode (None reads AGENT_SERVER_WORKERS)
+        max_body_bytes: Largest request body, answered 413 above it (None reads AGENT_MAX_BODY_BYTES)
+    """
+    if mode not in SERVER_MODES:
+        raise ValueError(f"Unknown server mode: {mode} (expected one of {', '.join(SERVER_MODES)})")
+
+    if channel_port is not None:
+        # Runs on background threads alongside the HTTP server
+        ChannelServer(dispatcher, host, channel_port).start()
+
+    if unix_socket is not None:
+        os.makedirs(os.path.dirname(unix_socket) or ".", exist_ok=True)
+
+    if max_body_bytes is None:
+        max_body_bytes = ConfigLoader.get_max_body_bytes()
+
+    if mode == "async":
+        try:
+            if workers is None:
+                workers = ConfigLoader.get_server_workers()
+            asyncio.run(AsyncMCPServer(dispatcher, host, port, unix_socket=unix_socket,
+                                       workers=workers, max_body_bytes=max_body_bytes).serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return
+
+    # Flask answers 413 for larger bodies when the handler reads the request
+    app.config["MAX_CONTENT_LENGTH"] = max_body_bytes
+    if unix_socket is not None:
+        # Werkzeug binds a Unix socket for unix:// hosts
+        app.run(host=f"unix://{unix_socket}", port=port, debug=False)
+    else:
+        app.run(host=host, port=port, debug=False)
@@ -0,0 +1,178 @@
+"""
+Message Codecs
+
+Wire encodings for JSON-RPC message bodies, selected by HTTP Content-Type.
+
+JSON is always available. MessagePack is used when the msgpack package is
+installed; agents advertise the content types they accept ("codecs" in
+player_meta / referee_meta at registration, and in a player's GAME_JOIN_ACK
+so the referee switches for the rest of the match) and senders switch per
+endpoint.
+A peer that cannot decode a binary body answers 415, and the sender falls
+back to JSON for that endpoint.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without msgpack
+    msgpack = None
+
+from . import json_codec
+
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Binary media types this module knows, whether or not their library is installed
+KNOWN_BINARY_TYPES = (MSGPACK_CONTENT_TYPE, "application/x-msgpack")
+
+
+class UnsupportedCodecError(ValueError):
+    """Raised for a known binary Content-Type whose codec is not installed"""
+
+
+class Codec:
+    """One wire encoding: content type plus encode/decode functions"""
+
+    def __init__(self, content_type: str, encode: Callable[[Any], bytes], decode: Callable[[bytes], Any]):
+        """
+        Initialize Codec.
+
+        Args:
+            content_type: Media type sent in Content-Type / Accept headers
+            encode: Object -> bytes
+            decode: Bytes -> object (raises ValueError on malformed input)
+        """
+        self.content_type = content_type
+        self.encode = encode
+        self.decode = decode
+
+    def decode_or_none(self, body: bytes) -> Optional[Any]:
+        """Decode a request body, giving None when it is malformed (answered as a parse error)"""
+        try:
+            return self.decode(body)
+        except Exception:
+            return None
+
+    def __repr__(self) -> str:
+        return f"Codec({self.content_type!r})"
+
+
+JSON = Codec(JSON_CONTENT_TYPE, json_codec.dumpb, json_codec.loads)
+
+# Content type -> codec, in order of preference (most preferred first)
+_CODECS: Dict[str, Codec] = {}
+
+
+def register_codec(codec: Codec, aliases: Iterable[str] = ()) -> None:
+    """
+    Make a codec available for negotiation, preferred over those registered before it.
+
+    Args:
+        codec: Codec to add
+        aliases: Other media types decoded by the same codec
+    """
+    global _CODECS
+    entries = {codec.content_type: codec}
+    entries.update({alias: codec for alias in aliases})
+    _CODECS = {**entries, **{k: v for k, v in _CODECS.items() if k not in entries}}
+
+
+def unregister_codec(content_type: str) -> None:
+    """
+    Remove a codec (and its aliases) from negotiation.
+
+    Args:
+        content_type: Codec's primary media type
+    """
+    global _CODECS
+    _CODECS = {k: v for k, v in _CODECS.items() if v.content_type != content_type}
+
+
+register_codec(JSON)
+if msgpack is not None:
+    register_codec(Codec(MSGPACK_CONTENT_TYPE, msgpack.packb,
+                         lambda body: msgpack.unpackb(body, raw=False, strict_map_key=False)),
+                   aliases=("application/x-msgpack",))
+
+
+def supported_content_types() -> List[str]:
+    """
+    Media types this process can decode, most preferred first (advertised at registration).
+
+    Returns:
+        List of primary content types
+    """
+    seen = []
+    for codec in _CODECS.values():
+        if codec.content_type not in seen:
+            seen.append(codec.content_type)
+    return seen
+
+
+def _media_type(content_type: Optional[str]) -> str:
+    """Strip parameters (e.g. "; charset=utf-8") and normalize case"""
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+def codec_for(content_type: Optional[str]) -> Codec:
+    """
+    Get the codec for a request or response Content-Type.
+
+    Anything that is not a registered binary type is treated as JSON, so
+    clients that omit or mislabel Content-Type keep working.
+
+    Args:
+        content_type: Content-Type header value (may be None)
+
+    Returns:
+        Codec to decode the body with (and encode the reply with)
+
+    Raises:
+        UnsupportedCodecError: For a known binary type whose library is missing
+    """
+    media_type = _media_type(content_type)
+    codec = _CODECS.get(media_type)
+    if codec is not None:
+        return codec
+    if media_type in KNOWN_BINARY_TYPES:
+        raise UnsupportedCodecError(f"Unsupported Content-Type: {media_type}")
+    return JSON
+
+
+def negotiate(advertised: Optional[Iterable[str]]) -> Codec:
+    """
+    Pick the codec to send to a peer.
+
+    Args:
+        advertised: Media types the peer accepts (None or empty: JSON only)
+
+    Returns:
+        The locally most preferred codec the peer also accepts, else JSON
+    """
+    accepted = {_media_type(content_type) for content_type in advertised or ()}
+    for media_type, codec in _CODECS.items():
+        if media_type in accepted:
+            return codec
+    return JSON
+
+
+def decode_request(content_type: Optional[str], body: bytes) -> Tuple[Optional[Codec], Any]:
+    """
+    Decode an incoming /mcp request body.
+
+    Args:
+        content_type: Request Content-Type
+        body: Raw request body
+
+    Returns:
+        Tuple of (codec, decoded request or None if malformed); codec is None
+        when the Content-Type is unsupported (answer 415)
+    """
+    try:
+        codec = codec_for(content_type)
+    except UnsupportedCodecError:
+        return None, None
+    return codec, codec.decode_or_none(body)
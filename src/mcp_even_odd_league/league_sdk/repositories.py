@@ -3,31 +3,218 @@ Data Repositories
 
 Repository classes for data persistence.
 Based on class_map.md - Repository pattern for data layer access.
+
+Each repository stores JSON documents under SHARED/data. Writes are atomic
+(temp file, fsync, rename), so a crash leaves either the old or the new
+document, never a torn one. The last loaded or saved document is cached and
+revalidated against the file's mtime, so repeated load() calls do not touch
+disk. With write_behind_sec > 0, save() only updates the cache and one
+coalesced write happens after the delay (or on flush() and at exit).
+
+Documents returned by load() are the cached objects: modify them only to
+save them back.
+
+With STORAGE_BACKEND=sqlite the same classes read and write one SQLite
+database instead (see sqlite_store); JSON files remain the default.
 """
 
+import atexit
+import os
+import threading
+import weakref
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
+
+from . import json_codec, sqlite_store
+from .config_loader import ConfigLoader
+
+
+STORAGE_BACKENDS = ("json", "sqlite")
+
+
+def atomic_write_json(path: Path, document: Any) -> None:
+    """
+    Write a JSON document so readers and crashes see either the old or the new file.
+
+    Args:
+        path: Target file (parent directories are created)
+        document: JSON-serializable document
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(json_codec.dumpb(document))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Persist the rename itself
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:  # pragma: no cover - platforms without directory handles
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:  # pragma: no cover - filesystems that cannot fsync directories
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class JsonDocument:
+    """
+    One JSON file with an mtime-validated cache and optional write-behind.
+    """
+
+    def __init__(self, path: Path, default: Callable[[], Any], write_behind_sec: float = 0.0):
+        """
+        Initialize JsonDocument.
+
+        Args:
+            path: File holding the document
+            default: Factory for the document when the file does not exist
+            write_behind_sec: Delay before a save reaches disk (0 writes immediately)
+        """
+        self.path = path
+        self.default = default
+        self.write_behind_sec = write_behind_sec
+        self.writes = 0
+        # Held across load-modify-save sequences (re-entrant)
+        self.lock = threading.RLock()
+        self._cached: Any = None
+        self._signature: Optional[tuple] = None
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        if write_behind_sec:
+            _write_behind_documents.add(self)
+
+    def _stat_signature(self) -> Optional[tuple]:
+        """(mtime_ns, size, inode) of the file, or None if it does not exist"""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def load(self) -> Any:
+        """
+        Get the document, reading the file only if it changed since last time.
+
+        Returns:
+            Cached document (unsaved write-behind changes included)
+        """
+        with self.lock:
+            if self._dirty:
+                return self._cached
+            signature = self._stat_signature()
+            if self._cached is not None and signature == self._signature:
+                return self._cached
+
+            if signature is None:
+                self._cached = self.default()
+            else:
+                self._cached = json_codec.loads(self.path.read_bytes())
+            self._signature = signature
+            return self._cached
+
+    def save(self, document: Any) -> None:
+        """
+        Replace the document, writing now or after the write-behind delay.
+
+        Args:
+            document: JSON-serializable document
+        """
+        with self.lock:
+            self._cached = document
+            if not self.write_behind_sec:
+                self._write()
+                return
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.write_behind_sec, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write a pending write-behind save now"""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty:
+                self._write()
+
+    def _write(self) -> None:
+        atomic_write_json(self.path, self._cached)
+        self._signature = self._stat_signature()
+        self._dirty = False
+        self.writes += 1
+
+
+_write_behind_documents: "weakref.WeakSet[JsonDocument]" = weakref.WeakSet()
+
+
+@atexit.register
+def flush_repositories() -> None:
+    """Write every pending write-behind save (runs at exit)"""
+    for document in list(_write_behind_documents):
+        document.flush()
+
+
+def _write_behind(write_behind_sec: Optional[float]) -> float:
+    """Resolve a repository's write-behind delay (None reads DATA_WRITE_BEHIND_SEC)"""
+    return ConfigLoader.get_write_behind_sec() if write_behind_sec is None else write_behind_sec
+
+
+def _sqlite_store(backend: Optional[str], db_path: Optional[Path]) -> Optional[sqlite_store.SqliteStore]:
+    """
+    Resolve a repository's backend: None for JSON files, else the shared SQLite store.
+
+    Args:
+        backend: "json" or "sqlite" (None reads STORAGE_BACKEND)
+        db_path: SQLite database (None reads DB_PATH)
+
+    Raises:
+        ValueError: On an unknown backend
+    """
+    backend = backend or ConfigLoader.get_storage_backend()
+    if backend == "json":
+        return None
+    if backend == "sqlite":
+        return sqlite_store.get_store(db_path or ConfigLoader.get_db_path(), ConfigLoader.get_db_batch_size(),
+                                      ConfigLoader.get_db_batch_ms(), ConfigLoader.get_db_busy_timeout_ms())
+    raise ValueError(f"Unknown storage backend: {backend} (expected one of {', '.join(STORAGE_BACKENDS)})")
 
 
 class StandingsRepository:
     """Manages standings.json (load, save, update_player)"""
 
-    def __init__(self, league_id: str, data_root: Path = None):
+    def __init__(self, league_id: str, data_root: Path = None, write_behind_sec: Optional[float] = None,
+                 backend: Optional[str] = None, db_path: Optional[Path] = None):
         """
         Initialize StandingsRepository.
 
         Args:
             league_id: League identifier
             data_root: Root directory for data files (defaults to SHARED/data)
+            write_behind_sec: Coalesce saves for this many seconds (defaults from config; 0 disables)
+            backend: "json" or "sqlite" (defaults to STORAGE_BACKEND)
+            db_path: SQLite database file (defaults to DB_PATH)
         """
         self.league_id = league_id
         if data_root is None:
-            # TODO: Set default to SHARED/data
             self.data_root = Path("SHARED/data")
         else:
             self.data_root = data_root
 
         self.file_path = self.data_root / "leagues" / league_id / "standings.json"
+        self._store = _sqlite_store(backend, db_path)
+        self._document = None if self._store else JsonDocument(
+            self.file_path, lambda: {"league_id": self.league_id, "standings": []}, _write_behind(write_behind_sec))
 
     def load(self) -> Dict[str, Any]:
         """
@@ -35,26 +222,22 @@ class StandingsRepository:
 
         Returns:
             Standings dictionary
-
-        TODO: Implement JSON loading
         """
-        # TODO: Load from self.file_path
-        return {
-            "league_id": self.league_id,
-            "standings": []
-        }
+        if self._store:
+            return self._store.load_standings(self.league_id)
+        return self._document.load()
 
     def save(self, standings: Dict[str, Any]) -> None:
         """
-        Save standings to file.
+        Save standings to file atomically.
 
         Args:
             standings: Standings dictionary
-
-        TODO: Implement atomic JSON writing
         """
-        # TODO: Write to self.file_path atomically
-        pass
+        if self._store:
+            self._store.save_standings(self.league_id, standings)
+            return
+        self._document.save(standings)
 
     def update_player(self, player_id: str, wins: int, losses: int, draws: int, points: int) -> None:
         """
@@ -66,23 +249,41 @@ class StandingsRepository:
             losses: Number of losses
             draws: Number of draws
             points: Total points
-
-        TODO: Implement player statistics update
         """
-        # TODO: Load standings, update player, save
-        pass
+        if self._store:
+            self._store.update_standing(self.league_id, player_id, wins, losses, draws, points)
+            return
+        with self._document.lock:
+            standings = self.load()
+            entry = next((row for row in standings["standings"] if row["player_id"] == player_id), None)
+            if entry is None:
+                entry = {"player_id": player_id}
+                standings["standings"].append(entry)
+            entry.update(wins=wins, losses=losses, draws=draws, points=points)
+            self.save(standings)
+
+    def flush(self) -> None:
+        """Write pending write-behind changes (or commit the SQLite batch) now"""
+        if self._store:
+            self._store.flush()
+        else:
+            self._document.flush()
 
 
 class RoundsRepository:
     """Manages rounds.json"""
 
-    def __init__(self, league_id: str, data_root: Path = None):
+    def __init__(self, league_id: str, data_root: Path = None, write_behind_sec: Optional[float] = None,
+                 backend: Optional[str] = None, db_path: Optional[Path] = None):
         """
         Initialize RoundsRepository.
 
         Args:
             league_id: League identifier
             data_root: Root directory for data files
+            write_behind_sec: Coalesce saves for this many seconds (defaults from config; 0 disables)
+            backend: "json" or "sqlite" (defaults to STORAGE_BACKEND)
+            db_path: SQLite database file (defaults to DB_PATH)
         """
         self.league_id = league_id
         if data_root is None:
@@ -91,6 +292,9 @@ class RoundsRepository:
             self.data_root = data_root
 
         self.file_path = self.data_root / "leagues" / league_id / "rounds.json"
+        self._store = _sqlite_store(backend, db_path)
+        self._document = None if self._store else JsonDocument(
+            self.file_path, lambda: {"league_id": self.league_id, "rounds": []}, _write_behind(write_behind_sec))
 
     def load(self) -> Dict[str, Any]:
         """
@@ -98,38 +302,45 @@ class RoundsRepository:
 
         Returns:
             Rounds dictionary
-
-        TODO: Implement JSON loading
         """
-        # TODO: Load from self.file_path
-        return {
-            "league_id": self.league_id,
-            "rounds": []
-        }
+        if self._store:
+            return self._store.load_rounds(self.league_id)
+        return self._document.load()
 
     def save(self, rounds: Dict[str, Any]) -> None:
         """
-        Save rounds to file.
+        Save rounds to file atomically.
 
         Args:
             rounds: Rounds dictionary
-
-        TODO: Implement atomic JSON writing
         """
-        # TODO: Write to self.file_path atomically
-        pass
+        if self._store:
+            self._store.save_rounds(self.league_id, rounds)
+            return
+        self._document.save(rounds)
+
+    def flush(self) -> None:
+        """Write pending write-behind changes (or commit the SQLite batch) now"""
+        if self._store:
+            self._store.flush()
+        else:
+            self._document.flush()
 
 
 class MatchRepository:
     """Manages match data files"""
 
-    def __init__(self, league_id: str, data_root: Path = None):
+    def __init__(self, league_id: str, data_root: Path = None, write_behind_sec: Optional[float] = None,
+                 backend: Optional[str] = None, db_path: Optional[Path] = None):
         """
         Initialize MatchRepository.
 
         Args:
             league_id: League identifier
             data_root: Root directory for data files
+            write_behind_sec: Coalesce saves for this many seconds (defaults from config; 0 disables)
+            backend: "json" or "sqlite" (defaults to STORAGE_BACKEND)
+            db_path: SQLite database file (defaults to DB_PATH)
         """
         self.league_id = league_id
         if data_root is None:
@@ -138,6 +349,23 @@ class MatchRepository:
             self.data_root = data_root
 
         self.matches_dir = self.data_root / "matches" / league_id
+        self.write_behind_sec = _write_behind(write_behind_sec)
+        self._store = _sqlite_store(backend, db_path)
+        self._documents: Dict[str, JsonDocument] = {}
+        self._lock = threading.Lock()
+
+    def _document(self, match_id: str) -> JsonDocument:
+        """Document for one match file"""
+        document = self._documents.get(match_id)
+        if document is None:
+            with self._lock:
+                document = self._documents.get(match_id)
+                if document is None:
+                    document = self._documents[match_id] = JsonDocument(
+                        self.matches_dir / f"{match_id}.json",
+                        lambda: {"match_id": match_id, "league_id": self.league_id},
+                        self.write_behind_sec)
+        return document
 
     def load(self, match_id: str) -> Dict[str, Any]:
         """
@@ -148,39 +376,73 @@ class MatchRepository:
 
         Returns:
             Match data dictionary
-
-        TODO: Implement JSON loading
         """
-        # TODO: Load from self.matches_dir / f"{match_id}.json"
-        return {
-            "match_id": match_id,
-            "league_id": self.league_id
-        }
+        if self._store:
+            match_data = self._store.load_match(self.league_id, match_id)
+            return match_data if match_data is not None else {"match_id": match_id, "league_id": self.league_id}
+        return self._document(match_id).load()
 
     def save(self, match_id: str, match_data: Dict[str, Any]) -> None:
         """
-        Save match data to file.
+        Save match data to file atomically.
 
         Args:
             match_id: Match identifier
             match_data: Match data dictionary
+        """
+        if self._store:
+            self._store.save_match(self.league_id, match_id, match_data)
+            return
+        self._document(match_id).save(match_data)
 
-        TODO: Implement atomic JSON writing
+    def find(self, round_id: Optional[int] = None, player_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        # TODO: Write to self.matches_dir / f"{match_id}.json" atomically
-        pass
+        Find saved matches by round and/or player.
+
+        Indexed with the SQLite backend; the JSON backend reads every match file.
+
+        Args:
+            round_id: Only matches of this round
+            player_id: Only matches involving this player (as player_A_id or player_B_id)
+
+        Returns:
+            Match data dictionaries ordered by round and match id
+        """
+        if self._store:
+            return self._store.find_matches(self.league_id, round_id, player_id)
+        matches = [self.load(path.stem) for path in self.matches_dir.glob("*.json")]
+        for document in list(self._documents.values()):
+            if not document.path.exists():
+                matches.append(document.load())  # write-behind save not on disk yet
+        return sorted(
+            (m for m in matches
+             if (round_id is None or m.get("round_id") == round_id)
+             and (player_id is None or player_id in (m.get("player_A_id"), m.get("player_B_id")))),
+            key=lambda m: (m.get("round_id") or 0, m.get("match_id", "")))
+
+    def flush(self) -> None:
+        """Write pending write-behind changes (or commit the SQLite batch) now"""
+        if self._store:
+            self._store.flush()
+            return
+        for document in list(self._documents.values()):
+            document.flush()
 
 
 class PlayerHistoryRepository:
     """Manages player history.json"""
 
-    def __init__(self, player_id: str, data_root: Path = None):
+    def __init__(self, player_id: str, data_root: Path = None, write_behind_sec: Optional[float] = None,
+                 backend: Optional[str] = None, db_path: Optional[Path] = None):
         """
         Initialize PlayerHistoryRepository.
 
         Args:
             player_id: Player identifier
             data_root: Root directory for data files
+            write_behind_sec: Coalesce saves for this many seconds (defaults from config; 0 disables)
+            backend: "json" or "sqlite" (defaults to STORAGE_BACKEND)
+            db_path: SQLite database file (defaults to DB_PATH)
         """
         self.player_id = player_id
         if data_root is None:
@@ -189,6 +451,9 @@ class PlayerHistoryRepository:
             self.data_root = data_root
 
         self.file_path = self.data_root / "players" / player_id / "history.json"
+        self._store = _sqlite_store(backend, db_path)
+        self._document = None if self._store else JsonDocument(
+            self.file_path, lambda: {"player_id": self.player_id, "matches": []}, _write_behind(write_behind_sec))
 
     def load(self) -> Dict[str, Any]:
         """
@@ -196,26 +461,22 @@ class PlayerHistoryRepository:
 
         Returns:
             History dictionary
-
-        TODO: Implement JSON loading
         """
-        # TODO: Load from self.file_path
-        return {
-            "player_id": self.player_id,
-            "matches": []
-        }
+        if self._store:
+            return self._store.load_history(self.player_id)
+        return self._document.load()
 
     def save(self, history: Dict[str, Any]) -> None:
         """
-        Save player history to file.
+        Save player history to file atomically.
 
         Args:
             history: History dictionary
-
-        TODO: Implement atomic JSON writing
         """
-        # TODO: Write to self.file_path atomically
-        pass
+        if self._store:
+            self._store.save_history(self.player_id, history)
+            return
+        self._document.save(history)
 
     def add_match(self, match_data: Dict[str, Any]) -> None:
         """
@@ -223,8 +484,18 @@ class PlayerHistoryRepository:
 
         Args:
             match_data: Match data to add
-
-        TODO: Implement append to history
         """
-        # TODO: Load history, append match, save
-        pass
+        if self._store:
+            self._store.append_history(self.player_id, match_data)
+            return
+        with self._document.lock:
+            history = self.load()
+            history["matches"].append(match_data)
+            self.save(history)
+
+    def flush(self) -> None:
+        """Write pending write-behind changes (or commit the SQLite batch) now"""
+        if self._store:
+            self._store.flush()
+        else:
+            self._document.flush()
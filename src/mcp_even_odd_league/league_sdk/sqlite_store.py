@@ -0,0 +1,361 @@
+"""
+SQLite Store
+
+SQLite backend for the repositories (STORAGE_BACKEND=sqlite).
+
+One database (DB_PATH) holds every league's standings, rounds, matches and
+player histories, so a large league does not create a file per match or
+rewrite the whole standings document per result. The database runs in WAL
+mode; writes are grouped into transactions of up to batch_size statements,
+committed when the batch fills, batch_ms after it was opened (so an idle
+agent never holds the write lock or unsaved data for long), on flush() and
+at exit. Readers on the same store see uncommitted writes; other processes
+see them once committed.
+
+Several agents (separate processes) share the default database. A batch
+starts with BEGIN IMMEDIATE, taking the write lock up front, and a writer
+that finds it held waits up to busy_timeout_ms for the other batch to commit.
+Each save runs inside a SAVEPOINT within the batch: a save that fails is
+rolled back on its own and re-raised, leaving the batch's earlier writes to
+be committed intact.
+
+Top-level document fields other than the row lists (e.g. a version or
+last_updated field of standings.json) are kept in the documents table, so
+documents round-trip as they do with the JSON backend.
+
+Matches are indexed by (league_id, round_id) and by each player_id.
+"""
+
+import atexit
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from . import json_codec
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS standings (
+    league_id TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    points INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (league_id, player_id)
+);
+CREATE INDEX IF NOT EXISTS idx_standings_player ON standings (player_id);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    league_id TEXT NOT NULL,
+    round_id INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (league_id, round_id)
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    league_id TEXT NOT NULL,
+    match_id TEXT NOT NULL,
+    round_id INTEGER,
+    player_A_id TEXT,
+    player_B_id TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (league_id, match_id)
+);
+CREATE INDEX IF NOT EXISTS idx_matches_round ON matches (league_id, round_id);
+CREATE INDEX IF NOT EXISTS idx_matches_player_a ON matches (player_A_id);
+CREATE INDEX IF NOT EXISTS idx_matches_player_b ON matches (player_B_id);
+
+CREATE TABLE IF NOT EXISTS player_history (
+    player_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    league_id TEXT,
+    match_id TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (player_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_history_league ON player_history (league_id);
+
+CREATE TABLE IF NOT EXISTS documents (
+    kind TEXT NOT NULL,
+    owner_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, owner_id)
+);
+"""
+
+STAT_COLUMNS = ("wins", "losses", "draws", "points")
+
+
+class SqliteStore:
+    """Shared connection to one league database with batched commits"""
+
+    def __init__(self, db_path: Path, batch_size: int = 100, batch_ms: float = 50,
+                 busy_timeout_ms: float = 5000):
+        """
+        Initialize SqliteStore, creating the database and schema if needed.
+
+        Args:
+            db_path: Database file (parent directories are created)
+            batch_size: Writes per transaction (1 commits every write)
+            batch_ms: Longest a transaction stays open before it is committed
+            busy_timeout_ms: How long a write waits for another process's transaction
+        """
+        self.db_path = Path(db_path)
+        self.batch_size = max(1, batch_size)
+        self.batch_ms = batch_ms
+        self.commits = 0
+        self._pending = 0
+        self._opened = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # isolation_level=None: transactions are opened explicitly by _begin()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=busy_timeout_ms / 1000,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL plus NORMAL is durable across application crashes; only an OS crash can lose the last commits
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def _begin(self) -> None:
+        """Open a write transaction (taking the database write lock) unless one is open"""
+        if self._conn.in_transaction:
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._opened = time.monotonic()
+        if self.batch_size > 1:
+            self._timer = threading.Timer(self.batch_ms / 1000, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    @contextmanager
+    def _write(self) -> Iterator[None]:
+        """
+        Run one save inside the batch transaction as a savepoint (caller holds self._lock).
+
+        If the save raises, only its own statements are rolled back; earlier
+        writes in the batch are kept for the next commit.
+        """
+        self._begin()
+        self._conn.execute("SAVEPOINT write")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK TO write")
+            self._conn.execute("RELEASE write")
+            raise
+        self._conn.execute("RELEASE write")
+
+    def _wrote(self, statements: int = 1) -> None:
+        """Count writes in the open transaction and commit when the batch is full or old"""
+        self._pending += statements
+        if self._pending >= self.batch_size or (time.monotonic() - self._opened) * 1000 >= self.batch_ms:
+            self._commit()
+
+    def _commit(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._conn.in_transaction:
+            self._conn.execute("COMMIT")
+            self.commits += 1
+        self._pending = 0
+
+    def _load_document(self, kind: str, owner_id: str) -> Dict[str, Any]:
+        row = self._conn.execute("SELECT data FROM documents WHERE kind = ? AND owner_id = ?",
+                                 (kind, owner_id)).fetchone()
+        return json_codec.loads(row[0]) if row else {}
+
+    def _save_document(self, kind: str, owner_id: str, document: Dict[str, Any], rows_field: str) -> int:
+        """Store a document's top-level fields other than its row list; returns statements run"""
+        fields = {k: v for k, v in document.items() if k != rows_field}
+        self._conn.execute("INSERT OR REPLACE INTO documents (kind, owner_id, data) VALUES (?, ?, ?)",
+                           (kind, owner_id, json_codec.dumps(fields)))
+        return 1
+
+    def flush(self) -> None:
+        """Commit the open transaction"""
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        """Commit and close the connection"""
+        with self._lock:
+            self._commit()
+            self._conn.close()
+
+    # Standings
+
+    def load_standings(self, league_id: str) -> Dict[str, Any]:
+        """A league's standings document, rows in insertion order"""
+        with self._lock:
+            document = self._load_document("standings", league_id)
+            rows = self._conn.execute(
+                "SELECT player_id, wins, losses, draws, points, data FROM standings "
+                "WHERE league_id = ? ORDER BY rowid", (league_id,)).fetchall()
+        document.setdefault("league_id", league_id)
+        document["standings"] = [{**json_codec.loads(data), "player_id": player_id, "wins": wins,
+                                  "losses": losses, "draws": draws, "points": points}
+                                 for player_id, wins, losses, draws, points, data in rows]
+        return document
+
+    def save_standings(self, league_id: str, document: Dict[str, Any]) -> None:
+        """Replace a league's standings document"""
+        rows = [(league_id, row["player_id"], *(row.get(column, 0) for column in STAT_COLUMNS),
+                 json_codec.dumps({k: v for k, v in row.items() if k != "player_id" and k not in STAT_COLUMNS}))
+                for row in document.get("standings", [])]
+        with self._lock:
+            with self._write():
+                statements = self._save_document("standings", league_id, document, "standings")
+                self._conn.execute("DELETE FROM standings WHERE league_id = ?", (league_id,))
+                self._conn.executemany(
+                    "INSERT INTO standings (league_id, player_id, wins, losses, draws, points, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._wrote(statements + 1 + len(rows))
+
+    def update_standing(self, league_id: str, player_id: str, wins: int, losses: int, draws: int,
+                        points: int) -> None:
+        """Set one player's statistics (adding the player if new)"""
+        with self._lock:
+            with self._write():
+                self._conn.execute(
+                    "INSERT INTO standings (league_id, player_id, wins, losses, draws, points) "
+                    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (league_id, player_id) DO UPDATE SET "
+                    "wins = excluded.wins, losses = excluded.losses, draws = excluded.draws, points = excluded.points",
+                    (league_id, player_id, wins, losses, draws, points))
+            self._wrote()
+
+    # Rounds
+
+    def load_rounds(self, league_id: str) -> Dict[str, Any]:
+        """A league's rounds document, rounds by round_id"""
+        with self._lock:
+            document = self._load_document("rounds", league_id)
+            rows = self._conn.execute(
+                "SELECT data FROM rounds WHERE league_id = ? ORDER BY round_id", (league_id,)).fetchall()
+        document.setdefault("league_id", league_id)
+        document["rounds"] = [json_codec.loads(data) for data, in rows]
+        return document
+
+    def save_rounds(self, league_id: str, document: Dict[str, Any]) -> None:
+        """Replace a league's rounds document (round_id defaults to the position, from 1)"""
+        rows = [(league_id, round_data.get("round_id", position), json_codec.dumps(round_data))
+                for position, round_data in enumerate(document.get("rounds", []), 1)]
+        with self._lock:
+            with self._write():
+                statements = self._save_document("rounds", league_id, document, "rounds")
+                self._conn.execute("DELETE FROM rounds WHERE league_id = ?", (league_id,))
+                self._conn.executemany("INSERT INTO rounds (league_id, round_id, data) VALUES (?, ?, ?)", rows)
+            self._wrote(statements + 1 + len(rows))
+
+    # Matches
+
+    def load_match(self, league_id: str, match_id: str) -> Optional[Dict[str, Any]]:
+        """One match document, or None if unknown"""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM matches WHERE league_id = ? AND match_id = ?",
+                                     (league_id, match_id)).fetchone()
+        return json_codec.loads(row[0]) if row else None
+
+    def save_match(self, league_id: str, match_id: str, match_data: Dict[str, Any]) -> None:
+        """Insert or replace one match document"""
+        with self._lock:
+            with self._write():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO matches (league_id, match_id, round_id, player_A_id, player_B_id, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (league_id, match_id, match_data.get("round_id"), match_data.get("player_A_id"),
+                     match_data.get("player_B_id"), json_codec.dumps(match_data)))
+            self._wrote()
+
+    def find_matches(self, league_id: str, round_id: Optional[int] = None,
+                     player_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Match documents of a league, optionally for one round and/or player"""
+        query = "SELECT data FROM matches WHERE league_id = ?"
+        params: List[Any] = [league_id]
+        if round_id is not None:
+            query += " AND round_id = ?"
+            params.append(round_id)
+        if player_id is not None:
+            query += " AND (player_A_id = ? OR player_B_id = ?)"
+            params += [player_id, player_id]
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY round_id, match_id", params).fetchall()
+        return [json_codec.loads(data) for data, in rows]
+
+    # Player history
+
+    def load_history(self, player_id: str) -> Dict[str, Any]:
+        """A player's history document, matches oldest first"""
+        with self._lock:
+            document = self._load_document("history", player_id)
+            rows = self._conn.execute(
+                "SELECT data FROM player_history WHERE player_id = ? ORDER BY seq", (player_id,)).fetchall()
+        document.setdefault("player_id", player_id)
+        document["matches"] = [json_codec.loads(data) for data, in rows]
+        return document
+
+    def save_history(self, player_id: str, document: Dict[str, Any]) -> None:
+        """Replace a player's history document"""
+        rows = [(player_id, seq, match.get("league_id"), match.get("match_id"), json_codec.dumps(match))
+                for seq, match in enumerate(document.get("matches", []), 1)]
+        with self._lock:
+            with self._write():
+                statements = self._save_document("history", player_id, document, "matches")
+                self._conn.execute("DELETE FROM player_history WHERE player_id = ?", (player_id,))
+                self._conn.executemany(
+                    "INSERT INTO player_history (player_id, seq, league_id, match_id, data) VALUES (?, ?, ?, ?, ?)",
+                    rows)
+            self._wrote(statements + 1 + len(rows))
+
+    def append_history(self, player_id: str, match_data: Dict[str, Any]) -> None:
+        """Append one match to a player's history"""
+        with self._lock:
+            with self._write():
+                self._conn.execute(
+                    "INSERT INTO player_history (player_id, seq, league_id, match_id, data) "
+                    "SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ?, ? FROM player_history WHERE player_id = ?",
+                    (player_id, match_data.get("league_id"), match_data.get("match_id"),
+                     json_codec.dumps(match_data), player_id))
+            self._wrote()
+
+
+_stores: Dict[Path, SqliteStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(db_path: Path, batch_size: int = 100, batch_ms: float = 50,
+              busy_timeout_ms: float = 5000) -> SqliteStore:
+    """
+    Get the shared store for a database file, opening it if needed.
+
+    Args:
+        db_path: Database file
+        batch_size / batch_ms / busy_timeout_ms: Used if the store is opened (see SqliteStore)
+
+    Returns:
+        SqliteStore for db_path
+    """
+    key = Path(db_path).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = SqliteStore(key, batch_size, batch_ms, busy_timeout_ms)
+        return store
+
+
+@atexit.register
+def close_stores() -> None:
+    """Commit and close every open store (runs at exit)"""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
@@ -0,0 +1,684 @@
+"""
+MCP Transports
+
+Ways for MCPClient to deliver JSON-RPC payloads to an agent endpoint.
+
+HttpTransport POSTs over pooled keep-alive connections (the default), to
+http(s):// endpoints or, for agents on the same host, unix:///path sockets.
+LoopbackTransport hands payloads straight to an agent's MethodDispatcher
+registered under its endpoint, for agents living in the same interpreter.
+
+Every transport exposes post(payload, endpoint, timeout) -> parsed response,
+notify(payload, endpoint), stats() and close(), and raises the same
+Exception messages ("Request timeout ...", "Connection error: ...") so
+callers such as the referee's retry logic behave identically on both.
+"""
+
+import http.client
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import json_codec, message_codecs
+from .config_models import HttpPoolConfig
+from .jsonrpc import MethodDispatcher
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter that counts requests sent and TCP connections opened"""
+
+    def __init__(self, keep_alive: bool = True, **kwargs):
+        self._counter_lock = threading.Lock()
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self.keep_alive = keep_alive
+        super().__init__(**kwargs)
+
+    def _connection_opened(self) -> None:
+        with self._counter_lock:
+            self.connections_opened += 1
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+
+        # Swap in connection classes that report every (re)connect, including
+        # reconnects after the server dropped a kept-alive socket.
+        on_connect = self._connection_opened
+        pool_classes = {}
+        for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items():
+            base_conn_cls = pool_cls.ConnectionCls
+
+            def connect(conn, _base=base_conn_cls):
+                on_connect()
+                return _base.connect(conn)
+
+            conn_cls = type(base_conn_cls.__name__, (base_conn_cls,), {"connect": connect})
+            members = {"ConnectionCls": conn_cls}
+            if not self.keep_alive:
+                # urllib3 pools a connection unless the *response* says "Connection: close",
+                # which servers need not echo; close it instead of keeping a socket they dropped
+                def put_conn(pool, conn, _base=pool_cls):
+                    if conn is not None:
+                        conn.close()
+                    _base._put_conn(pool, None)
+
+                members["_put_conn"] = put_conn
+            pool_classes[scheme] = type(pool_cls.__name__, (pool_cls,), members)
+        self.poolmanager.pool_classes_by_scheme = pool_classes
+
+    def send(self, request, **kwargs):
+        with self._counter_lock:
+            self.requests_sent += 1
+        return super().send(request, **kwargs)
+
+
+class HttpSessionPool:
+    """
+    Per-endpoint pool of keep-alive HTTP sessions.
+
+    One requests.Session is kept per endpoint origin (scheme://host:port), so
+    consecutive messages to the same agent reuse an open TCP connection instead
+    of paying a new handshake. Sessions with no request in flight for longer
+    than idle_timeout_sec are closed and evicted.
+    """
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None):
+        """
+        Initialize HttpSessionPool.
+
+        Args:
+            config: Pool settings (defaults to HttpPoolConfig())
+        """
+        self.config = config if config is not None else HttpPoolConfig()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._last_used: Dict[str, float] = {}
+        # Origin -> requests currently using its session (never evicted while > 0)
+        self._in_use: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+        # Counters carried over from sessions that were already evicted
+        self._evicted_requests = 0
+        self._evicted_connections = 0
+        self.session_hits = 0
+        self.session_misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _origin(endpoint: str) -> str:
+        """Return scheme://host:port used as the pool key for an endpoint"""
+        parts = urlsplit(endpoint)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _new_session(self) -> requests.Session:
+        """Create a session whose adapter keeps up to pool_maxsize connections"""
+        session = requests.Session()
+        adapter = _CountingAdapter(keep_alive=self.config.keep_alive, pool_connections=1,
+                                   pool_maxsize=self.config.pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @contextmanager
+    def checkout(self, endpoint: str) -> Iterator[requests.Session]:
+        """
+        Use the pooled session for an endpoint, creating it on first use.
+
+        The session is not evicted while checked out, and its idle time
+        counts from when the last checkout ended.
+
+        Args:
+            endpoint: Target HTTP endpoint (e.g., "http://localhost:8101/mcp")
+
+        Yields:
+            requests.Session bound to the endpoint's origin
+        """
+        origin = self._origin(endpoint)
+        now = time.monotonic()
+
+        with self._lock:
+            if now - self._last_sweep >= self.config.idle_timeout_sec / 2:
+                self._evict_idle_locked(now)
+
+            session = self._sessions.get(origin)
+            if session is None:
+                session = self._new_session()
+                self._sessions[origin] = session
+                self.session_misses += 1
+            else:
+                self.session_hits += 1
+            self._in_use[origin] = self._in_use.get(origin, 0) + 1
+
+        try:
+            yield session
+        finally:
+            with self._lock:
+                self._in_use[origin] -= 1
+                if not self._in_use[origin]:
+                    del self._in_use[origin]
+                if self._sessions.get(origin) is session:
+                    self._last_used[origin] = time.monotonic()
+
+    def evict_idle(self) -> int:
+        """
+        Close sessions that have been idle longer than idle_timeout_sec.
+
+        Returns:
+            Number of evicted sessions
+        """
+        with self._lock:
+            return self._evict_idle_locked(time.monotonic())
+
+    def _evict_idle_locked(self, now: float) -> int:
+        """Evict idle sessions (caller must hold the lock)"""
+        self._last_sweep = now
+        expired = [origin for origin, last_used in self._last_used.items()
+                   if origin not in self._in_use and now - last_used >= self.config.idle_timeout_sec]
+        for origin in expired:
+            self._close_session_locked(origin)
+        self.evictions += len(expired)
+        return len(expired)
+
+    def _close_session_locked(self, origin: str) -> None:
+        """Close one session and fold its counters into the totals"""
+        session = self._sessions.pop(origin)
+        self._last_used.pop(origin, None)
+        requests_sent, connections_opened = self._session_counters(session)
+        self._evicted_requests += requests_sent
+        self._evicted_connections += connections_opened
+        session.close()
+
+    @staticmethod
+    def _session_counters(session: requests.Session) -> tuple:
+        """Return (requests_sent, connections_opened) for a session"""
+        adapter = session.get_adapter("http://")
+        return adapter.requests_sent, adapter.connections_opened
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary containing:
+            - endpoints: Number of live sessions
+            - requests: Requests sent over pooled connections
+            - pool_hits: Requests served by an already-open connection
+            - pool_misses: Requests that had to open a new connection
+            - session_hits / session_misses: Session lookups by endpoint
+            - evictions: Sessions closed for being idle
+        """
+        with self._lock:
+            requests_sent = self._evicted_requests
+            connections_opened = self._evicted_connections
+            for session in self._sessions.values():
+                sent, opened = self._session_counters(session)
+                requests_sent += sent
+                connections_opened += opened
+
+            return {
+                "endpoints": len(self._sessions),
+                "requests": requests_sent,
+                "pool_hits": max(requests_sent - connections_opened, 0),
+                "pool_misses": connections_opened,
+                "session_hits": self.session_hits,
+                "session_misses": self.session_misses,
+                "evictions": self.evictions
+            }
+
+    def close(self) -> None:
+        """Close all pooled sessions"""
+        with self._lock:
+            for origin in list(self._sessions):
+                self._close_session_locked(origin)
+
+
+UNIX_SCHEME = "unix://"
+
+# HTTP path requested over a Unix socket (the socket itself names the agent)
+UNIX_HTTP_PATH = "/mcp"
+
+
+def unix_socket_path(endpoint: str) -> Optional[str]:
+    """
+    Get the socket file of a unix:// endpoint.
+
+    Args:
+        endpoint: Agent endpoint (e.g., "unix:///tmp/league/P01.sock")
+
+    Returns:
+        Socket file path, or None for non-Unix endpoints
+    """
+    if endpoint.startswith(UNIX_SCHEME):
+        return endpoint[len(UNIX_SCHEME):]
+    return None
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket"""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class UnixSocketPool:
+    """
+    Per-socket pool of keep-alive HTTP connections over Unix domain sockets.
+
+    Co-located agents skip the TCP/IP stack entirely; idle connections are
+    reused like HttpSessionPool's sessions and evicted after idle_timeout_sec.
+    """
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None):
+        """
+        Initialize UnixSocketPool.
+
+        Args:
+            config: Pool settings (defaults to HttpPoolConfig())
+        """
+        self.config = config if config is not None else HttpPoolConfig()
+        self._idle: Dict[str, List[Tuple[_UnixHTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self.evictions = 0
+
+    def _take_idle(self, socket_path: str) -> Optional[_UnixHTTPConnection]:
+        """Pop the most recently used idle connection, evicting expired ones"""
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(socket_path, [])
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used >= self.config.idle_timeout_sec:
+                    self.evictions += 1
+                    conn.close()
+                    continue
+                self.pool_hits += 1
+                return conn
+            self.pool_misses += 1
+        return None
+
+    def _release(self, socket_path: str, conn: _UnixHTTPConnection) -> None:
+        """Return a connection to the pool, or close it if the pool is full"""
+        with self._lock:
+            idle = self._idle.setdefault(socket_path, [])
+            if len(idle) < self.config.pool_maxsize:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def post(self, socket_path: str, body: bytes, headers: Dict[str, str],
+             timeout: float) -> Tuple[int, Optional[str], bytes]:
+        """
+        POST a body to the agent listening on socket_path.
+
+        A request that fails on a reused connection (the server closed it while
+        idle) is retried once on a new connection.
+
+        Args:
+            socket_path: Agent's socket file
+            body: Request body
+            headers: Request headers
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (HTTP status, response Content-Type, response body)
+
+        Raises:
+            OSError: On connection failure or timeout
+        """
+        with self._lock:
+            self.requests += 1
+
+        while True:
+            conn = self._take_idle(socket_path)
+            reused = conn is not None
+            if conn is None:
+                conn = _UnixHTTPConnection(socket_path, timeout)
+            else:
+                conn.timeout = timeout
+                conn.sock.settimeout(timeout)
+
+            try:
+                conn.request("POST", UNIX_HTTP_PATH, body, headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (ConnectionError, http.client.BadStatusLine) as e:
+                conn.close()
+                if reused:
+                    continue
+                if isinstance(e, http.client.BadStatusLine):
+                    raise ConnectionError(str(e))
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+            if self.config.keep_alive and not response.will_close:
+                self._release(socket_path, conn)
+            else:
+                conn.close()
+            return response.status, response.getheader("Content-Type"), data
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary with endpoints, requests, pool_hits, pool_misses, evictions
+        """
+        with self._lock:
+            return {
+                "endpoints": sum(1 for idle in self._idle.values() if idle),
+                "requests": self.requests,
+                "pool_hits": self.pool_hits,
+                "pool_misses": self.pool_misses,
+                "evictions": self.evictions
+            }
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self._lock:
+            for idle in self._idle.values():
+                while idle:
+                    conn, _ = idle.pop()
+                    conn.close()
+
+
+class HttpTransport:
+    """
+    JSON-RPC over HTTP POST, using per-endpoint keep-alive connection pools.
+
+    http(s):// endpoints go through HttpSessionPool; unix:///path endpoints
+    are POSTed over a Unix domain socket through UnixSocketPool. Bodies are
+    JSON unless a binary codec was negotiated for the endpoint (set_codecs).
+    """
+
+    def __init__(self, pool_config: Optional[HttpPoolConfig] = None):
+        """
+        Initialize HttpTransport.
+
+        Args:
+            pool_config: HTTP connection pool settings (defaults to HttpPoolConfig())
+        """
+        self.session_pool = HttpSessionPool(pool_config)
+        self.unix_pool = UnixSocketPool(pool_config)
+        # Endpoint -> negotiated codec (JSON when absent)
+        self._codecs: Dict[str, message_codecs.Codec] = {}
+
+    def set_codecs(self, endpoint: str, content_types: Optional[List[str]]) -> message_codecs.Codec:
+        """
+        Record the media types an endpoint accepts and pick the codec to send it.
+
+        Args:
+            endpoint: Peer endpoint
+            content_types: Media types the peer advertised (None: JSON only)
+
+        Returns:
+            Codec that will be used for the endpoint
+        """
+        codec = message_codecs.negotiate(content_types)
+        if codec is message_codecs.JSON:
+            self._codecs.pop(endpoint, None)
+        else:
+            self._codecs[endpoint] = codec
+        return codec
+
+    def codec_for(self, endpoint: str) -> message_codecs.Codec:
+        """Codec used for requests to an endpoint"""
+        return self._codecs.get(endpoint, message_codecs.JSON)
+
+    def _send(self, endpoint: str, body: bytes, content_type: str, timeout: float) -> Tuple[int, Optional[str], bytes]:
+        """
+        POST an encoded body and return (status, response Content-Type, response body).
+
+        Raises:
+            Exception: On network error or timeout
+        """
+        headers = {"Content-Type": content_type, "Accept": content_type}
+        socket_path = unix_socket_path(endpoint)
+
+        if socket_path is not None:
+            try:
+                return self.unix_pool.post(socket_path, body, headers, timeout)
+            except socket.timeout:
+                raise Exception(f"Request timeout after {timeout} seconds")
+            except OSError as e:
+                raise Exception(f"Connection error: {str(e)}")
+
+        try:
+            # Send POST request to endpoint over a pooled keep-alive session
+            with self.session_pool.checkout(endpoint) as session:
+                response = session.post(endpoint, data=body, headers=headers, timeout=timeout)
+                return response.status_code, response.headers.get("Content-Type"), response.content
+        except requests.exceptions.Timeout:
+            raise Exception(f"Request timeout after {timeout} seconds")
+        except requests.exceptions.ConnectionError as e:
+            raise Exception(f"Connection error: {str(e)}")
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"HTTP error: {str(e)}")
+
+    def post(self, payload: Any, endpoint: str, timeout: float) -> Any:
+        """
+        POST a JSON-RPC payload over a pooled connection and parse the response.
+
+        A peer answering 415 to a binary body is switched back to JSON and
+        the payload is re-sent.
+
+        Args:
+            payload: Request envelope or batch array
+            endpoint: Target endpoint (http(s)://host:port/path or unix:///socket/path)
+            timeout: Timeout in seconds
+
+        Returns:
+            Parsed response body
+
+        Raises:
+            Exception: On network error, timeout, or undecodable response
+        """
+        codec = self.codec_for(endpoint)
+        try:
+            body = codec.encode(payload)
+        except (TypeError, ValueError) as e:
+            raise Exception(f"HTTP error: request is not serializable: {str(e)}")
+
+        status, content_type, data = self._send(endpoint, body, codec.content_type, timeout)
+        if status == 415 and codec is not message_codecs.JSON:
+            self._codecs.pop(endpoint, None)
+            return self.post(payload, endpoint, timeout)
+
+        # Decode the response (even if HTTP error, might contain JSON-RPC error)
+        try:
+            rpc_response = message_codecs.codec_for(content_type).decode(data)
+        except Exception:
+            if status >= 400:
+                raise Exception(f"HTTP error: {status} for url: {endpoint}")
+            raise Exception("Invalid response: not JSON")
+
+        # Check HTTP status only if we couldn't parse JSON-RPC error
+        if status >= 400 and not (isinstance(rpc_response, dict) and "error" in rpc_response):
+            raise Exception(f"HTTP error: {status} for url: {endpoint}")
+
+        return rpc_response
+
+    def notify(self, payload: Dict[str, Any], endpoint: str) -> None:
+        """
+        POST a notification without waiting for a meaningful response.
+
+        Args:
+            payload: Notification envelope
+            endpoint: Target endpoint
+        """
+        try:
+            # Fire-and-forget, short timeout
+            codec = self.codec_for(endpoint)
+            status, _, _ = self._send(endpoint, codec.encode(payload), codec.content_type, 2)
+            if status == 415 and codec is not message_codecs.JSON:
+                self._codecs.pop(endpoint, None)
+                self._send(endpoint, message_codecs.JSON.encode(payload), message_codecs.JSON_CONTENT_TYPE, 2)
+        except Exception:
+            # Notifications are fire-and-forget, ignore errors
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        """Get connection pool counters (see HttpSessionPool.stats), TCP and Unix combined"""
+        stats = self.session_pool.stats()
+        for key, value in self.unix_pool.stats().items():
+            stats[key] = stats.get(key, 0) + value
+        return stats
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session_pool.close()
+        self.unix_pool.close()
+
+
+class LoopbackTransport:
+    """
+    JSON-RPC delivered in-process to registered agents.
+
+    Each agent's MethodDispatcher is registered under the endpoint it would
+    serve over HTTP, so callers keep using the usual endpoint strings. With
+    serialize=True payloads and responses are round-tripped through JSON,
+    preserving HTTP semantics exactly (no shared mutable objects, only JSON
+    types). With serialize=False objects are passed by reference: no
+    encoding or copying at all, but handlers must not mutate their params.
+
+    Calls run synchronously on the caller's thread, so timeouts are not
+    enforced. Unregistered endpoints raise a connection error, or go to the
+    fallback transport when one is given.
+    """
+
+    def __init__(self, serialize: bool = True, fallback=None):
+        """
+        Initialize LoopbackTransport.
+
+        Args:
+            serialize: Round-trip payloads through JSON (False for zero-copy passing)
+            fallback: Transport for endpoints with no registered agent (e.g. HttpTransport())
+        """
+        self.serialize = serialize
+        self.fallback = fallback
+        self._dispatchers: Dict[str, MethodDispatcher] = {}
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+
+    def register(self, endpoint: str, dispatcher: MethodDispatcher) -> None:
+        """
+        Route an endpoint to an agent's method table.
+
+        Args:
+            endpoint: Endpoint the agent is addressed by (e.g., "http://localhost:8101/mcp")
+            dispatcher: The agent's MethodDispatcher
+        """
+        self._dispatchers[endpoint] = dispatcher
+
+    def unregister(self, endpoint: str) -> None:
+        """
+        Stop routing an endpoint (later calls fail as if the agent were down).
+
+        Args:
+            endpoint: Registered endpoint
+        """
+        self._dispatchers.pop(endpoint, None)
+
+    def _deliver(self, payload: Any, endpoint: str) -> Optional[Any]:
+        """Dispatch a payload to the endpoint's agent and return its response body (None if empty)"""
+        dispatcher = self._dispatchers.get(endpoint)
+        if dispatcher is None:
+            raise Exception(f"Connection error: no agent registered at {endpoint}")
+
+        with self._lock:
+            self.requests_sent += 1
+
+        if self.serialize:
+            try:
+                payload = json_codec.loads(json_codec.dumpb(payload))
+            except (TypeError, ValueError) as e:
+                raise Exception(f"HTTP error: request is not JSON serializable: {str(e)}")
+
+        response, _ = dispatcher.handle(payload)
+        if response is not None and self.serialize:
+            response = json_codec.loads(json_codec.dumpb(response))
+        return response
+
+    def post(self, payload: Any, endpoint: str, timeout: float) -> Any:
+        """
+        Dispatch a JSON-RPC payload to the agent registered at endpoint.
+
+        Args:
+            payload: Request envelope or batch array
+            endpoint: Registered endpoint
+            timeout: Accepted for interface compatibility; not enforced in-process
+
+        Returns:
+            Response body, as the agent's HTTP route would have returned it
+
+        Raises:
+            Exception: If no agent is registered at endpoint, or the agent sends no body
+        """
+        if self.fallback is not None and endpoint not in self._dispatchers:
+            return self.fallback.post(payload, endpoint, timeout)
+
+        response = self._deliver(payload, endpoint)
+        if response is None:
+            raise Exception("Invalid response: not JSON")
+        return response
+
+    def notify(self, payload: Dict[str, Any], endpoint: str) -> None:
+        """
+        Dispatch a notification, ignoring any error.
+
+        Args:
+            payload: Notification envelope
+            endpoint: Registered endpoint
+        """
+        if self.fallback is not None and endpoint not in self._dispatchers:
+            self.fallback.notify(payload, endpoint)
+            return
+
+        try:
+            self._deliver(payload, endpoint)
+        except Exception:
+            # Notifications are fire-and-forget, ignore errors
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get loopback counters.
+
+        Returns:
+            Dictionary containing:
+            - endpoints: Number of registered agents
+            - requests: Payloads delivered in-process
+            - fallback: The fallback transport's stats (only if there is one)
+        """
+        stats = {"endpoints": len(self._dispatchers), "requests": self.requests_sent}
+        if self.fallback is not None:
+            stats["fallback"] = self.fallback.stats()
+        return stats
+
+    def close(self) -> None:
+        """Close the fallback transport, if any"""
+        if self.fallback is not None:
+            self.fallback.close()
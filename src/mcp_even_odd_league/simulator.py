@@ -0,0 +1,369 @@
+"""
+League Simulator
+
+Runs a full Round-Robin league in-process: the scheduler pairs players, the
+real Referee plays matches against real Player agents over LoopbackTransport,
+and LeagueManager's standings logic scores the results. No servers or
+sockets are involved, so strategies and scoring changes can be validated
+offline at scale against the actual protocol code.
+
+Whole rounds take a fast path: each player's make_parity_choice is called
+directly and the round is scored with game_logic.determine_winners_batch.
+Only matches where a player faults (raises, or returns something other than
+"even"/"odd") are played through Referee.run_match, so retries and technical
+losses follow the referee's own rules. Agents log nothing unless asked to.
+
+Usage:
+    python -m mcp_even_odd_league.simulator [num_players] [seed]
+"""
+
+import contextlib
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from mcp_even_odd_league.agents.league_manager import scheduler
+from mcp_even_odd_league.agents.league_manager.main import LeagueManager
+from mcp_even_odd_league.agents.player_P01.main import Player, create_dispatcher
+from mcp_even_odd_league.agents.referee_REF01 import game_logic
+from mcp_even_odd_league.agents.referee_REF01.main import Referee
+from mcp_even_odd_league.league_sdk.config_loader import ConfigLoader
+from mcp_even_odd_league.league_sdk.config_models import LoggingConfig, ScoringConfig
+from mcp_even_odd_league.league_sdk.logger import JsonLogger
+from mcp_even_odd_league.league_sdk.mcp_client import MCPClient
+from mcp_even_odd_league.league_sdk.transports import LoopbackTransport
+
+
+# Logging for simulated agents: every event is sampled out before it is built
+SILENT_LOGGING = LoggingConfig(sample_rates={"*": 0.0})
+
+PARITIES = ("even", "odd")
+
+# A strategy replaces Player.make_parity_choice: it maps the CHOOSE_PARITY_CALL
+# context (match_id, round_id, opponent_id, ...) to a parity choice.
+Strategy = Callable[[Dict[str, Any]], str]
+
+
+def random_strategy(rng: Optional[random.Random] = None) -> Strategy:
+    """
+    Strategy choosing "even" or "odd" uniformly (the players' current behavior).
+
+    Args:
+        rng: Random source (defaults to the random module)
+
+    Returns:
+        Strategy callable
+    """
+    choice = (rng or random).choice
+    options = ("even", "odd")
+    return lambda match_context: choice(options)
+
+
+def fixed_strategy(parity: str) -> Strategy:
+    """
+    Strategy always choosing the same parity.
+
+    Args:
+        parity: "even" or "odd"
+
+    Returns:
+        Strategy callable
+    """
+    return lambda match_context: parity
+
+
+def timeout_strategy() -> Strategy:
+    """
+    Strategy for a player that never answers CHOOSE_PARITY_CALL.
+
+    The referee sees a timeout error, retries, and scores a technical loss.
+
+    Returns:
+        Strategy callable
+    """
+    def never_answers(match_context):
+        raise TimeoutError("simulated timeout")
+    return never_answers
+
+
+class InProcessTransport:
+    """
+    Match transport running matches through the real Referee and Player agents.
+
+    One Referee and one Player per player_id live in-process; the referee's
+    MCPClient reaches each player's MethodDispatcher over LoopbackTransport,
+    passing payloads by reference. play() runs Referee.run_match and the
+    players' handlers and state machines, so results follow the referee's
+    rules: a player whose handler fails with a timeout is retried and then
+    loses by technical loss, any other handler error aborts the match, and
+    an invalid parity counts as a wrong guess.
+
+    play_round() takes the fast path for a whole round and hands only the
+    matches with a faulting player to play().
+    """
+
+    def __init__(self, strategies: Optional[Dict[str, Strategy]] = None,
+                 default_strategy: Optional[Strategy] = None, seed: Optional[int] = None,
+                 quiet: bool = True, log_events: bool = False):
+        """
+        Initialize InProcessTransport.
+
+        Args:
+            strategies: player_id -> strategy overriding that player's make_parity_choice
+            default_strategy: Override for players without one (None keeps Player.make_parity_choice)
+            seed: Seeds the referee's number draws (the random module) and each player's rng
+            quiet: Silence the agents' console output while matches run
+            log_events: Keep the agents' JsonLogger output (SHARED/logs); dropped by default
+        """
+        self.strategies = strategies or {}
+        self.default_strategy = default_strategy
+        self.seed = seed
+        if seed is not None:
+            random.seed(seed)
+        self.log_events = log_events
+        self._devnull = open(os.devnull, "w") if quiet else None
+        self._number_range = ConfigLoader.get_game_number_range()
+
+        self.loopback = LoopbackTransport(serialize=False)
+        self.players: Dict[str, Player] = {}
+        with self._output():
+            self.referee = Referee("REF01")
+        self._silence(self.referee)
+        self.referee.mcp_client = MCPClient(transport=self.loopback)
+
+    def _output(self):
+        """Context silencing agent prints when quiet"""
+        if self._devnull is None:
+            return contextlib.nullcontext()
+        return contextlib.redirect_stdout(self._devnull)
+
+    def _silence(self, agent) -> None:
+        """Give an agent a logger that drops every event unless log_events is set"""
+        if not self.log_events:
+            agent.logger = JsonLogger(agent.logger.component, config=SILENT_LOGGING)
+
+    def endpoint(self, player_id: str) -> str:
+        """
+        Get a player's loopback endpoint, creating and registering the player if needed.
+
+        Args:
+            player_id: Player identifier
+
+        Returns:
+            Endpoint the referee addresses the player by
+        """
+        endpoint = f"loopback://{player_id}/mcp"
+        if player_id not in self.players:
+            with self._output():
+                player = Player(player_id)
+            self._silence(player)
+            if self.seed is not None:
+                player.rng = random.Random(f"{self.seed}:{player_id}")
+            strategy = self.strategies.get(player_id, self.default_strategy)
+            if strategy is not None:
+                player.make_parity_choice = strategy
+            self.players[player_id] = player
+            self.loopback.register(endpoint, create_dispatcher(player))
+        return endpoint
+
+    def play(self, match: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Play one match through Referee.run_match.
+
+        Args:
+            match: Scheduled match (match_id, round_id, player_A_id, player_B_id)
+
+        Returns:
+            Match result from Referee.run_match
+        """
+        player_A_id, player_B_id = match["player_A_id"], match["player_B_id"]
+        with self._output():
+            return self.referee.run_match(
+                match["match_id"], player_A_id, player_B_id, self.endpoint(player_A_id), self.endpoint(player_B_id),
+                match.get("league_id", "league_simulation"), match["round_id"], report_to_league_manager=False)
+
+    def _choose(self, player_id: str, opponent_id: str, match: Dict[str, Any]) -> Optional[str]:
+        """A player's parity as its handler would compute it, or None if the player faults"""
+        if player_id not in self.players:
+            self.endpoint(player_id)
+        context = {"opponent_id": opponent_id, "round_id": match["round_id"], "match_id": match["match_id"]}
+        try:
+            choice = self.players[player_id].make_parity_choice(context)
+        except Exception:
+            return None
+        return choice.lower() if isinstance(choice, str) and choice.lower() in PARITIES else None
+
+    def play_round(self, matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Play a round, scoring no-fault matches in one batch.
+
+        Args:
+            matches: Scheduled matches of one round
+
+        Returns:
+            Match results in the same order (shaped like Referee.run_match results)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(matches)
+        batch, numbers, choices_A, choices_B = [], [], [], []
+        low, high = self._number_range
+        for position, match in enumerate(matches):
+            player_A_id, player_B_id = match["player_A_id"], match["player_B_id"]
+            choice_A = self._choose(player_A_id, player_B_id, match)
+            choice_B = self._choose(player_B_id, player_A_id, match)
+            if choice_A is None or choice_B is None:
+                results[position] = self.play(match)
+                continue
+            batch.append(position)
+            numbers.append(random.randint(low, high))
+            choices_A.append(choice_A)
+            choices_B.append(choice_B)
+
+        outcome = game_logic.determine_winners_batch(
+            numbers, game_logic.encode_choices(choices_A), game_logic.encode_choices(choices_B))
+        for i, position in enumerate(batch):
+            match = matches[position]
+            winner = outcome.winner[i]
+            player_ids = (match["player_A_id"], match["player_B_id"])
+            results[position] = {
+                "winner_id": None if winner == game_logic.NO_WINNER else player_ids[winner],
+                "loser_id": None if winner == game_logic.NO_WINNER else player_ids[1 - winner],
+                "is_draw": bool(outcome.is_draw[i]),
+                "drawn_number": numbers[i],
+                "number_parity": PARITIES[numbers[i] & 1],
+                "player_A_choice": choices_A[i],
+                "player_B_choice": choices_B[i],
+                "technical_loss": False
+            }
+        return results
+
+
+@dataclass
+class SimulationReport:
+    """Summary of a simulated league"""
+    num_players: int
+    rounds: int = 0
+    matches: int = 0
+    draws: int = 0
+    technical_losses: int = 0
+    elapsed_sec: float = 0.0
+    standings: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def matches_per_sec(self) -> float:
+        """Simulation throughput"""
+        return self.matches / self.elapsed_sec if self.elapsed_sec else 0.0
+
+
+class LeagueSimulator:
+    """
+    In-process Round-Robin league.
+
+    Rounds come from the lazy scheduler, matches are played by a pluggable
+    transport (anything with play(match) -> result; play_round(matches) ->
+    results is used when present), and every result is fed to
+    LeagueManager.update_standings_from_match as a MATCH_RESULT_REPORT.
+    """
+
+    def __init__(self, player_ids: List[str], transport=None, league_id: str = "league_simulation",
+                 scoring: Optional[ScoringConfig] = None, league_manager: Optional[LeagueManager] = None):
+        """
+        Initialize LeagueSimulator.
+
+        Args:
+            player_ids: Players in the league
+            transport: Match transport (defaults to InProcessTransport())
+            league_id: League identifier for the standings
+            scoring: Scoring rules to evaluate (defaults to the league configuration)
+            league_manager: Existing LeagueManager to score into (created if None)
+        """
+        self.players = [{"player_id": player_id} for player_id in player_ids]
+        self.transport = transport if transport is not None else InProcessTransport()
+        self.league_manager = league_manager or LeagueManager(league_id, scoring=scoring)
+        self.scoring = self.league_manager.league_config.scoring
+
+    def _match_report(self, match: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the MATCH_RESULT_REPORT fields the League Manager scores from"""
+        player_A_id, player_B_id = match["player_A_id"], match["player_B_id"]
+        winner_id = result.get("winner_id")
+
+        if result.get("is_draw"):
+            status = "DRAW"
+            score = {player_A_id: self.scoring.draw_points, player_B_id: self.scoring.draw_points}
+        else:
+            status = "TECHNICAL_LOSS" if result.get("technical_loss") else "WIN"
+            score = {
+                player_A_id: self.scoring.win_points if winner_id == player_A_id else self.scoring.loss_points,
+                player_B_id: self.scoring.win_points if winner_id == player_B_id else self.scoring.loss_points
+            }
+
+        return {
+            "match_id": match["match_id"],
+            "round_id": match["round_id"],
+            "result": {
+                "winner": winner_id,
+                "score": score,
+                "details": {"status": status}
+            }
+        }
+
+    def run(self, start_round: int = 1, max_rounds: Optional[int] = None) -> SimulationReport:
+        """
+        Play the league.
+
+        Args:
+            start_round: First round to play (earlier rounds are skipped, not generated)
+            max_rounds: Stop after this many rounds (None plays to the end)
+
+        Returns:
+            SimulationReport with counters, timing and final standings
+        """
+        report = SimulationReport(num_players=len(self.players))
+        last_round = scheduler.count_rounds(len(self.players))
+        if max_rounds is not None:
+            last_round = min(last_round, start_round + max_rounds - 1)
+
+        play = self.transport.play
+        play_round = getattr(self.transport, "play_round", None)
+        record = self.league_manager.update_standings_from_match
+        started = time.perf_counter()
+
+        for round_index in range(start_round - 1, last_round):
+            matches = list(scheduler.iter_round_matches(self.players, round_index))
+            results = play_round(matches) if play_round is not None else [play(match) for match in matches]
+            for match, result in zip(matches, results):
+                record(self._match_report(match, result))
+                report.matches += 1
+                report.draws += bool(result.get("is_draw"))
+                report.technical_losses += bool(result.get("technical_loss"))
+            report.rounds += 1
+
+        report.elapsed_sec = time.perf_counter() - started
+        report.standings = self.league_manager.standings.as_table()
+        return report
+
+
+def main():
+    """Run a simulated league from the command line"""
+    num_players = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    player_ids = [f"P{i:0{len(str(num_players))}d}" for i in range(1, num_players + 1)]
+    simulator = LeagueSimulator(player_ids, InProcessTransport(seed=seed))
+    report = simulator.run()
+
+    print(f"\n=== Simulation Complete ===")
+    print(f"Players: {report.num_players}")
+    print(f"Rounds: {report.rounds}")
+    print(f"Matches: {report.matches} ({report.draws} draws, {report.technical_losses} technical losses)")
+    print(f"Elapsed: {report.elapsed_sec:.2f}s ({report.matches_per_sec:,.0f} matches/s)")
+    print("Top 5:")
+    for row in report.standings[:5]:
+        print(f"  {row['rank']:<4} {row['player_id']:<10} {row['points']} pts "
+              f"({row['wins']}W {row['draws']}D {row['losses']}L)")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,6 @@ This demonstrates Phase 6 functionality:
 import sys
 import importlib.util
 from pathlib import Path
-from itertools import combinations
 
 # Get project root (parent of tests directory)
 project_root = Path(__file__).parent.parent
@@ -26,19 +25,25 @@ sys.path.insert(0, str(project_root / "src"))
 # Import from the installed package
 from mcp_even_odd_league.agents.referee_REF01.main import Referee
 from mcp_even_odd_league.agents.league_manager.main import LeagueManager
+from mcp_even_odd_league.agents.league_manager import scheduler
 
 
 def generate_round_robin_matches(players):
     """
-    Generate all Round-Robin match pairings.
+    Generate all Round-Robin match pairings, round by round (circle method).
 
     Args:
         players: List of player IDs
 
     Returns:
-        List of tuples (player_A, player_B) for each match
+        List of tuples (round_id, match_id, player_A, player_B) for each match
     """
-    return list(combinations(players, 2))
+    player_configs = [{"player_id": player_id} for player_id in players]
+    return [
+        (match["round_id"], match["match_id"], match["player_A_id"], match["player_B_id"])
+        for round_index in range(scheduler.count_rounds(len(players)))
+        for match in scheduler.iter_round_matches(player_configs, round_index)
+    ]
 
 
 def main():
@@ -78,7 +83,6 @@ def main():
 
     # League parameters
     league_id = "league_2025_even_odd"
-    round_id = 1
 
     # Player configuration
     players = [
@@ -105,9 +109,8 @@ def main():
     match_results = []
     match_num = 0
 
-    for player_A_id, player_B_id in match_pairings:
+    for round_id, match_id, player_A_id, player_B_id in match_pairings:
         match_num += 1
-        match_id = f"LEAGUE_MATCH_{match_num:03d}"
 
         print(f"\n{'🎮 ' + '=' * 76}")
         print(f"Match {match_num}/{len(match_pairings)}: {player_A_id} vs {player_B_id} ({match_id})")
@@ -190,13 +193,7 @@ def main():
 
     # Determine league winner
     if league_manager.standings:
-        sorted_standings = sorted(
-            league_manager.standings.items(),
-            key=lambda x: (x[1]["points"], x[1]["wins"]),
-            reverse=True
-        )
-
-        champion = sorted_standings[0]
+        champion = league_manager.standings.top(1)[0]
         print(f"\n🏆 LEAGUE CHAMPION: {champion[0]} 🏆")
         print(f"   Total Points: {champion[1]['points']}")
         print(f"   Record: {champion[1]['wins']}W - {champion[1]['losses']}L - {champion[1]['draws']}D")
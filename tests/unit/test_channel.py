@@ -0,0 +1,261 @@
+"""
+Unit tests for the persistent framed channel.
+
+Runs ChannelServer on a free port in-thread and talks to it through
+MCPClient over ChannelTransport.
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+from mcp_even_odd_league.league_sdk import jsonrpc
+from mcp_even_odd_league.league_sdk.channel import (
+    ChannelServer,
+    ChannelTransport,
+    FramedChannel,
+    encode_frame,
+    read_frame
+)
+from mcp_even_odd_league.league_sdk.mcp_client import MCPClient
+
+
+def _dispatcher():
+    dispatcher = jsonrpc.MethodDispatcher()
+    dispatcher.register("echo", lambda params: params)
+
+    def sleepy(params):
+        time.sleep(params["delay"])
+        return params
+
+    dispatcher.register("sleepy", sleepy)
+    return dispatcher
+
+
+@pytest.fixture
+def server():
+    """Run a ChannelServer for the duration of a test."""
+    channel_server = ChannelServer(_dispatcher(), host="127.0.0.1")
+    channel_server.start()
+    yield channel_server
+    channel_server.close()
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestFraming:
+    """Tests for frame encoding."""
+
+    def test_round_trip(self):
+        """Test a frame reads back as the encoded message."""
+        left, right = socket.socketpair()
+        with left, right:
+            left.sendall(encode_frame({"id": 1}) + encode_frame([1, 2]))
+            assert read_frame(right) == b'{"id":1}'
+            assert read_frame(right) == b"[1,2]"
+            left.close()
+            assert read_frame(right) is None
+
+
+class TestChannelTransport:
+    """Tests for MCPClient over ChannelTransport."""
+
+    def test_request_batch_and_notification(self, server):
+        """Test JSON-RPC semantics are kept over the channel."""
+        endpoint = f"channel://127.0.0.1:{server.port}"
+        client = MCPClient(transport=ChannelTransport())
+
+        assert client.send_request("echo", {"x": 1}, endpoint) == {"x": 1}
+        results = client.send_batch([("echo", {"x": 2}), ("missing", {})], endpoint)
+        client.send_notification("echo", {"x": 3}, endpoint)
+        with pytest.raises(Exception, match="JSON-RPC error -32601"):
+            client.send_request("missing", {}, endpoint)
+
+        assert results[0] == {"x": 2}
+        assert isinstance(results[1], Exception)
+        client.close()
+
+    def test_concurrent_calls_share_one_connection(self, server):
+        """Test many concurrent calls are multiplexed and answered out of order."""
+        endpoint = f"channel://127.0.0.1:{server.port}"
+        client = MCPClient(transport=ChannelTransport())
+        finished = []
+
+        def call(i, delay):
+            client.send_request("sleepy", {"i": i, "delay": delay}, endpoint)
+            finished.append(i)
+
+        threads = [threading.Thread(target=call, args=(0, 0.3))]
+        threads += [threading.Thread(target=call, args=(i, 0.0)) for i in range(1, 50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert finished[-1] == 0
+        assert client.pool_stats()["pool_misses"] == 1
+        assert len(server.channels) == 1
+        client.close()
+
+    def test_slow_connect_does_not_block_other_peers(self, server, monkeypatch):
+        """Test a connect still in progress to one peer does not hold up calls to another."""
+        slow_server = ChannelServer(_dispatcher(), host="127.0.0.1")
+        slow_server.start()
+        release = threading.Event()
+        connect = FramedChannel.connect
+
+        def gated_connect(host, port, **kwargs):
+            if port == slow_server.port:
+                release.wait(5)
+            return connect(host, port, **kwargs)
+
+        monkeypatch.setattr(FramedChannel, "connect", gated_connect)
+        client = MCPClient(transport=ChannelTransport())
+        slow_results = []
+        slow_callers = [
+            threading.Thread(target=lambda: slow_results.append(
+                client.send_request("echo", "slow", f"channel://127.0.0.1:{slow_server.port}")))
+            for _ in range(2)
+        ]
+        for thread in slow_callers:
+            thread.start()
+        time.sleep(0.05)
+
+        assert client.send_request("echo", "fast", f"channel://127.0.0.1:{server.port}") == "fast"
+        assert not slow_results
+
+        release.set()
+        for thread in slow_callers:
+            thread.join()
+        assert slow_results == ["slow", "slow"]
+        assert client.pool_stats()["pool_misses"] == 2
+        client.close()
+        slow_server.close()
+
+    def test_timeout_is_mapped(self, server):
+        """Test a slow response raises a timeout the referee's retry logic recognizes."""
+        client = MCPClient(transport=ChannelTransport())
+
+        with pytest.raises(Exception, match="Request timeout"):
+            client.send_request("sleepy", {"delay": 0.5}, f"channel://127.0.0.1:{server.port}", timeout=0.1)
+        client.close()
+
+    def test_server_can_push(self, server):
+        """Test the accepting side can call the connecting side over the same connection."""
+        pushed = []
+        client_dispatcher = jsonrpc.MethodDispatcher()
+        client_dispatcher.register("standings_update", lambda params: pushed.append(params) or {"status": "OK"})
+        client = MCPClient(transport=ChannelTransport(dispatcher=client_dispatcher))
+        client.send_request("echo", {}, f"channel://127.0.0.1:{server.port}")
+
+        result = server.channels[0].call("standings_update", {"round": 1})
+
+        assert result == {"status": "OK"}
+        assert pushed == [{"round": 1}]
+        client.close()
+
+    def test_connection_accepted_during_close_is_dropped(self):
+        """Test a connection accepted as the server closes is closed, not tracked."""
+        channel_server = ChannelServer(_dispatcher(), host="127.0.0.1")
+        with socket.create_server(("127.0.0.1", 0)) as listener:
+            peer = socket.create_connection(listener.getsockname())
+            accepted, _ = listener.accept()
+
+        class _Listener:
+            def __init__(self):
+                self.pending = [accepted]
+
+            def accept(self):
+                if not self.pending:
+                    raise OSError("closed")
+                channel_server.close()  # close() runs while this connection is being accepted
+                return self.pending.pop(), None
+
+            def close(self):
+                pass
+
+        channel_server._sock = _Listener()
+        channel_server._accept_loop()
+
+        assert channel_server.channels == []
+        assert accepted.fileno() == -1
+        peer.close()
+
+    def test_reconnects_after_drop(self, server):
+        """Test a dropped channel fails pending calls and is reopened on the next call."""
+        endpoint = f"channel://127.0.0.1:{server.port}"
+        client = MCPClient(transport=ChannelTransport())
+        client.send_request("echo", {}, endpoint)
+
+        server.channels[0].close()
+        time.sleep(0.05)
+
+        assert client.send_request("echo", {"again": True}, endpoint) == {"again": True}
+        assert client.pool_stats()["pool_misses"] == 2
+        client.close()
+
+    def test_port_offset_with_http_fallback(self, server):
+        """Test HTTP endpoints map to channel ports, falling back when no channel listens."""
+        class _Recorder:
+            def __init__(self):
+                self.posted = []
+
+            def post(self, payload, endpoint, timeout):
+                self.posted.append(endpoint)
+                return {"jsonrpc": "2.0", "result": "http", "id": payload["id"]}
+
+            def stats(self):
+                return {}
+
+            def close(self):
+                pass
+
+        fallback = _Recorder()
+        client = MCPClient(transport=ChannelTransport(port_offset=1000, fallback=fallback))
+        mapped = f"http://127.0.0.1:{server.port - 1000}/mcp"
+        unmapped = f"http://127.0.0.1:{_free_port()}/mcp"
+
+        assert client.send_request("echo", "channel", mapped) == "channel"
+        assert client.send_request("echo", {}, unmapped) == "http"
+        assert client.send_request("echo", {}, unmapped) == "http"
+        assert fallback.posted == [unmapped, unmapped]
+        client.close()
+
+    def test_connection_error_without_fallback(self):
+        """Test an unreachable channel raises a connection error."""
+        client = MCPClient(transport=ChannelTransport())
+
+        with pytest.raises(Exception, match="Connection error"):
+            client.send_request("echo", {}, f"channel://127.0.0.1:{_free_port()}")
+
+    def test_referee_match_over_channels(self, tmp_path, monkeypatch):
+        """Test a full referee match with both players reached over channels."""
+        monkeypatch.chdir(tmp_path)  # agents log under ./SHARED/logs
+        from mcp_even_odd_league.agents.player_P01 import main as player_P01
+        from mcp_even_odd_league.agents.player_P02 import main as player_P02
+        from mcp_even_odd_league.agents.referee_REF01.main import Referee
+
+        servers = [ChannelServer(player_P01.create_dispatcher(player_P01.Player("P01")), host="127.0.0.1"),
+                   ChannelServer(player_P02.create_dispatcher(player_P02.Player("P02")), host="127.0.0.1")]
+        for channel_server in servers:
+            channel_server.start()
+        referee = Referee("REF01")
+        referee.mcp_client = MCPClient(transport=ChannelTransport())
+
+        try:
+            result = referee.run_match("R1M1", "P01", "P02",
+                                       f"channel://127.0.0.1:{servers[0].port}",
+                                       f"channel://127.0.0.1:{servers[1].port}",
+                                       "league_channel", 1, report_to_league_manager=False)
+        finally:
+            referee.mcp_client.close()
+            for channel_server in servers:
+                channel_server.close()
+
+        assert result["is_draw"] or result["winner_id"] in ("P01", "P02")
+        assert referee.mcp_client.pool_stats()["requests"] == 6
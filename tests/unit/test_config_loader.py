@@ -112,3 +112,78 @@ class TestConfigLoaderEnvironment:
 
         assert config.timeouts.game_join_ack_timeout_sec == 10
         assert config.timeouts.move_timeout_sec == 60
+
+    def test_socket_dir_switches_endpoints_to_unix(self, monkeypatch):
+        """Test that AGENT_SOCKET_DIR gives agents unix:// endpoints."""
+        network = ConfigLoader().load_system().network
+        assert network.endpoint_for("P01", 8101) == "http://localhost:8101/mcp"
+        assert network.socket_path("P01") is None
+
+        monkeypatch.setenv("AGENT_SOCKET_DIR", "/tmp/league")
+        network = ConfigLoader().load_system().network
+        assert network.endpoint_for("P01", 8101) == "unix:///tmp/league/P01.sock"
+        assert network.socket_path("league_manager") == "/tmp/league/league_manager.sock"
+
+    def test_server_mode_flag_overrides_env(self, monkeypatch):
+        """Test that --async wins over AGENT_SERVER_MODE."""
+        monkeypatch.setenv("AGENT_SERVER_MODE", "flask")
+        assert ConfigLoader.get_server_mode(["P01", "--async"]) == "async"
+        assert ConfigLoader.get_server_mode(["P01"]) == "flask"
+
+        monkeypatch.setenv("AGENT_SERVER_MODE", "async")
+        assert ConfigLoader.get_server_mode([]) == "async"
+
+    def test_server_workers_from_env(self, monkeypatch):
+        """Test that AGENT_SERVER_WORKERS sizes the async server's handler pool."""
+        monkeypatch.delenv("AGENT_SERVER_WORKERS", raising=False)
+        assert ConfigLoader.get_server_workers() == 256
+        monkeypatch.setenv("AGENT_SERVER_WORKERS", "64")
+        assert ConfigLoader.get_server_workers() == 64
+
+    def test_max_body_bytes_from_env(self, monkeypatch):
+        """Test that AGENT_MAX_BODY_BYTES sets the server request body limit."""
+        monkeypatch.delenv("AGENT_MAX_BODY_BYTES", raising=False)
+        assert ConfigLoader.get_max_body_bytes() == 10 * 1024 * 1024
+        monkeypatch.setenv("AGENT_MAX_BODY_BYTES", "1024")
+        assert ConfigLoader.get_max_body_bytes() == 1024
+
+    def test_logging_config_from_env(self, monkeypatch):
+        """Test that LOG_* env vars configure buffered logging."""
+        assert ConfigLoader().load_system().logging.buffered is False
+
+        monkeypatch.setenv("LOG_BUFFERED", "true")
+        monkeypatch.setenv("LOG_QUEUE_SIZE", "50")
+        monkeypatch.setenv("LOG_OVERFLOW_POLICY", "block")
+        logging_config = ConfigLoader().load_system().logging
+        assert logging_config.buffered is True
+        assert logging_config.queue_size == 50
+        assert logging_config.overflow_policy == "block"
+
+        monkeypatch.setenv("LOG_OVERFLOW_POLICY", "spill")
+        with pytest.raises(ValueError):
+            ConfigLoader().load_system()
+
+        monkeypatch.setenv("LOG_OVERFLOW_POLICY", "drop")
+        for interval in ("0", "-1", "nan"):
+            monkeypatch.setenv("LOG_FLUSH_INTERVAL", interval)
+            with pytest.raises(ValueError, match="flush interval"):
+                ConfigLoader().load_system()
+
+    def test_log_filters_from_env(self, monkeypatch):
+        """Test that log levels and sample rates are parsed from env vars."""
+        monkeypatch.setenv("LOG_LEVEL", "info")
+        monkeypatch.setenv("LOG_COMPONENT_LEVELS", "player=warning, referee:REF01=DEBUG")
+        monkeypatch.setenv("LOG_SAMPLE_RATES", "STATE_TRANSITION=0.01,TIMEOUT_*=1,*_TRANSITION=0.5")
+        logging_config = ConfigLoader().load_system().logging
+
+        assert logging_config.level_for("player:P01") == "WARNING"
+        assert logging_config.level_for("referee:REF01") == "DEBUG"
+        assert logging_config.level_for("league_manager") == "INFO"
+        assert logging_config.sample_rate_for("STATE_TRANSITION") == 0.01
+        assert logging_config.sample_rate_for("MATCH_STATE_TRANSITION") == 0.5
+        assert logging_config.sample_rate_for("TIMEOUT_GAME_JOIN_ACK") == 1.0
+        assert logging_config.sample_rate_for("MATCH_STARTED") == 1.0
+
+        monkeypatch.setenv("LOG_LEVEL", "LOUD")
+        with pytest.raises(ValueError):
+            ConfigLoader().load_system()
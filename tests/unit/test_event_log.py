@@ -0,0 +1,119 @@
+"""
+Unit tests for the append-only event log and event-sourced standings.
+"""
+
+import threading
+
+from mcp_even_odd_league.agents.league_manager.main import LeagueManager
+from mcp_even_odd_league.league_sdk.event_log import EventLog
+
+
+def _report(match_id, round_id, winner, loser, status="WIN"):
+    return {"match_id": match_id, "round_id": round_id,
+            "result": {"winner": winner, "score": {winner: 3, loser: 0}, "details": {"status": status}}}
+
+
+class TestEventLog:
+    """Tests for EventLog."""
+
+    def test_append_and_recover(self, tmp_path):
+        """Test events come back in order with sequence numbers."""
+        log = EventLog(tmp_path / "events.jsonl")
+        assert log.recover() == (None, [])
+        assert [log.append({"type": "A", "n": n}) for n in range(3)] == [1, 2, 3]
+        log.close()
+
+        state, events = EventLog(tmp_path / "events.jsonl").recover()
+        assert state is None
+        assert events == [{"seq": 1, "type": "A", "n": 0}, {"seq": 2, "type": "A", "n": 1},
+                          {"seq": 3, "type": "A", "n": 2}]
+
+    def test_snapshot_bounds_replay(self, tmp_path):
+        """Test recovery returns the snapshot plus only the events after it."""
+        log = EventLog(tmp_path / "events.jsonl", fsync=False)
+        for n in range(5):
+            log.append({"type": "A", "n": n})
+        log.snapshot({"total": 10})
+        log.append({"type": "A", "n": 5})
+        log.close()
+
+        reopened = EventLog(tmp_path / "events.jsonl")
+        state, events = reopened.recover()
+        assert state == {"total": 10}
+        assert events == [{"seq": 6, "type": "A", "n": 5}]
+        assert reopened.append({"type": "A", "n": 6}) == 7
+        assert reopened.since_snapshot == 2
+
+    def test_torn_append_is_dropped(self, tmp_path):
+        """Test a partial final line is discarded and the log stays appendable."""
+        log = EventLog(tmp_path / "events.jsonl")
+        log.append({"type": "A"})
+        log.close()
+        with open(tmp_path / "events.jsonl", "ab") as f:
+            f.write(b'{"seq":2,"type":')
+
+        log = EventLog(tmp_path / "events.jsonl")
+        assert log.append({"type": "B"}) == 2
+        log.close()
+        assert [e["type"] for e in EventLog(tmp_path / "events.jsonl").recover()[1]] == ["A", "B"]
+
+
+class TestEventSourcedStandings:
+    """Tests for LeagueManager standings rebuilt from the event log."""
+
+    def test_standings_survive_restart(self, tmp_path, monkeypatch):
+        """Test a restarted League Manager recovers standings from snapshot and tail."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("EVENT_LOG", "true")
+        monkeypatch.setenv("EVENT_SNAPSHOT_EVERY", "2")
+        manager = LeagueManager("league_events")
+        manager.update_standings_from_match(_report("R1M1", 1, "P01", "P02"))
+        manager.update_standings_from_match(_report("R1M2", 1, "P03", "P04"))
+        manager.update_standings_from_match(_report("R2M1", 2, "P01", "P03"))
+        expected = manager.standings.as_table()
+        manager.event_log.close()
+
+        restarted = LeagueManager("league_events")
+        assert restarted.event_log.seq == 3
+        assert restarted.event_log.since_snapshot == 1
+        assert restarted.standings.as_table() == expected
+        assert (restarted.total_matches, restarted.current_round) == (3, 2)
+
+    def test_concurrent_and_retried_reports(self, tmp_path, monkeypatch):
+        """Test concurrent reports, each sent twice, are counted once and recovered intact."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("EVENT_LOG", "true")
+        monkeypatch.setenv("EVENT_SNAPSHOT_EVERY", "7")
+        manager = LeagueManager("league_events")
+        players = [f"P{n:02d}" for n in range(1, 9)]
+        barrier = threading.Barrier(8)
+
+        def report(worker):
+            barrier.wait()
+            for n in range(25):
+                match = _report(f"W{worker}M{n}", n + 1, players[worker], players[(worker + n % 7 + 1) % 8])
+                manager.update_standings_from_match(match)
+                manager.update_standings_from_match(match)  # retried report
+
+        threads = [threading.Thread(target=report, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        manager.event_log.close()
+
+        assert manager.total_matches == 200
+        assert sum(row["wins"] for row in manager.standings.as_table()) == 200
+        restarted = LeagueManager("league_events")
+        assert restarted.standings.as_table() == manager.standings.as_table()
+        assert restarted.total_matches == 200
+        restarted.update_standings_from_match(_report("W0M0", 1, "P01", "P02"))
+        assert restarted.total_matches == 200
+
+    def test_event_log_off_by_default(self, tmp_path, monkeypatch):
+        """Test no event log is written unless EVENT_LOG is set."""
+        monkeypatch.chdir(tmp_path)
+        manager = LeagueManager("league_events")
+        manager.update_standings_from_match(_report("R1M1", 1, "P01", "P02"))
+        assert manager.event_log is None
+        assert not list(tmp_path.rglob("events.jsonl"))
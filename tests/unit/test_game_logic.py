@@ -136,3 +136,56 @@ class TestValidateParityChoice:
         assert game_logic.validate_parity_choice("invalid") is False
         assert game_logic.validate_parity_choice("") is False
         assert game_logic.validate_parity_choice("both") is False
+
+
+class TestDetermineWinnersBatch:
+    """Tests for determine_winners_batch function."""
+
+    def _expected(self, drawn_number, a, b):
+        choice = {game_logic.EVEN: "even", game_logic.ODD: "odd"}
+        result = game_logic.determine_winner(drawn_number, choice[a], choice[b], "A", "B")
+        if result["is_draw"]:
+            return game_logic.NO_WINNER
+        return game_logic.WINNER_A if result["winner_id"] == "A" else game_logic.WINNER_B
+
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_matches_single_match_rules(self, use_numpy):
+        """Test that every parity/choice combination agrees with determine_winner."""
+        if use_numpy and game_logic.numpy is None:
+            pytest.skip("numpy not installed")
+        cases = [(d, a, b) for d in (1, 2, 9, 10, 257, 1000) for a in (0, 1) for b in (0, 1)]
+        drawn, a_choices, b_choices = zip(*cases)
+
+        outcome = game_logic.determine_winners_batch(drawn, a_choices, b_choices, use_numpy=use_numpy)
+
+        assert list(outcome.winner) == [self._expected(*case) for case in cases]
+        assert list(outcome.is_draw) == [int(w == game_logic.NO_WINNER) for w in outcome.winner]
+
+    def test_score_vectors(self):
+        """Test that scores follow the configured points."""
+        outcome = game_logic.determine_winners_batch(
+            [2, 2, 3], [game_logic.EVEN, game_logic.ODD, game_logic.EVEN],
+            [game_logic.ODD, game_logic.EVEN, game_logic.EVEN],
+            win_points=3, draw_points=1, loss_points=0, use_numpy=False
+        )
+
+        assert list(outcome.winner) == [game_logic.WINNER_A, game_logic.WINNER_B, game_logic.NO_WINNER]
+        assert list(outcome.score_A) == [3, 0, 1]
+        assert list(outcome.score_B) == [0, 3, 1]
+
+    def test_large_point_values(self):
+        """Test that points outside a byte are still scored correctly."""
+        outcome = game_logic.determine_winners_batch([2], [game_logic.EVEN], [game_logic.ODD],
+                                                     win_points=1000, loss_points=-5, use_numpy=False)
+        assert list(outcome.score_A) == [1000]
+        assert list(outcome.score_B) == [-5]
+
+    def test_empty_and_mismatched_inputs(self):
+        """Test empty batches and length validation."""
+        assert len(game_logic.determine_winners_batch([], [], [], use_numpy=False).winner) == 0
+        with pytest.raises(ValueError, match="same length"):
+            game_logic.determine_winners_batch([1, 2], [0], [1])
+
+    def test_encode_choices(self):
+        """Test encoding parity strings."""
+        assert game_logic.encode_choices(["even", "ODD"]) == [game_logic.EVEN, game_logic.ODD]
@@ -0,0 +1,63 @@
+"""
+Unit tests for the JSON codec.
+"""
+
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+from mcp_even_odd_league.league_sdk import json_codec
+from mcp_even_odd_league.league_sdk.logger import JsonLogger
+
+
+SAMPLE = {
+    "jsonrpc": "2.0",
+    "params": {"name": "Pläyer / א", "scores": [1, 2.5, None, True], 7: "int key"},
+    "naive": datetime(2025, 1, 2, 3, 4, 5, 6789),
+    "aware": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "day": date(2025, 1, 2)
+}
+
+
+def reference_dumps(obj):
+    """Standard-library encoding with the codec's documented semantics"""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=json_codec._default)
+
+
+class TestJsonCodec:
+    """Tests for json_codec dumps/loads."""
+
+    def test_matches_reference_encoding(self):
+        """Test the active backend produces the stdlib reference output."""
+        assert json_codec.dumps(SAMPLE) == reference_dumps(SAMPLE)
+        assert json_codec.dumpb(SAMPLE) == reference_dumps(SAMPLE).encode("utf-8")
+
+    def test_datetimes(self):
+        """Test naive datetimes get a Z suffix and aware ones keep their offset."""
+        decoded = json_codec.loads(json_codec.dumpb(SAMPLE))
+
+        assert decoded["naive"] == "2025-01-02T03:04:05.006789Z"
+        assert decoded["aware"] == "2025-01-02T03:04:05+00:00"
+        assert decoded["day"] == "2025-01-02"
+        assert decoded["params"]["7"] == "int key"
+
+    def test_loads_accepts_text_and_bytes(self):
+        """Test str and bytes documents decode alike."""
+        assert json_codec.loads('{"a":[1]}') == json_codec.loads(b'{"a":[1]}') == {"a": [1]}
+
+    def test_errors(self):
+        """Test unserializable values and malformed documents raise."""
+        with pytest.raises(TypeError):
+            json_codec.dumps({"value": object()})
+        with pytest.raises(ValueError):
+            json_codec.loads(b'{"a": ')
+
+    def test_logger_uses_codec(self, tmp_path):
+        """Test log lines are compact and accept datetime details."""
+        logger = JsonLogger("player:P01", logs_root=tmp_path)
+        logger.info("MATCH_STARTED", at=datetime(2025, 1, 2, 3, 4, 5))
+
+        line = logger.log_path.read_text(encoding="utf-8").strip()
+        entry = json_codec.loads(line)
+        assert entry["data"] == {"at": "2025-01-02T03:04:05Z"}
+        assert line == json_codec.dumps(entry)
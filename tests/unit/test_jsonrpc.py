@@ -0,0 +1,167 @@
+"""
+Unit tests for server-side JSON-RPC handling.
+
+Exercises the method dispatcher and batch handling directly and through a
+player's Flask /mcp route.
+"""
+
+import asyncio
+
+import pytest
+from mcp_even_odd_league.league_sdk import jsonrpc
+from mcp_even_odd_league.agents.player_P01 import main as player_main
+
+
+def _echo(data):
+    """Single-request processor that echoes params or fails on method 'fail'."""
+    if data.get("method") == "fail":
+        return jsonrpc.error_response(jsonrpc.METHOD_NOT_FOUND, "Method not found: fail", data.get("id")), 404
+    return jsonrpc.result_response(data.get("params"), data.get("id")), 200
+
+
+class TestDispatchBatch:
+    """Tests for dispatch_batch."""
+
+    def test_responses_keep_request_order(self):
+        """Test that each request gets its own response, errors included."""
+        responses, status = jsonrpc.dispatch_batch([
+            {"jsonrpc": "2.0", "method": "echo", "params": {"i": 0}, "id": "a"},
+            {"jsonrpc": "2.0", "method": "fail", "params": {}, "id": "b"},
+        ], _echo)
+
+        assert status == 200
+        assert responses[0] == {"jsonrpc": "2.0", "result": {"i": 0}, "id": "a"}
+        assert responses[1]["error"]["code"] == jsonrpc.METHOD_NOT_FOUND
+
+    def test_notifications_get_no_response(self):
+        """Test that a notification-only batch returns no body."""
+        responses, status = jsonrpc.dispatch_batch([
+            {"jsonrpc": "2.0", "method": "echo", "params": {}},
+        ], _echo)
+
+        assert responses is None
+        assert status == 204
+
+    def test_empty_batch_is_one_error_object(self):
+        """Test that an empty batch is answered with a single error, not an array."""
+        response, status = jsonrpc.dispatch_batch([], _echo)
+        assert status == 400
+        assert response == jsonrpc.error_response(jsonrpc.INVALID_REQUEST, "Invalid Request: empty batch")
+
+    @pytest.mark.parametrize("element", [1, {"foo": "boo"}, {"jsonrpc": "2.0", "method": 1}, {"method": "echo"}])
+    def test_invalid_element_is_answered(self, element):
+        """Test that invalid elements get an Invalid Request error with a null id."""
+        responses, status = jsonrpc.dispatch_batch([element], _echo)
+        assert status == 200
+        assert len(responses) == 1
+        assert responses[0]["error"]["code"] == jsonrpc.INVALID_REQUEST
+        assert responses[0]["id"] is None
+
+    def test_mixed_batch(self):
+        """Test valid requests, notifications and invalid elements in one batch."""
+        responses, status = jsonrpc.dispatch_batch([
+            {"jsonrpc": "2.0", "method": "echo", "params": [1], "id": "1"},
+            {"jsonrpc": "2.0", "method": "echo", "params": [7]},
+            {"jsonrpc": "2.0", "method": "fail", "id": "2"},
+            {"foo": "boo"},
+            {"jsonrpc": "2.0", "method": "fail"},
+            1,
+        ], _echo)
+
+        assert status == 200
+        assert [(r["id"], r.get("error", {}).get("code")) for r in responses] == [
+            ("1", None), ("2", jsonrpc.METHOD_NOT_FOUND), (None, jsonrpc.INVALID_REQUEST), (None, jsonrpc.INVALID_REQUEST)]
+
+
+class TestMethodDispatcher:
+    """Tests for MethodDispatcher."""
+
+    @pytest.fixture
+    def dispatcher(self):
+        dispatcher = jsonrpc.MethodDispatcher()
+        dispatcher.register("echo", lambda params: params)
+        dispatcher.register("boom", lambda params: 1 / 0)
+        dispatcher.register_many(["ping", "pong"], lambda method, params: method)
+        return dispatcher
+
+    def test_registered_method_returns_result(self, dispatcher):
+        """Test that a registered handler's return value becomes the result."""
+        response, status = dispatcher.dispatch({"jsonrpc": "2.0", "method": "echo", "params": {"a": 1}, "id": 7})
+        assert status == 200
+        assert response == {"jsonrpc": "2.0", "result": {"a": 1}, "id": 7}
+
+    def test_register_many_passes_method(self, dispatcher):
+        """Test that a shared handler receives the method name."""
+        response, _ = dispatcher.dispatch({"jsonrpc": "2.0", "method": "pong", "id": 1})
+        assert response["result"] == "pong"
+
+    @pytest.mark.parametrize("data, code, status", [
+        (None, jsonrpc.PARSE_ERROR, 400),
+        ({"jsonrpc": "1.0", "method": "echo", "id": 1}, jsonrpc.INVALID_REQUEST, 400),
+        ({"jsonrpc": "2.0", "id": 1}, jsonrpc.INVALID_REQUEST, 400),
+        ({"jsonrpc": "2.0", "method": "missing", "id": 1}, jsonrpc.METHOD_NOT_FOUND, 404),
+        ({"jsonrpc": "2.0", "method": "boom", "id": 1}, jsonrpc.INTERNAL_ERROR, 500),
+    ])
+    def test_error_envelopes(self, dispatcher, data, code, status):
+        """Test that invalid requests and handler failures map to JSON-RPC errors."""
+        response, actual_status = dispatcher.dispatch(data)
+        assert actual_status == status
+        assert response["error"]["code"] == code
+
+
+    def test_async_batch_validation(self, dispatcher):
+        """Test that handle_async answers invalid elements and empty batches like handle."""
+        batch = [{"foo": "boo"}, {"jsonrpc": "2.0", "method": "echo", "params": 1, "id": 3},
+                 {"jsonrpc": "2.0", "method": "missing"}]
+        assert asyncio.run(dispatcher.handle_async(batch)) == dispatcher.handle(batch)
+        assert asyncio.run(dispatcher.handle_async([])) == dispatcher.handle([])
+
+    def test_coroutine_handler_reuses_thread_loop(self, dispatcher):
+        """Test that dispatch runs coroutine handlers on one event loop per thread."""
+        async def running_loop(params):
+            await asyncio.sleep(0)
+            return asyncio.get_running_loop()
+        dispatcher.register("loop", running_loop)
+
+        request = {"jsonrpc": "2.0", "method": "loop", "id": 1}
+        first, _ = dispatcher.dispatch(request)
+        second, _ = dispatcher.dispatch(request)
+        assert first["result"] is second["result"]
+        assert not first["result"].is_running()
+
+
+class TestAgentRoute:
+    """Tests for batch handling on an agent's /mcp route."""
+
+    @pytest.fixture
+    def client(self):
+        return player_main.app.test_client()
+
+    def test_batch_round_trip(self, client):
+        """Test that a batch of requests is answered in one response array."""
+        response = client.post("/mcp", json=[
+            {"jsonrpc": "2.0", "method": "round_announcement", "params": {}, "id": 1},
+            {"jsonrpc": "2.0", "method": "unknown_method", "params": {}, "id": 2},
+        ])
+
+        body = response.get_json()
+        assert response.status_code == 200
+        assert [item["id"] for item in body] == [1, 2]
+        assert "result" in body[0]
+        assert body[1]["error"]["code"] == jsonrpc.METHOD_NOT_FOUND
+
+    def test_invalid_batches(self, client):
+        """Test that invalid elements and empty batches are answered on the route."""
+        response = client.post("/mcp", json=[{"foo": "boo"}])
+        assert response.status_code == 200
+        assert response.get_json() == [jsonrpc.error_response(
+            jsonrpc.INVALID_REQUEST, "Invalid Request: batch element is not a JSON-RPC 2.0 request")]
+
+        response = client.post("/mcp", json=[])
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == jsonrpc.INVALID_REQUEST
+
+    def test_single_request_unchanged(self, client):
+        """Test that single requests keep their status codes."""
+        response = client.post("/mcp", json={"jsonrpc": "2.0", "method": "unknown_method", "id": 1})
+        assert response.status_code == 404
@@ -0,0 +1,179 @@
+"""
+Unit tests for indexed log queries.
+"""
+
+import gzip
+
+import pytest
+from mcp_even_odd_league.league_sdk import json_codec, log_query, logger as logger_module
+from mcp_even_odd_league.league_sdk.config_models import LoggingConfig
+from mcp_even_odd_league.league_sdk.log_query import LogQuery
+from mcp_even_odd_league.league_sdk.logger import JsonLogger
+
+
+@pytest.fixture(autouse=True)
+def close_writers():
+    """Stop background writers and compression started by a test"""
+    yield
+    logger_module.close_log_writers()
+
+
+def play_match(tmp_path, match_id, config=None):
+    """Log one match from the referee's and both players' side"""
+    referee = JsonLogger("referee:REF01", logs_root=tmp_path, config=config).bind(match_id=match_id)
+    players = [JsonLogger(f"player:{p}", logs_root=tmp_path, config=config) for p in ("P01", "P02")]
+    referee.info("MATCH_STARTED")
+    for player in players:
+        player.log_event("GAME_INVITATION", {"match_id": match_id, "conversation_id": f"conv-{match_id}"})
+    referee.info("MATCH_COMPLETED")
+
+
+class TestLogQuery:
+    """Tests for LogQuery over active files and segments."""
+
+    def test_match_across_agents(self, tmp_path):
+        """Test one query returns a match's events from every agent log, in time order."""
+        play_match(tmp_path, "R1M1")
+        play_match(tmp_path, "R1M2")
+
+        entries = LogQuery(tmp_path).query(match_id="R1M1")
+
+        assert [e["event_type"] for e in entries] == [
+            "MATCH_STARTED", "GAME_INVITATION", "GAME_INVITATION", "MATCH_COMPLETED"]
+        assert {e["agent_id"] for e in entries} == {"referee:REF01", "player:P01", "player:P02"}
+        assert [e["timestamp"] for e in entries] == sorted(e["timestamp"] for e in entries)
+        assert (tmp_path / "agents" / "REF01.log.jsonl.idx.json").exists()
+
+    def test_filters(self, tmp_path):
+        """Test conversation, event glob and time filters."""
+        play_match(tmp_path, "R1M1")
+        query = LogQuery(tmp_path)
+
+        assert len(query.query(conversation_id="conv-R1M1")) == 2
+        assert len(query.query(event_type="MATCH_*")) == 2
+        assert query.query(since="9999") == []
+        assert len(query.query(until="9999")) == 4
+
+    def test_postings_limit_rows_checked(self, tmp_path, monkeypatch):
+        """Test field filters only check the rows posted under their values."""
+        for i in range(20):
+            play_match(tmp_path, f"R1M{i}")
+        checked = []
+        original = log_query._matches
+        monkeypatch.setattr(log_query, "_matches", lambda row, *filters: (
+            checked.append(row) or original(row, *filters)))
+        query = LogQuery(tmp_path)
+
+        assert len(query.query(match_id="R1M7")) == 4
+        assert len(checked) == 4
+        assert len(query.query(match_id="R1M7", event_type="GAME_*")) == 2
+        assert len(checked) == 4 + 2  # the smallest posting list wins: none in the referee log
+
+    def test_active_index_grows_incrementally(self, tmp_path, monkeypatch):
+        """Test a grown active file is indexed from where the last index ended."""
+        logger = JsonLogger("player:P01", logs_root=tmp_path)
+        logger.info("FIRST", match_id="M1")
+        LogQuery(tmp_path).query(match_id="M1")
+        logger.info("SECOND", match_id="M1")
+
+        scanned = []
+        original = log_query._scan_lines
+        monkeypatch.setattr(log_query, "_scan_lines", lambda data, start, end, block=None: (
+            scanned.append(start) or original(data, start, end, block)))
+        entries = LogQuery(tmp_path).query(match_id="M1")
+
+        assert [e["event_type"] for e in entries] == ["FIRST", "SECOND"]
+        assert scanned and scanned[0] > 0
+
+    def test_rotated_segments(self, tmp_path):
+        """Test compressed segments are indexed at rotation and read by block."""
+        config = LoggingConfig(rotate_max_bytes=1000)
+        for i in range(10):
+            play_match(tmp_path, f"R1M{i}", config)
+        logger_module.close_log_writers()
+
+        segments = sorted((tmp_path / "agents").glob("REF01.log.*.jsonl.gz"))
+        assert segments
+        assert all(log_query.index_path(segment).exists() for segment in segments)
+        assert not list((tmp_path / "agents").glob("REF01.log.*.jsonl.idx.json"))
+        entries = LogQuery(tmp_path).query(match_id="R1M3")
+        assert [e["event_type"] for e in entries] == [
+            "MATCH_STARTED", "GAME_INVITATION", "GAME_INVITATION", "MATCH_COMPLETED"]
+
+    def test_manifest_ranges_skip_segments(self, tmp_path):
+        """Test segments outside the time range are not opened."""
+        logger = JsonLogger("player:P01", logs_root=tmp_path, config=LoggingConfig(compress_rotated=False))
+        logger.info("OLD")
+        logger.rotate()
+        logger_module.close_log_writers()
+        logger.info("NEW")
+
+        query = LogQuery(tmp_path)
+        segment = tmp_path / "agents" / "P01.log.000001.jsonl"
+        cutoff = query.query(event_type="NEW")[0]["timestamp"]
+        assert segment in query.log_files()
+        assert segment not in query.log_files(since=cutoff + "~")
+        assert [e["event_type"] for e in query.query()] == ["OLD", "NEW"]
+
+
+    def test_segment_mid_compression_is_read_once(self, tmp_path, monkeypatch):
+        """Test a segment present as both .jsonl and .jsonl.gz is only read from the .gz."""
+        logger = JsonLogger("player:P01", logs_root=tmp_path, config=LoggingConfig(compress_rotated=False))
+        logger.info("OLD", match_id="M1")
+        logger.rotate()
+        logger_module.close_log_writers()
+        segment = tmp_path / "agents" / "P01.log.000001.jsonl"
+        compressed = segment.with_name(segment.name + ".gz")
+        log_query.compress_segment(segment, compressed)
+
+        query = LogQuery(tmp_path)
+        assert segment not in query.log_files()
+        assert compressed in query.log_files()
+        assert [e["event_type"] for e in query.query(match_id="M1")] == ["OLD"]
+
+        # Listed as .jsonl, then removed by the compressor before it was read
+        segment.unlink()
+        monkeypatch.setattr(query, "log_files", lambda since=None, until=None: [segment])
+        assert [e["event_type"] for e in query.query(match_id="M1")] == ["OLD"]
+
+
+class TestCompressSegment:
+    """Tests for block-compressed segments."""
+
+    def test_blocks_are_a_valid_gzip_file(self, tmp_path):
+        """Test the multi-member output reads back whole with gzip and by block."""
+        source = tmp_path / "seg.jsonl"
+        lines = [json_codec.dumps({"timestamp": f"2025-01-01T00:00:{i:02d}Z", "event_type": "E",
+                                   "data": {"match_id": f"M{i % 3}", "pad": "x" * 50}}) for i in range(60)]
+        source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        target = tmp_path / "seg.jsonl.gz"
+
+        index = log_query.compress_segment(source, target, block_size=512)
+
+        assert len(index["blocks"]) > 1
+        with gzip.open(target, "rt", encoding="utf-8") as f:
+            assert f.read().splitlines() == lines
+        rows = [row for row in index["rows"] if row[log_query.MATCH_ID] == "M1"]
+        entries = log_query.read_rows(target, index, rows)
+        assert [e["timestamp"] for e in entries] == [json_codec.loads(lines[i])["timestamp"] for i in range(1, 60, 3)]
+
+    def test_foreign_gzip_is_indexed(self, tmp_path):
+        """Test a gzip file written elsewhere is still queryable."""
+        path = tmp_path / "agents" / "OLD.log.000001.jsonl.gz"
+        path.parent.mkdir()
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write('{"timestamp":"2025-01-01T00:00:00Z","event_type":"E","match_id":"M9"}\n')
+
+        assert LogQuery(tmp_path).query(match_id="M9")[0]["event_type"] == "E"
+
+
+class TestCli:
+    """Tests for the log_query command line."""
+
+    def test_prints_json_lines(self, tmp_path, capsys):
+        """Test matching entries are printed one per line."""
+        play_match(tmp_path, "R1M1")
+
+        assert log_query.main(["--root", str(tmp_path), "--match", "R1M1", "--event", "GAME_*"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [json_codec.loads(line)["agent_id"] for line in lines] == ["player:P01", "player:P02"]
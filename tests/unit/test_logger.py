@@ -0,0 +1,291 @@
+"""
+Unit tests for JsonLogger write modes.
+"""
+
+import gzip
+import threading
+
+import pytest
+from mcp_even_odd_league.league_sdk import json_codec, logger as logger_module
+from mcp_even_odd_league.league_sdk.config_models import LoggingConfig
+from mcp_even_odd_league.league_sdk.logger import BackgroundLogWriter, JsonLogger
+
+
+def read_entries(path):
+    """Decode every line of a JSONL file"""
+    return [json_codec.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture(autouse=True)
+def close_writers():
+    """Stop background writers started by a test"""
+    yield
+    logger_module.close_log_writers()
+
+
+class TestSynchronousLogger:
+    """Tests for the default write mode."""
+
+    def test_entries_are_written_immediately(self, tmp_path):
+        """Test each call appends a line before returning."""
+        logger = JsonLogger("player:P01", logs_root=tmp_path)
+        logger.info("STATE_TRANSITION", state="IDLE")
+
+        entries = read_entries(tmp_path / "agents" / "P01.log.jsonl")
+        assert [entry["data"] for entry in entries] == [{"state": "IDLE"}]
+        assert logger.flush() is True
+
+
+class TestLogFilters:
+    """Tests for level filtering and sampling."""
+
+    def test_minimum_level_per_component(self, tmp_path):
+        """Test entries below the component's level are discarded."""
+        config = LoggingConfig(level="INFO", component_levels={"player": "WARNING"})
+        player = JsonLogger("player:P01", logs_root=tmp_path, config=config)
+        referee = JsonLogger("referee:REF01", logs_root=tmp_path, config=config)
+        for logger in (player, referee):
+            logger.debug("DEBUG_EVENT")
+            logger.info("INFO_EVENT")
+            logger.error("ERROR_EVENT")
+
+        assert [e["event_type"] for e in read_entries(player.log_path)] == ["ERROR_EVENT"]
+        assert [e["event_type"] for e in read_entries(referee.log_path)] == ["INFO_EVENT", "ERROR_EVENT"]
+        assert not player.is_enabled("INFO")
+        assert player.bind(match_id="M1").is_enabled("ERROR", "ANY")
+
+    def test_sampling(self, tmp_path, monkeypatch):
+        """Test sample rates thin events and tag kept entries."""
+        config = LoggingConfig(sample_rates={"STATE_TRANSITION": 0.25, "NOISE": 0.0, "TIMEOUT_*": 1.0})
+        logger = JsonLogger("player:P01", logs_root=tmp_path, config=config)
+        draws = iter([0.1, 0.9, 0.3, 0.2])
+        monkeypatch.setattr(logger_module.random, "random", lambda: next(draws))
+        for _ in range(4):
+            logger.log_event("STATE_TRANSITION", {"state": "IDLE"})
+        logger.info("NOISE")
+        logger.info("TIMEOUT_GAME_JOIN_ACK")
+
+        entries = read_entries(logger.log_path)
+        assert [e["event_type"] for e in entries] == ["STATE_TRANSITION", "STATE_TRANSITION", "TIMEOUT_GAME_JOIN_ACK"]
+        assert entries[0]["sample_rate"] == 0.25
+        assert "sample_rate" not in entries[-1]
+        assert not logger.is_enabled("INFO", "NOISE")
+        assert logger.is_enabled("INFO", "STATE_TRANSITION")
+
+    def test_filtered_events_skip_serialization(self, tmp_path, monkeypatch):
+        """Test filtered events never reach the encoder or the file."""
+        monkeypatch.setattr(logger_module.json_codec, "dumps", lambda obj: pytest.fail("serialized"))
+        logger = JsonLogger("player:P01", logs_root=tmp_path, config=LoggingConfig(
+            level="WARNING", sample_rates={"NOISE": 0.0}))
+        logger.info("STATE_TRANSITION")
+        logger.error("NOISE")
+
+        assert not logger.log_path.exists()
+
+    def test_player_state_transition_is_guarded(self, tmp_path, monkeypatch, capsys):
+        """Test a filtered STATE_TRANSITION still changes state but builds no trace or event."""
+        monkeypatch.chdir(tmp_path)  # agents log under ./SHARED/logs
+        from mcp_even_odd_league.agents.player_P01.main import Player
+
+        player = Player("P01")
+        player.logger = JsonLogger("player:P01", logs_root=tmp_path, config=LoggingConfig(
+            sample_rates={"STATE_TRANSITION": 0.0}))
+        monkeypatch.setattr(player.logger, "log_event", lambda *args: pytest.fail("logged"))
+        capsys.readouterr()
+
+        player.transition_state("INVITED", "test")
+
+        assert player.state == "INVITED"
+        assert capsys.readouterr().out == ""
+
+
+class TestBufferedLogger:
+    """Tests for buffered logging on a background writer."""
+
+    def test_flush_writes_in_order(self, tmp_path):
+        """Test queued entries reach disk in order on flush, from bound children too."""
+        logger = JsonLogger("player:P01", logs_root=tmp_path, config=LoggingConfig(
+            buffered=True, flush_interval_sec=60, flush_max_entries=1000))
+        child = logger.bind(match_id="M1")
+        for i in range(5):
+            (child if i % 2 else logger).info("TICK", i=i)
+
+        assert logger.flush(timeout=5)
+        entries = read_entries(logger.log_path)
+        assert [entry["data"]["i"] for entry in entries] == [0, 1, 2, 3, 4]
+        assert entries[1]["match_id"] == "M1"
+
+    def test_flushes_on_size_and_interval(self, tmp_path):
+        """Test a full batch and an elapsed interval both trigger writes."""
+        path = tmp_path / "size.jsonl"
+        writer = BackgroundLogWriter(path, LoggingConfig(flush_interval_sec=60, flush_max_entries=3))
+        for i in range(3):
+            writer.write(str(i))
+        assert _wait_for(lambda: writer.written == 3)
+
+        timed = BackgroundLogWriter(tmp_path / "time.jsonl", LoggingConfig(flush_interval_sec=0.05))
+        timed.write("1")
+        assert _wait_for(lambda: timed.written == 1)
+        writer.close()
+        timed.close()
+
+    def test_close_flushes_pending_entries(self, tmp_path):
+        """Test shutdown writes what is still queued."""
+        path = tmp_path / "close.jsonl"
+        writer = BackgroundLogWriter(path, LoggingConfig(flush_interval_sec=60, flush_max_entries=1000))
+        writer.write("1")
+        writer.write("2")
+        writer.close(timeout=5)
+
+        assert path.read_text(encoding="utf-8") == "1\n2\n"
+        assert writer.flush() is True
+
+    def test_drop_policy_counts_discarded_entries(self, tmp_path):
+        """Test a full queue drops new entries instead of blocking."""
+        writer = BackgroundLogWriter(tmp_path / "drop.jsonl", LoggingConfig(queue_size=1, flush_max_entries=1))
+        stalled = _StalledFile(writer._file)
+        writer._file = stalled
+        writer.write("first")
+        assert stalled.entered.wait(5)  # the writer thread is now stuck on disk I/O
+
+        assert writer.write("queued") is True
+        assert writer.write("dropped") is False
+        assert writer.dropped == 1
+        stalled.release.set()
+        writer.close(timeout=5)
+        assert writer.written == 2
+
+    def test_block_policy_waits_for_space(self, tmp_path):
+        """Test the block policy never loses entries."""
+        path = tmp_path / "block.jsonl"
+        writer = BackgroundLogWriter(path, LoggingConfig(queue_size=2, overflow_policy="block"))
+        for i in range(200):
+            assert writer.write(str(i))
+        writer.close(timeout=5)
+
+        assert writer.dropped == 0
+        assert path.read_text(encoding="utf-8").splitlines() == [str(i) for i in range(200)]
+
+    def test_writers_are_shared_per_file(self, tmp_path):
+        """Test loggers for the same file share one writer, recreated after close."""
+        config = LoggingConfig(buffered=True)
+        first = logger_module.get_log_writer(tmp_path / "a.jsonl", config)
+
+        assert logger_module.get_log_writer(tmp_path / "a.jsonl", config) is first
+        first.close()
+        assert logger_module.get_log_writer(tmp_path / "a.jsonl", config) is not first
+
+
+class TestRotation:
+    """Tests for log rotation, compression and the segment manifest."""
+
+    def test_size_rotation_writes_manifest(self, tmp_path):
+        """Test segments roll over by size and are listed with their time ranges."""
+        logger = JsonLogger("player:P01", logs_root=tmp_path, config=LoggingConfig(
+            rotate_max_bytes=400, compress_rotated=False))
+        for i in range(10):
+            logger.info("TICK", i=i)
+
+        manifest = json_codec.loads((tmp_path / "agents" / "P01.log.manifest.json").read_bytes())
+        segments = manifest["segments"]
+        assert manifest["log"] == "P01.log.jsonl"
+        assert len(segments) >= 2
+        assert [s["seq"] for s in segments] == list(range(1, len(segments) + 1))
+        assert all(s["reason"] == "size" and s["bytes"] >= 400 for s in segments)
+
+        kept = []
+        for segment in segments:
+            entries = read_entries(tmp_path / "agents" / segment["file"])
+            assert len(entries) == segment["entries"]
+            assert entries[0]["timestamp"] == segment["first_timestamp"]
+            assert entries[-1]["timestamp"] == segment["last_timestamp"]
+            kept += entries
+        kept += read_entries(logger.log_path)
+        assert [entry["data"]["i"] for entry in kept] == list(range(10))
+
+    def test_segments_are_compressed(self, tmp_path):
+        """Test rotated segments are gzipped and the manifest updated."""
+        logger = JsonLogger("league_manager", "league_1", logs_root=tmp_path, config=LoggingConfig(
+            buffered=True, rotate_on_round=True))
+        logger.info("ROUND", round_id=1)
+        logger.rotate("round 1")
+        logger.info("ROUND", round_id=2)
+        logger_module.close_log_writers()
+
+        manifest = json_codec.loads((tmp_path / "league" / "league_1" / "league.log.manifest.json").read_bytes())
+        segment = manifest["segments"][0]
+        assert segment["file"] == "league.log.000001.jsonl.gz"
+        assert segment["compressed"] and segment["reason"] == "round 1"
+        assert not (tmp_path / "league" / "league_1" / "league.log.000001.jsonl").exists()
+        with gzip.open(tmp_path / "league" / "league_1" / segment["file"], "rt", encoding="utf-8") as f:
+            assert json_codec.loads(f.readline())["data"] == {"round_id": 1}
+        assert read_entries(logger.log_path)[0]["data"] == {"round_id": 2}
+
+    def test_manual_rotation_scans_existing_log(self, tmp_path):
+        """Test rotating a log written earlier counts its entries and continues numbering."""
+        logger = JsonLogger("player:P01", logs_root=tmp_path, config=LoggingConfig(compress_rotated=False))
+        logger.info("FIRST")
+        logger.info("SECOND")
+        logger.rotate()
+        logger.rotate()  # empty active file: nothing to rotate
+        logger.info("THIRD")
+        logger.rotate("restart")
+
+        segments = json_codec.loads((tmp_path / "agents" / "P01.log.manifest.json").read_bytes())["segments"]
+        assert [(s["file"], s["entries"], s["reason"]) for s in segments] == [
+            ("P01.log.000001.jsonl", 2, "manual"), ("P01.log.000002.jsonl", 1, "restart")]
+        assert segments[0]["first_timestamp"] <= segments[0]["last_timestamp"] <= segments[1]["first_timestamp"]
+
+    def test_time_rotation(self, tmp_path):
+        """Test an old active file rotates on the next write."""
+        logger = JsonLogger("player:P01", logs_root=tmp_path, config=LoggingConfig(
+            rotate_interval_sec=60, compress_rotated=False))
+        logger.info("OLD")
+        log_file = logger_module.get_log_file(logger.log_path, logger.config)
+        log_file.opened_at -= 61
+        logger.info("NEW")
+
+        assert read_entries(tmp_path / "agents" / "P01.log.000001.jsonl")[-1]["event_type"] == "NEW"
+        assert not logger.log_path.read_text(encoding="utf-8")
+
+    def test_league_manager_rotates_per_round(self, tmp_path, monkeypatch):
+        """Test the League Manager closes a segment when a new round's results arrive."""
+        from mcp_even_odd_league.agents.league_manager.main import LeagueManager
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("LOG_ROTATE_ON_ROUND", "true")
+        league_manager = LeagueManager("league_rotation")
+        for round_id in (1, 1, 2):
+            league_manager.logger.info("RESULT", round_id=round_id)
+            league_manager.update_standings_from_match({
+                "match_id": f"R{round_id}", "round_id": round_id,
+                "result": {"winner": "P1", "score": {"P1": 3, "P2": 0}, "details": {"status": "WIN"}}})
+
+        logger_module.close_log_writers()
+        manifest_path = league_manager.logger.log_path.with_name("league.log.manifest.json")
+        segments = json_codec.loads(manifest_path.read_bytes())["segments"]
+        assert [(s["reason"], s["entries"]) for s in segments] == [("round 1", 3)]
+
+
+class _StalledFile:
+    """Log file wrapper whose writes wait until released"""
+
+    def __init__(self, log_file):
+        self.log_file = log_file
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, entries):
+        self.entered.set()
+        self.release.wait(5)
+        return self.log_file.write(entries)
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until condition() holds or the timeout passes"""
+    event = threading.Event()
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return True
+        event.wait(0.01)
+    return condition()
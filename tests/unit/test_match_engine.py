@@ -0,0 +1,170 @@
+"""
+Unit tests for the referee match engine.
+
+Uses a fake referee so matches run without Flask servers or HTTP calls.
+"""
+
+import threading
+import time
+
+import pytest
+from mcp_even_odd_league.agents.referee_REF01.match_engine import MatchEngine, MatchState
+
+
+class _FakeLogger:
+    """Collects log events in memory."""
+
+    def __init__(self, context=None, events=None):
+        self.context = context or {}
+        self.events = events if events is not None else []
+
+    def bind(self, **context):
+        return _FakeLogger({**self.context, **context}, self.events)
+
+    def log_event(self, event_type, data=None):
+        self.events.append((self.context, event_type, data))
+
+
+class _FakeReferee:
+    """Referee stand-in that records concurrency while matches sleep."""
+
+    def __init__(self, duration=0.05, fail_match=None):
+        self.referee_id = "REF01"
+        self.logger = _FakeLogger()
+        self.duration = duration
+        self.fail_match = fail_match
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.busy_players = set()
+        self.overlaps = 0
+        self.started = []
+
+    def run_match(self, match_id, player_A_id, player_B_id, player_A_endpoint, player_B_endpoint,
+                  league_id, round_id, report_to_league_manager=True):
+        with self.lock:
+            if {player_A_id, player_B_id} & self.busy_players:
+                self.overlaps += 1
+            self.busy_players |= {player_A_id, player_B_id}
+            self.started.append(match_id)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.duration)
+        with self.lock:
+            self.running -= 1
+            self.busy_players -= {player_A_id, player_B_id}
+        if match_id == self.fail_match:
+            raise Exception("player unreachable")
+        return {"match_id": match_id, "winner_id": player_A_id}
+
+
+def _assignment(match_id, player_A_id, player_B_id):
+    return {
+        "match_id": match_id,
+        "league_id": "league_test",
+        "round_id": 1,
+        "player_A_id": player_A_id,
+        "player_B_id": player_B_id,
+        "player_A_endpoint": f"http://localhost/{player_A_id}",
+        "player_B_endpoint": f"http://localhost/{player_B_id}",
+    }
+
+
+class TestMatchEngine:
+    """Tests for MatchEngine."""
+
+    def test_runs_round_in_parallel(self):
+        """Test that disjoint matches run concurrently up to the limit."""
+        referee = _FakeReferee()
+        engine = MatchEngine(referee, max_concurrent_matches=3)
+        assignments = [_assignment(f"R1M{i}", f"P{2 * i}", f"P{2 * i + 1}") for i in range(6)]
+
+        results = engine.run_matches(assignments)
+        engine.shutdown()
+
+        assert [r["match_id"] for r in results] == [a["match_id"] for a in assignments]
+        assert 2 <= referee.peak <= 3
+
+    def test_shared_player_is_serialized(self):
+        """Test that matches sharing a player never overlap."""
+        referee = _FakeReferee()
+        engine = MatchEngine(referee, max_concurrent_matches=4)
+        assignments = [
+            _assignment("M1", "P01", "P02"),
+            _assignment("M2", "P01", "P03"),
+            _assignment("M3", "P03", "P04"),
+            _assignment("M4", "P02", "P04"),
+        ]
+
+        engine.run_matches(assignments)
+        engine.shutdown()
+
+        assert referee.overlaps == 0
+
+    def test_conflicting_matches_do_not_hold_workers(self):
+        """Test a match waiting for a busy player is deferred instead of occupying a worker."""
+        referee = _FakeReferee()
+        engine = MatchEngine(referee, max_concurrent_matches=2)
+        assignments = [
+            _assignment("M1", "P01", "P02"),
+            _assignment("M2", "P01", "P03"),
+            _assignment("M3", "P01", "P04"),
+            _assignment("M4", "P05", "P06"),
+        ]
+
+        engine.run_matches(assignments)
+        engine.shutdown()
+
+        assert set(referee.started[:2]) == {"M1", "M4"}
+        assert [m for m in referee.started if m != "M4"] == ["M1", "M2", "M3"]
+        assert referee.overlaps == 0
+
+    def test_shutdown_waits_for_deferred_matches(self):
+        """Test shutdown(wait=True) lets deferred matches run before stopping the pool."""
+        referee = _FakeReferee()
+        engine = MatchEngine(referee, max_concurrent_matches=2)
+        futures = [engine.submit(_assignment(f"M{i}", "P01", f"P0{i + 1}")) for i in range(1, 4)]
+
+        engine.shutdown()
+
+        assert [future.result(0)["match_id"] for future in futures] == ["M1", "M2", "M3"]
+
+    def test_submit_after_shutdown_is_rejected(self):
+        """Test that submit raises once the engine is shut down and registers nothing."""
+        engine = MatchEngine(_FakeReferee(), max_concurrent_matches=1)
+        engine.shutdown()
+
+        with pytest.raises(RuntimeError, match="shut down"):
+            engine.submit(_assignment("M1", "P01", "P02"))
+        assert not engine._pending
+
+    def test_failed_match_does_not_stop_batch(self):
+        """Test that one failing match is reported and others complete."""
+        referee = _FakeReferee(fail_match="M2")
+        engine = MatchEngine(referee, max_concurrent_matches=2)
+
+        results = engine.run_matches([
+            _assignment("M1", "P01", "P02"),
+            _assignment("M2", "P03", "P04"),
+        ])
+        engine.shutdown()
+
+        assert results[0]["winner_id"] == "P01"
+        assert results[1] == {"match_id": "M2", "error": "player unreachable"}
+        assert referee.logger.events[-1][0] == {"match_id": "M2"}
+        assert referee.logger.events[-1][1] == "MATCH_FAILED"
+
+
+class TestMatchState:
+    """Tests for MatchState."""
+
+    def test_transition_is_logged(self):
+        """Test that transitions update state and log through the bound logger."""
+        logger = _FakeLogger({"match_id": "M1"})
+        match = MatchState("M1", "league_test", 1, "P01", "P02", logger=logger)
+
+        match.transition("COLLECTING_CHOICES")
+
+        assert match.state == "COLLECTING_CHOICES"
+        assert logger.events == [({"match_id": "M1"}, "MATCH_STATE_TRANSITION",
+                                  {"old_state": "WAITING_FOR_PLAYERS", "new_state": "COLLECTING_CHOICES"})]
@@ -0,0 +1,251 @@
+"""
+Unit tests for MCP client.
+
+Tests JSON-RPC envelope handling and connection pooling against a local
+in-thread HTTP server (no agent processes required).
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from mcp_even_odd_league.league_sdk.async_mcp_client import AsyncMCPClient
+from mcp_even_odd_league.league_sdk.config_models import HttpPoolConfig
+from mcp_even_odd_league.league_sdk.mcp_client import MCPClient
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON-RPC handler that echoes params back as the result."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        rpc_request = json.loads(body)
+        if isinstance(rpc_request, list):
+            payload = [self._answer(item) for item in rpc_request]
+        else:
+            payload = self._answer(rpc_request)
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def _answer(rpc_request):
+        if rpc_request.get("method") == "slow":
+            time.sleep(0.5)
+        if rpc_request.get("method") == "fail":
+            return {"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found: fail"},
+                    "id": rpc_request.get("id")}
+        return {"jsonrpc": "2.0", "result": rpc_request.get("params"), "id": rpc_request.get("id")}
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StickyEchoHandler(_EchoHandler):
+    """Echo handler that keeps the connection open even when asked to close it."""
+
+    def do_POST(self):
+        super().do_POST()
+        self.close_connection = False
+
+
+def _serve(handler):
+    """Run a JSON-RPC server in a thread and yield its endpoint."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/mcp"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def endpoint():
+    """Run an echo JSON-RPC server for the duration of a test."""
+    yield from _serve(_EchoHandler)
+
+
+@pytest.fixture
+def sticky_endpoint():
+    """Run an echo server that ignores "Connection: close" requests."""
+    yield from _serve(_StickyEchoHandler)
+
+
+class TestSendRequest:
+    """Tests for send_request envelope handling."""
+
+    def test_returns_result(self, endpoint):
+        """Test that the JSON-RPC result is returned."""
+        client = MCPClient()
+        assert client.send_request("echo", {"value": 1}, endpoint) == {"value": 1}
+        client.close()
+
+    def test_error_is_raised(self, endpoint):
+        """Test that JSON-RPC errors are mapped to exceptions."""
+        client = MCPClient()
+        with pytest.raises(Exception, match="JSON-RPC error -32601"):
+            client.send_request("fail", {}, endpoint)
+        client.close()
+
+
+class TestSendBatch:
+    """Tests for send_batch."""
+
+    def test_results_are_aligned_with_calls(self, endpoint):
+        """Test that each call gets its own result or exception, in order."""
+        client = MCPClient()
+        results = client.send_batch([
+            ("echo", {"i": 0}),
+            ("fail", {}),
+            ("echo", {"i": 2}),
+        ], endpoint)
+
+        assert results[0] == {"i": 0}
+        assert isinstance(results[1], Exception)
+        assert "JSON-RPC error -32601" in str(results[1])
+        assert results[2] == {"i": 2}
+        assert client.pool_stats()["requests"] == 1
+        client.close()
+
+    def test_empty_batch_sends_nothing(self, endpoint):
+        """Test that an empty call list makes no request."""
+        client = MCPClient()
+        assert client.send_batch([], endpoint) == []
+        assert client.pool_stats()["requests"] == 0
+        client.close()
+
+    def test_async_batch(self, endpoint):
+        """Test that AsyncMCPClient.send_batch matches the sync contract."""
+        async def scenario():
+            async with AsyncMCPClient() as client:
+                return await client.send_batch([("echo", {"i": 0}), ("fail", {})], endpoint)
+
+        results = asyncio.run(scenario())
+        assert results[0] == {"i": 0}
+        assert isinstance(results[1], Exception)
+
+
+class TestConnectionPool:
+    """Tests for pooled keep-alive sessions."""
+
+    def test_connection_is_reused(self, endpoint):
+        """Test that consecutive requests share one TCP connection."""
+        client = MCPClient()
+        for i in range(5):
+            client.send_request("echo", {"i": i}, endpoint)
+
+        stats = client.pool_stats()
+        assert stats["requests"] == 5
+        assert stats["pool_misses"] == 1
+        assert stats["pool_hits"] == 4
+        assert stats["endpoints"] == 1
+        client.close()
+
+    def test_idle_sessions_are_evicted(self, endpoint):
+        """Test that idle sessions are closed and counters are kept."""
+        client = MCPClient(HttpPoolConfig(idle_timeout_sec=0))
+        client.send_request("echo", {}, endpoint)
+
+        assert client.session_pool.evict_idle() == 1
+        stats = client.pool_stats()
+        assert stats["endpoints"] == 0
+        assert stats["evictions"] == 1
+        assert stats["requests"] == 1
+
+    def test_session_in_use_is_not_evicted(self, endpoint):
+        """Test a checked-out session survives eviction until its request ends."""
+        pool = MCPClient(HttpPoolConfig(idle_timeout_sec=0)).session_pool
+
+        with pool.checkout(endpoint) as session:
+            assert pool.evict_idle() == 0
+            assert session.post(endpoint, json={"jsonrpc": "2.0", "method": "echo", "id": 1}).ok
+        assert pool.evict_idle() == 1
+        assert pool.stats()["evictions"] == 1
+
+    def test_keep_alive_disabled(self, endpoint):
+        """Test that disabling keep-alive opens a connection per request."""
+        client = MCPClient(HttpPoolConfig(keep_alive=False))
+        for _ in range(3):
+            client.send_request("echo", {}, endpoint)
+
+        assert client.pool_stats()["pool_misses"] == 3
+        client.close()
+
+    def test_keep_alive_disabled_against_keep_alive_server(self, sticky_endpoint):
+        """Test disabling keep-alive never reuses a connection the server left open."""
+        client = MCPClient(HttpPoolConfig(keep_alive=False))
+        for _ in range(3):
+            client.send_request("echo", {}, sticky_endpoint)
+
+        assert client.pool_stats()["pool_misses"] == 3
+        client.close()
+
+
+class TestAsyncMCPClient:
+    """Tests for the asyncio MCP client."""
+
+    def test_returns_result(self, endpoint):
+        """Test that the JSON-RPC result is returned."""
+        async def scenario():
+            async with AsyncMCPClient() as client:
+                return await client.send_request("echo", {"value": 1}, endpoint)
+
+        assert asyncio.run(scenario()) == {"value": 1}
+
+    def test_error_is_raised(self, endpoint):
+        """Test that JSON-RPC errors are mapped like MCPClient."""
+        async def scenario():
+            async with AsyncMCPClient() as client:
+                await client.send_request("fail", {}, endpoint)
+
+        with pytest.raises(Exception, match="JSON-RPC error -32601"):
+            asyncio.run(scenario())
+
+    def test_deadline_raises_timeout(self, endpoint):
+        """Test that a per-call deadline produces a timeout error."""
+        async def scenario():
+            async with AsyncMCPClient() as client:
+                await client.send_request("slow", {}, endpoint, timeout=0.1)
+
+        with pytest.raises(Exception, match="timeout"):
+            asyncio.run(scenario())
+
+    def test_connection_error(self):
+        """Test that an unreachable endpoint is a connection error."""
+        async def scenario():
+            async with AsyncMCPClient() as client:
+                await client.send_request("echo", {}, "http://127.0.0.1:1/mcp")
+
+        with pytest.raises(Exception, match="Connection error"):
+            asyncio.run(scenario())
+
+    def test_concurrent_requests_share_pool(self, endpoint):
+        """Test that many in-flight requests are bounded by the pool size."""
+        async def scenario():
+            async with AsyncMCPClient(HttpPoolConfig(pool_maxsize=4)) as client:
+                results = await asyncio.gather(
+                    *(client.send_request("echo", {"i": i}, endpoint) for i in range(40))
+                )
+                return results, client.pool_stats()
+
+        results, stats = asyncio.run(scenario())
+        assert [r["i"] for r in results] == list(range(40))
+        assert stats["requests"] == 40
+        assert stats["pool_misses"] <= 4
+        assert stats["pool_hits"] >= 36
+
+    def test_shares_envelopes_not_transport(self):
+        """Test that the async client reuses MCPClient's envelopes without its HTTP transport."""
+        client = AsyncMCPClient()
+        assert not isinstance(client, MCPClient)
+        assert not hasattr(client, "transport")
+        assert client.build_request("echo", {})["jsonrpc"] == "2.0"
+        asyncio.run(client.aclose())
@@ -0,0 +1,186 @@
+"""
+Unit tests for the asyncio MCP server.
+
+Each test starts AsyncMCPServer on a free port inside its own event loop and
+talks to it with AsyncMCPClient or raw streams.
+"""
+
+import asyncio
+import time
+
+import pytest
+from mcp_even_odd_league.league_sdk.async_mcp_client import AsyncMCPClient
+from mcp_even_odd_league.league_sdk.config_models import HttpPoolConfig
+from mcp_even_odd_league.league_sdk.jsonrpc import MethodDispatcher
+from mcp_even_odd_league.league_sdk.mcp_server import AsyncMCPServer, serve
+
+
+def _dispatcher():
+    dispatcher = MethodDispatcher()
+    dispatcher.register("echo", lambda params: params)
+
+    async def sleepy(params):
+        await asyncio.sleep(params["delay"])
+        return params
+
+    dispatcher.register("sleepy", sleepy)
+    return dispatcher
+
+
+def _run(scenario, **server_options):
+    """Run scenario(endpoint) against a fresh server."""
+    async def main():
+        server = AsyncMCPServer(_dispatcher(), host="127.0.0.1", **server_options)
+        await server.start()
+        try:
+            return await scenario(f"http://127.0.0.1:{server.port}/mcp")
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestAsyncMCPServer:
+    """Tests for AsyncMCPServer."""
+
+    def test_request_round_trip(self):
+        """Test that a request is dispatched and answered."""
+        async def scenario(endpoint):
+            async with AsyncMCPClient() as client:
+                return await client.send_request("echo", {"value": 1}, endpoint)
+
+        assert _run(scenario) == {"value": 1}
+
+    def test_unknown_method_is_mapped(self):
+        """Test that dispatcher errors reach the client as JSON-RPC errors."""
+        async def scenario(endpoint):
+            async with AsyncMCPClient() as client:
+                await client.send_request("missing", {}, endpoint)
+
+        with pytest.raises(Exception, match="JSON-RPC error -32601"):
+            _run(scenario)
+
+    def test_batch_round_trip(self):
+        """Test that batches are answered in one response."""
+        async def scenario(endpoint):
+            async with AsyncMCPClient() as client:
+                return await client.send_batch([("echo", {"i": 0}), ("missing", {})], endpoint)
+
+        results = _run(scenario)
+        assert results[0] == {"i": 0}
+        assert isinstance(results[1], Exception)
+
+    def test_many_concurrent_requests_over_keep_alive(self):
+        """Test that concurrent calls overlap and reuse pooled connections."""
+        async def scenario(endpoint):
+            async with AsyncMCPClient(HttpPoolConfig(pool_maxsize=50)) as client:
+                loop = asyncio.get_running_loop()
+                started = loop.time()
+                results = await asyncio.gather(
+                    *(client.send_request("sleepy", {"delay": 0.2, "i": i}, endpoint) for i in range(500))
+                )
+                return results, loop.time() - started, client.pool_stats()
+
+        results, elapsed, stats = _run(scenario)
+        assert [r["i"] for r in results] == list(range(500))
+        assert elapsed < 5
+        assert stats["pool_misses"] <= 50
+
+    def test_blocking_handlers_run_concurrently(self):
+        """Test plain handlers are not capped by the loop's default executor."""
+        dispatcher = MethodDispatcher()
+        dispatcher.register("blocking", lambda params: time.sleep(0.3) or params)
+
+        async def main():
+            server = AsyncMCPServer(dispatcher, host="127.0.0.1", workers=100)
+            await server.start()
+            try:
+                async with AsyncMCPClient(HttpPoolConfig(pool_maxsize=100)) as client:
+                    endpoint = f"http://127.0.0.1:{server.port}/mcp"
+                    started = time.monotonic()
+                    results = await asyncio.gather(
+                        *(client.send_request("blocking", {"i": i}, endpoint) for i in range(100)))
+                    return results, time.monotonic() - started
+            finally:
+                await server.close()
+
+        results, elapsed = asyncio.run(main())
+        assert [r["i"] for r in results] == list(range(100))
+        # Serialized through a default executor of 5-36 threads this takes 0.9-6 s
+        assert elapsed < 0.9
+
+    def test_wrong_path_is_not_found(self):
+        """Test that only the configured path is served."""
+        async def scenario(endpoint):
+            host, port = endpoint.split("//")[1].split("/")[0].split(":")
+            reader, writer = await asyncio.open_connection(host, int(port))
+            writer.write(b"POST /other HTTP/1.1\r\nHost: x\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            status_line = await reader.readline()
+            writer.close()
+            return status_line
+
+        assert _run(scenario).startswith(b"HTTP/1.1 404")
+
+    def test_oversized_body_is_rejected(self):
+        """Test bodies above max_body_bytes get 413 without being read, by length or by chunks."""
+        async def send(endpoint, raw):
+            host, port = endpoint.split("//")[1].split("/")[0].split(":")
+            reader, writer = await asyncio.open_connection(host, int(port))
+            writer.write(raw)
+            status_line = await reader.readline()
+            writer.close()
+            return status_line
+
+        async def scenario(endpoint):
+            return [
+                await send(endpoint, b"POST /mcp HTTP/1.1\r\nHost: x\r\nContent-Length: 999999999999\r\n\r\n"),
+                await send(endpoint, b"POST /mcp HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n"
+                                     b"80\r\n" + b"x" * 128 + b"\r\n"),
+                await send(endpoint, b"POST /mcp HTTP/1.1\r\nHost: x\r\nContent-Length: 2\r\n"
+                                     b"Content-Type: application/json\r\nConnection: close\r\n\r\n{}"),
+            ]
+
+        too_long, too_many_chunks, small = _run(scenario, max_body_bytes=100)
+        assert too_long.startswith(b"HTTP/1.1 413")
+        assert too_many_chunks.startswith(b"HTTP/1.1 413")
+        assert small.startswith(b"HTTP/1.1 400")
+
+    def test_malformed_request_line_is_bad_request(self):
+        """Test request lines without a method, target and HTTP version get 400."""
+        async def send(endpoint, request_line):
+            host, port = endpoint.split("//")[1].split("/")[0].split(":")
+            reader, writer = await asyncio.open_connection(host, int(port))
+            writer.write(request_line + b"\r\nHost: x\r\nContent-Length: 0\r\n\r\n")
+            status_line = await reader.readline()
+            writer.close()
+            return status_line
+
+        async def scenario(endpoint):
+            return [await send(endpoint, line) for line in (b"POST", b"POST /mcp", b"GARBAGE  HTTP/1.1")]
+
+        assert all(status.startswith(b"HTTP/1.1 400") for status in _run(scenario))
+
+    def test_unix_socket_round_trip(self, tmp_path):
+        """Test serving and calling over a Unix domain socket."""
+        socket_path = str(tmp_path / "agent.sock")
+
+        async def main():
+            server = AsyncMCPServer(_dispatcher(), unix_socket=socket_path)
+            await server.start()
+            try:
+                async with AsyncMCPClient() as client:
+                    first = await client.send_request("echo", {"value": 1}, f"unix://{socket_path}")
+                    second = await client.send_request("echo", {"value": 2}, f"unix://{socket_path}")
+                    return [first, second], client.pool_stats()
+            finally:
+                await server.close()
+
+        results, stats = asyncio.run(main())
+        assert results == [{"value": 1}, {"value": 2}]
+        assert stats["pool_hits"] == 1
+        assert not (tmp_path / "agent.sock").exists()
+
+    def test_unknown_mode_is_rejected(self):
+        """Test that serve() refuses an unknown mode."""
+        with pytest.raises(ValueError, match="Unknown server mode"):
+            serve(None, _dispatcher(), 0, mode="gunicorn")
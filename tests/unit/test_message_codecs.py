@@ -0,0 +1,202 @@
+"""
+Unit tests for message codec negotiation.
+
+Binary round trips need msgpack and are skipped without it.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from mcp_even_odd_league.league_sdk import mcp_server, message_codecs
+from mcp_even_odd_league.league_sdk.jsonrpc import MethodDispatcher
+from mcp_even_odd_league.league_sdk.mcp_client import MCPClient
+from mcp_even_odd_league.league_sdk.mcp_server import AsyncMCPServer
+
+requires_msgpack = pytest.mark.skipif(message_codecs.msgpack is None, reason="msgpack not installed")
+
+
+@pytest.fixture
+def endpoint():
+    """Run an echo AsyncMCPServer that records request Content-Types."""
+    seen = []
+    original = message_codecs.decode_request
+
+    def recording_decode(content_type, body):
+        seen.append(content_type)
+        return original(content_type, body)
+
+    dispatcher = MethodDispatcher()
+    dispatcher.register("echo", lambda params: params)
+    loop = asyncio.new_event_loop()
+    server = AsyncMCPServer(dispatcher, host="127.0.0.1")
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    mcp_server.message_codecs.decode_request = recording_decode
+    try:
+        yield f"http://127.0.0.1:{server.port}/mcp", seen
+    finally:
+        mcp_server.message_codecs.decode_request = original
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+class TestCodecSelection:
+    """Tests for codec lookup and negotiation."""
+
+    def test_json_is_the_default(self):
+        """Test missing or unknown Content-Types are treated as JSON."""
+        assert message_codecs.codec_for(None) is message_codecs.JSON
+        assert message_codecs.codec_for("application/json; charset=utf-8") is message_codecs.JSON
+        assert message_codecs.codec_for("text/plain") is message_codecs.JSON
+        assert message_codecs.negotiate(None) is message_codecs.JSON
+        assert message_codecs.negotiate(["application/cbor"]) is message_codecs.JSON
+
+    def test_missing_binary_codec_is_unsupported(self, monkeypatch):
+        """Test a known binary type without its library is rejected."""
+        monkeypatch.setattr(message_codecs, "_CODECS", {"application/json": message_codecs.JSON})
+
+        with pytest.raises(message_codecs.UnsupportedCodecError):
+            message_codecs.codec_for("application/msgpack")
+        assert message_codecs.decode_request("application/msgpack", b"\x80") == (None, None)
+        assert message_codecs.supported_content_types() == ["application/json"]
+
+    @requires_msgpack
+    def test_msgpack_is_preferred(self):
+        """Test MessagePack wins negotiation when both sides support it."""
+        codec = message_codecs.negotiate(["application/json", "application/msgpack"])
+
+        assert codec.content_type == "application/msgpack"
+        assert message_codecs.supported_content_types()[0] == "application/msgpack"
+        assert codec.decode(codec.encode({"a": [1, "b"]})) == {"a": [1, "b"]}
+
+
+class TestNegotiatedTransport:
+    """Tests for MCPClient over a negotiated codec."""
+
+    @requires_msgpack
+    def test_binary_round_trip(self, endpoint):
+        """Test requests and batches use the negotiated codec end to end."""
+        url, seen = endpoint
+        client = MCPClient()
+        client.set_endpoint_codecs(url, ["application/msgpack", "application/json"])
+
+        assert client.send_request("echo", {"x": [1, 2]}, url) == {"x": [1, 2]}
+        assert client.send_batch([("echo", {"y": 1}), ("missing", {})], url)[0] == {"y": 1}
+        assert seen == ["application/msgpack", "application/msgpack"]
+        client.close()
+
+    @requires_msgpack
+    def test_falls_back_to_json_on_415(self, endpoint, monkeypatch):
+        """Test a peer rejecting the binary codec is switched to JSON."""
+        url, seen = endpoint
+        monkeypatch.setattr(message_codecs, "_CODECS", {"application/json": message_codecs.JSON})
+        client = MCPClient()
+        client.transport._codecs[url] = message_codecs.Codec(
+            "application/msgpack", message_codecs.msgpack.packb, message_codecs.msgpack.unpackb)
+
+        assert client.send_request("echo", {"x": 1}, url) == {"x": 1}
+        assert client.send_request("echo", {"x": 2}, url) == {"x": 2}
+        assert seen == ["application/msgpack", "application/json", "application/json"]
+        client.close()
+
+    def test_registration_advertises_codecs(self):
+        """Test the League Manager records and returns codecs at registration."""
+        from mcp_even_odd_league.agents.league_manager import handlers
+        from mcp_even_odd_league.agents.league_manager.main import LeagueManager
+
+        league_manager = LeagueManager("league_codecs")
+        response = handlers.handle_league_register_request(league_manager, {"player_meta": {
+            "display_name": "P", "version": "1", "game_types": ["even_odd"],
+            "contact_endpoint": "http://localhost:9101/mcp", "codecs": message_codecs.supported_content_types()
+        }})
+
+        assert response["codecs"] == message_codecs.supported_content_types()
+        preferred = message_codecs.supported_content_types()[0]
+        assert league_manager.mcp_client.transport.codec_for("http://localhost:9101/mcp").content_type == preferred
+
+
+    def test_registration_without_endpoint(self):
+        """Test advertised codecs without a contact_endpoint are ignored, not a KeyError."""
+        from mcp_even_odd_league.agents.league_manager import handlers
+
+        class _LeagueManager:
+            league_id = "league_codecs"
+            mcp_client = MCPClient()
+
+        handlers._accept_codecs(_LeagueManager, {"codecs": message_codecs.supported_content_types()})
+        assert _LeagueManager.mcp_client.transport._codecs == {}
+
+    @requires_msgpack
+    def test_referee_switches_players_to_advertised_codec(self, tmp_path, monkeypatch):
+        """Test players advertise codecs in GAME_JOIN_ACK and the referee uses them for the match."""
+        from mcp_even_odd_league.agents.player_P01.main import Player, create_dispatcher
+        from mcp_even_odd_league.agents.referee_REF01.main import Referee
+
+        monkeypatch.chdir(tmp_path)
+        seen = []
+        original = message_codecs.decode_request
+
+        def recording_decode(content_type, body):
+            codec, data = original(content_type, body)
+            seen.append((data.get("method"), content_type))
+            return codec, data
+
+        monkeypatch.setattr(mcp_server.message_codecs, "decode_request", recording_decode)
+        loop = asyncio.new_event_loop()
+        servers = [AsyncMCPServer(create_dispatcher(Player(player_id)), host="127.0.0.1")
+                   for player_id in ("P01", "P02")]
+        for server in servers:
+            loop.run_until_complete(server.start())
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        referee = Referee("REF01")
+        try:
+            endpoints = [f"http://127.0.0.1:{server.port}/mcp" for server in servers]
+            result = referee.run_match("R1M1", "P01", "P02", *endpoints, "league_codecs", 1,
+                                       report_to_league_manager=False)
+        finally:
+            referee.mcp_client.close()
+            for server in servers:
+                asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+        assert not result["technical_loss"]
+        content_types = {method: set() for method, _ in seen}
+        for method, content_type in seen:
+            content_types[method].add(content_type)
+        assert content_types["handle_game_invitation"] == {"application/json"}
+        assert content_types["parity_choose"] == {"application/msgpack"}
+        assert content_types["notify_match_result"] == {"application/msgpack"}
+
+
+class TestFlaskRoute:
+    """Tests for the agents' Flask /mcp route."""
+
+    @requires_msgpack
+    def test_msgpack_request(self):
+        """Test a Flask agent answers a MessagePack request in MessagePack."""
+        from mcp_even_odd_league.agents.player_P01 import main as player_main
+
+        codec = message_codecs.codec_for("application/msgpack")
+        response = player_main.app.test_client().post(
+            "/mcp", data=codec.encode({"jsonrpc": "2.0", "method": "round_announcement", "params": {}, "id": 1}),
+            content_type="application/msgpack")
+
+        assert response.content_type == "application/msgpack"
+        assert codec.decode(response.data)["result"]["status"] == "OK"
+
+    def test_json_request(self):
+        """Test the JSON path is unchanged."""
+        from mcp_even_odd_league.agents.player_P01 import main as player_main
+
+        response = player_main.app.test_client().post(
+            "/mcp", json={"jsonrpc": "2.0", "method": "round_announcement", "params": {}, "id": 1})
+
+        assert response.get_json()["result"]["status"] == "OK"
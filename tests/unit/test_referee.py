@@ -0,0 +1,90 @@
+"""
+Unit tests for the referee's per-phase fan-out to both players.
+
+Players are in-process dispatchers reached over LoopbackTransport; a
+barrier makes both invitations meet, so they must be in flight together.
+"""
+
+import threading
+
+import pytest
+from mcp_even_odd_league.league_sdk import jsonrpc
+from mcp_even_odd_league.league_sdk.mcp_client import MCPClient
+from mcp_even_odd_league.league_sdk.transports import LoopbackTransport
+
+
+def _player(player_id, barrier, times_out):
+    """Dispatcher answering invitations after the barrier, or timing out every attempt"""
+    dispatcher = jsonrpc.MethodDispatcher()
+    attempts = []
+
+    def invitation(params):
+        attempts.append(params["match_id"])
+        if len(attempts) == 1:
+            barrier.wait()
+        if times_out:
+            raise TimeoutError("Request timeout after 5 seconds")
+        return {"message_type": "GAME_JOIN_ACK", "player_id": player_id, "accept": True}
+
+    dispatcher.register("handle_game_invitation", invitation)
+    dispatcher.register("notify_match_result", lambda params: {"status": "ACKNOWLEDGED"})
+    dispatcher.attempts = attempts
+    return dispatcher
+
+
+@pytest.fixture
+def referee(tmp_path, monkeypatch):
+    """Referee whose MCPClient reaches players over loopback."""
+    monkeypatch.chdir(tmp_path)  # agents log under ./SHARED/logs
+    from mcp_even_odd_league.agents.referee_REF01.main import Referee
+
+    referee = Referee("REF01")
+    referee.mcp_client = MCPClient(transport=LoopbackTransport())
+    yield referee
+    referee.shutdown()
+
+
+def _play(referee, times_out_A, times_out_B):
+    barrier = threading.Barrier(2, timeout=5)
+    players = {"P01": _player("P01", barrier, times_out_A), "P02": _player("P02", barrier, times_out_B)}
+    for player_id, dispatcher in players.items():
+        referee.mcp_client.transport.register(f"loopback://{player_id}", dispatcher)
+    result = referee.run_match("R1M1", "P01", "P02", "loopback://P01", "loopback://P02",
+                               "league_test", 1, report_to_league_manager=False)
+    return result, players
+
+
+class TestFanOut:
+    """Tests for Referee._fan_out."""
+
+    def test_response_at_the_other_players_timeout(self, referee):
+        """Test B's ack arriving exactly as A's attempt times out is kept and B wins."""
+        result, players = _play(referee, times_out_A=True, times_out_B=False)
+
+        assert result["technical_loss"] is True
+        assert result["winner_id"] == "P02"
+        assert len(players["P01"].attempts) == 1 + referee.config_loader.get_max_retries()
+        assert len(players["P02"].attempts) == 1
+
+    def test_simultaneous_timeouts_charge_player_A(self, referee):
+        """Test when both players time out together, player A's timeout takes precedence."""
+        result, _ = _play(referee, times_out_A=True, times_out_B=True)
+
+        assert result["technical_loss"] is True
+        assert result["loser_id"] == "P01"
+        assert result["winner_id"] == "P02"
+
+    def test_pool_is_shared_and_shut_down(self, referee):
+        """Test every fan-out reuses the referee's pool, which shutdown() stops."""
+        executor = referee._fan_out_executor
+
+        thread_name = threading.current_thread
+        names = referee._fan_out(lambda: thread_name().name, lambda: thread_name().name)
+        names += referee._fan_out(lambda: thread_name().name)
+
+        assert all(name.startswith("referee-REF01-fan-out") for name in names)
+        assert referee._fan_out_executor is executor
+
+        referee.shutdown()
+        with pytest.raises(RuntimeError):
+            referee._fan_out(lambda: 1)
@@ -0,0 +1,127 @@
+"""
+Unit tests for JSON repositories.
+"""
+
+import os
+import time
+
+import pytest
+from mcp_even_odd_league.league_sdk import repositories
+from mcp_even_odd_league.league_sdk.repositories import (
+    JsonDocument, MatchRepository, PlayerHistoryRepository, RoundsRepository, StandingsRepository,
+    atomic_write_json
+)
+
+
+class TestAtomicWrite:
+    """Tests for atomic_write_json."""
+
+    def test_replaces_file_without_leftovers(self, tmp_path):
+        """Test the document is replaced whole and no temp files remain."""
+        path = tmp_path / "nested" / "doc.json"
+        atomic_write_json(path, {"v": 1})
+        atomic_write_json(path, {"v": 2})
+
+        assert path.read_text(encoding="utf-8") == '{"v":2}'
+        assert os.listdir(path.parent) == ["doc.json"]
+
+    def test_failed_write_keeps_old_document(self, tmp_path):
+        """Test an unserializable document leaves the previous file intact."""
+        path = tmp_path / "doc.json"
+        atomic_write_json(path, {"v": 1})
+
+        with pytest.raises(TypeError):
+            atomic_write_json(path, {"v": object()})
+        assert path.read_text(encoding="utf-8") == '{"v":1}'
+        assert os.listdir(tmp_path) == ["doc.json"]
+
+
+class TestJsonDocument:
+    """Tests for the cached document."""
+
+    def test_load_is_cached_until_the_file_changes(self, tmp_path, monkeypatch):
+        """Test repeated loads skip the disk and external edits are picked up."""
+        path = tmp_path / "doc.json"
+        atomic_write_json(path, {"v": 1})
+        document = JsonDocument(path, dict)
+        reads = []
+        original = type(path).read_bytes
+        monkeypatch.setattr(type(path), "read_bytes", lambda self: reads.append(self) or original(self))
+
+        assert document.load() == {"v": 1}
+        assert document.load() is document.load()
+        assert len(reads) == 1
+
+        atomic_write_json(path, {"v": 2})
+        assert document.load() == {"v": 2}
+        assert len(reads) == 2
+
+    def test_write_behind_coalesces_saves(self, tmp_path):
+        """Test many saves become one write, visible to load() before it happens."""
+        path = tmp_path / "doc.json"
+        document = JsonDocument(path, dict, write_behind_sec=60)
+        for i in range(100):
+            document.save({"v": i})
+
+        assert not path.exists()
+        assert document.load() == {"v": 99}
+        document.flush()
+        assert document.writes == 1
+        assert JsonDocument(path, dict).load() == {"v": 99}
+
+    def test_write_behind_timer_and_exit_flush(self, tmp_path):
+        """Test pending saves are written by the timer and at exit."""
+        timed = JsonDocument(tmp_path / "timed.json", dict, write_behind_sec=0.01)
+        timed.save({"v": 1})
+        for _ in range(500):
+            if timed.writes:
+                break
+            time.sleep(0.01)
+        assert (tmp_path / "timed.json").exists()
+
+        pending = JsonDocument(tmp_path / "pending.json", dict, write_behind_sec=60)
+        pending.save({"v": 2})
+        repositories.flush_repositories()
+        assert JsonDocument(tmp_path / "pending.json", dict).load() == {"v": 2}
+
+
+class TestRepositories:
+    """Tests for the league and player repositories."""
+
+    def test_standings_survive_restart(self, tmp_path):
+        """Test update_player persists and a new repository reads it back."""
+        repo = StandingsRepository("league_1", data_root=tmp_path, write_behind_sec=0)
+        assert repo.load() == {"league_id": "league_1", "standings": []}
+        repo.update_player("P01", wins=1, losses=0, draws=0, points=3)
+        repo.update_player("P01", wins=2, losses=0, draws=1, points=7)
+        repo.update_player("P02", wins=0, losses=2, draws=1, points=1)
+
+        standings = StandingsRepository("league_1", data_root=tmp_path, write_behind_sec=0).load()["standings"]
+        assert standings == [
+            {"player_id": "P01", "wins": 2, "losses": 0, "draws": 1, "points": 7},
+            {"player_id": "P02", "wins": 0, "losses": 2, "draws": 1, "points": 1}
+        ]
+
+    def test_rounds_and_matches(self, tmp_path):
+        """Test rounds and per-match files round-trip."""
+        rounds = RoundsRepository("league_1", data_root=tmp_path, write_behind_sec=0)
+        rounds.save({"league_id": "league_1", "rounds": [{"round_id": 1}]})
+        matches = MatchRepository("league_1", data_root=tmp_path, write_behind_sec=0)
+        assert matches.load("R1M1") == {"match_id": "R1M1", "league_id": "league_1"}
+        matches.save("R1M1", {"match_id": "R1M1", "winner": "P01"})
+
+        assert RoundsRepository("league_1", data_root=tmp_path).load()["rounds"] == [{"round_id": 1}]
+        assert (tmp_path / "matches" / "league_1" / "R1M1.json").exists()
+        assert MatchRepository("league_1", data_root=tmp_path).load("R1M1")["winner"] == "P01"
+
+    def test_player_history_write_behind(self, tmp_path, monkeypatch):
+        """Test the configured write-behind delay applies and flush() persists history."""
+        monkeypatch.setenv("DATA_WRITE_BEHIND_SEC", "60")
+        repo = PlayerHistoryRepository("P01", data_root=tmp_path)
+        for i in range(3):
+            repo.add_match({"match_id": f"R{i}M1"})
+
+        assert not repo.file_path.exists()
+        repo.flush()
+        history = PlayerHistoryRepository("P01", data_root=tmp_path, write_behind_sec=0).load()
+        assert [m["match_id"] for m in history["matches"]] == ["R0M1", "R1M1", "R2M1"]
@@ -0,0 +1,130 @@
+"""
+Unit tests for the Round-Robin scheduler.
+
+Checks circle-method pairings and referee load balancing.
+"""
+
+from itertools import combinations
+
+import pytest
+from mcp_even_odd_league.agents.league_manager import scheduler
+
+
+def _players(n):
+    return [{"player_id": f"P{i:02d}", "contact_endpoint": f"http://localhost:{8100 + i}/mcp"}
+            for i in range(1, n + 1)]
+
+
+def _referees(*capacities):
+    return [{"referee_id": f"REF{i:02d}", "contact_endpoint": f"http://localhost:{8000 + i}/mcp",
+             "max_concurrent_matches": capacity}
+            for i, capacity in enumerate(capacities, start=1)]
+
+
+class TestRoundRobinSchedule:
+    """Tests for create_round_robin_schedule."""
+
+    @pytest.mark.parametrize("num_players", [2, 4, 5, 8, 11])
+    def test_every_pair_meets_once(self, num_players):
+        """Test that each pair plays exactly once and nobody plays twice in a round."""
+        schedule = scheduler.create_round_robin_schedule(_players(num_players), _referees(5))
+
+        pairs = []
+        for round_ in schedule["rounds"]:
+            in_round = [p for m in round_["matches"] for p in (m["player_A_id"], m["player_B_id"])]
+            assert len(in_round) == len(set(in_round))
+            pairs += [frozenset((m["player_A_id"], m["player_B_id"])) for m in round_["matches"]]
+
+        expected = {frozenset(pair) for pair in combinations([p["player_id"] for p in _players(num_players)], 2)}
+        assert len(pairs) == len(expected) == schedule["total_matches"]
+        assert set(pairs) == expected
+        assert schedule["total_rounds"] == scheduler.count_rounds(num_players)
+
+    def test_round_counts(self):
+        """Test N-1 rounds for even N and N rounds (with byes) for odd N."""
+        assert scheduler.count_rounds(4) == 3
+        assert scheduler.count_rounds(5) == 5
+        assert scheduler.count_rounds(1) == 0
+
+    def test_match_objects_follow_contract(self):
+        """Test match IDs, game type and endpoints."""
+        schedule = scheduler.create_round_robin_schedule(_players(4), _referees(5))
+        match = schedule["rounds"][0]["matches"][0]
+
+        assert match["match_id"] == "R1M1"
+        assert match["game_type"] == "even_odd"
+        assert match["referee_endpoint"] == "http://localhost:8001/mcp"
+        assert match["player_A_endpoint"].startswith("http://localhost:81")
+
+    def test_large_round_is_lazy(self):
+        """Test that a single round of a 10k-player league is computed on its own."""
+        pairs = list(scheduler.round_pairings(10_000, 4_321))
+        assert len(pairs) == 5_000
+        assert len({p for pair in pairs for p in pair}) == 10_000
+
+
+class TestAssignMatchesToReferees:
+    """Tests for assign_matches_to_referees."""
+
+    def test_load_follows_capacity(self):
+        """Test that matches are spread in proportion to max_concurrent_matches."""
+        matches = [{"match_id": f"M{i}"} for i in range(12)]
+        assigned = scheduler.assign_matches_to_referees(matches, _referees(2, 4))
+
+        counts = {}
+        for match in assigned:
+            counts[match["referee_id"]] = counts.get(match["referee_id"], 0) + 1
+        assert counts == {"REF01": 4, "REF02": 8}
+
+    def test_current_load_is_counted(self):
+        """Test that a busy referee receives fewer new matches."""
+        referees = _referees(5, 5)
+        referees[0]["current_load"] = 3
+        assigned = scheduler.assign_matches_to_referees([{"match_id": f"M{i}"} for i in range(3)], referees)
+
+        assert [m["referee_id"] for m in assigned] == ["REF02", "REF02", "REF02"]
+
+    def test_no_referees(self):
+        """Test that matches without referees are rejected."""
+        with pytest.raises(ValueError, match="no referees"):
+            scheduler.assign_matches_to_referees([{"match_id": "M1"}], [])
+
+
+class TestLazySchedule:
+    """Tests for the generator-based schedule API."""
+
+    def test_iter_schedule_matches_full_schedule(self):
+        """Test that iterating rounds gives the same rounds as the full schedule."""
+        players, referees = _players(6), _referees(2, 3)
+        full = scheduler.create_round_robin_schedule(players, referees)
+
+        assert list(scheduler.iter_schedule(players, referees)) == full["rounds"]
+
+    def test_resume_from_round(self):
+        """Test that starting at round k regenerates round k exactly."""
+        players, referees = _players(7), _referees(2, 3)
+        full = scheduler.create_round_robin_schedule(players, referees)
+
+        resumed = scheduler.iter_schedule(players, referees, start_round=4)
+        assert next(resumed) == full["rounds"][3]
+        assert scheduler.schedule_round(players, referees, 4) == full["rounds"][3]
+
+    def test_resume_mid_round(self):
+        """Test that match-level resume keeps referee assignments stable."""
+        players, referees = _players(8), _referees(1, 1)
+        full = [m for r in scheduler.create_round_robin_schedule(players, referees)["rounds"] for m in r["matches"]]
+
+        resumed = list(scheduler.iter_schedule_matches(players, referees, start_round=2, start_match=3))
+        start = next(i for i, m in enumerate(full) if m["match_id"] == "R2M3")
+        assert resumed == full[start:]
+
+    def test_round_outside_schedule(self):
+        """Test that an out-of-range round is rejected."""
+        with pytest.raises(ValueError, match="outside the schedule"):
+            scheduler.schedule_round(_players(4), _referees(5), 4)
+
+    def test_large_league_resume_is_cheap(self):
+        """Test that resuming a 10k-player league late yields without replaying earlier rounds."""
+        matches = scheduler.iter_schedule_matches(_players(10_000), _referees(50), start_round=9_999)
+        first = next(matches)
+        assert first["match_id"] == "R9999M1"
@@ -0,0 +1,186 @@
+"""
+Unit tests for the in-process league simulator.
+"""
+
+import pytest
+from mcp_even_odd_league.league_sdk import jsonrpc
+from mcp_even_odd_league.league_sdk.config_models import ScoringConfig
+from mcp_even_odd_league.simulator import (
+    InProcessTransport,
+    LeagueSimulator,
+    fixed_strategy,
+    timeout_strategy
+)
+
+
+PLAYERS = ["P01", "P02", "P03", "P04", "P05"]
+
+
+@pytest.fixture(autouse=True)
+def agent_dirs(tmp_path, monkeypatch):
+    """Run the real agents with their SHARED/ files under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+
+
+class TestInProcessTransport:
+    """Tests for InProcessTransport."""
+
+    def test_same_parity_is_a_draw(self):
+        """Test two players choosing the same parity draw."""
+        transport = InProcessTransport(default_strategy=fixed_strategy("even"), seed=1)
+        match = {"match_id": "R1M1", "round_id": 1, "player_A_id": "P01", "player_B_id": "P02"}
+
+        result = transport.play(match)
+
+        assert result["is_draw"] is True
+        assert result["technical_loss"] is False
+
+    def test_timeout_is_technical_loss(self):
+        """Test a player whose parity call times out loses by technical loss."""
+        transport = InProcessTransport(strategies={"P02": timeout_strategy()},
+                                       default_strategy=fixed_strategy("odd"), seed=1)
+
+        result = transport.play({"match_id": "R1M1", "round_id": 1, "player_A_id": "P01", "player_B_id": "P02"})
+        assert result["technical_loss"] is True
+        assert result["winner_id"] == "P01"
+        assert result["loser_id"] == "P02"
+
+    def test_players_recover_after_technical_loss(self):
+        """Test both players are back in IDLE and can play again after a technical loss."""
+        transport = InProcessTransport(strategies={"P02": timeout_strategy()}, seed=1)
+        transport.play({"match_id": "R1M1", "round_id": 1, "player_A_id": "P01", "player_B_id": "P02"})
+
+        assert transport.players["P01"].state == "IDLE"
+        assert transport.players["P02"].state == "IDLE"
+
+        result = transport.play({"match_id": "R2M1", "round_id": 2, "player_A_id": "P02", "player_B_id": "P01"})
+        assert result["winner_id"] == "P01"
+
+    def test_player_recovers_after_opponent_misses_invitation(self):
+        """Test the player who accepted returns to IDLE cleanly when its opponent never answers the invitation."""
+        transport = InProcessTransport(seed=1)
+        silent = jsonrpc.MethodDispatcher()
+
+        def never_answers(params):
+            raise TimeoutError("Request timeout")
+
+        silent.register("handle_game_invitation", never_answers)
+        silent.register("notify_match_result", never_answers)
+        transport.endpoint("P01")
+        transport.loopback.register(transport.endpoint("P02"), silent)
+        events = []
+        player = transport.players["P01"]
+        log_event = player.logger.log_event
+        player.logger.log_event = lambda event_type, data=None: events.append(event_type) or log_event(event_type, data)
+
+        result = transport.play({"match_id": "R1M1", "round_id": 1, "player_A_id": "P01", "player_B_id": "P02"})
+
+        assert result["technical_loss"] is True
+        assert result["winner_id"] == "P01"
+        assert player.state == "IDLE"
+        assert "INVALID_MESSAGE_STATE" not in events
+        result = transport.play({"match_id": "R2M1", "round_id": 2, "player_A_id": "P01", "player_B_id": "P03"})
+        assert result["technical_loss"] is False
+
+    def test_matches_run_through_player_handlers(self):
+        """Test strategies are called by the real player handlers with the referee's context."""
+        contexts = []
+
+        def recording(match_context):
+            contexts.append(match_context)
+            return "even"
+
+        transport = InProcessTransport(strategies={"P01": recording}, seed=1)
+        transport.play({"match_id": "R1M1", "round_id": 1, "player_A_id": "P01", "player_B_id": "P02"})
+
+        assert len(contexts) == 1
+        assert contexts[0]["match_id"] == "R1M1"
+        assert contexts[0]["opponent_id"] == "P02"
+        assert transport.players["P01"].state == "IDLE"
+
+
+    def test_round_fast_path_falls_back_on_faults(self, monkeypatch):
+        """Test play_round scores no-fault matches in a batch and referees only faulting ones."""
+        transport = InProcessTransport(strategies={"P03": timeout_strategy(), "P04": fixed_strategy("maybe")},
+                                       default_strategy=fixed_strategy("even"), seed=1)
+        refereed = []
+        play = transport.play
+        monkeypatch.setattr(transport, "play", lambda match: refereed.append(match["match_id"]) or play(match))
+        matches = [
+            {"match_id": "R1M1", "round_id": 1, "player_A_id": "P01", "player_B_id": "P02"},
+            {"match_id": "R1M2", "round_id": 1, "player_A_id": "P03", "player_B_id": "P05"},
+            {"match_id": "R1M3", "round_id": 1, "player_A_id": "P04", "player_B_id": "P06"},
+        ]
+
+        results = transport.play_round(matches)
+
+        assert refereed == ["R1M2", "R1M3"]
+        assert results[0]["is_draw"] is True
+        assert results[0]["technical_loss"] is False
+        assert results[1]["technical_loss"] is True
+        assert results[1]["winner_id"] == "P05"
+        assert results[2]["technical_loss"] is False
+        assert results[2]["player_A_choice"] == "maybe"
+
+    def test_agents_write_no_logs(self, tmp_path):
+        """Test simulated agents drop their log events unless log_events is set."""
+        transport = InProcessTransport(seed=1)
+        transport.play({"match_id": "R1M1", "round_id": 1, "player_A_id": "P01", "player_B_id": "P02"})
+
+        assert not list(tmp_path.rglob("*.jsonl"))
+
+
+class TestLeagueSimulator:
+    """Tests for LeagueSimulator."""
+
+    def test_every_pair_plays_once(self):
+        """Test a full run plays N*(N-1)/2 matches and N-1 per player."""
+        pairs = []
+
+        class RecordingTransport(InProcessTransport):
+            def play_round(self, matches):
+                pairs.extend(frozenset((match["player_A_id"], match["player_B_id"])) for match in matches)
+                return super().play_round(matches)
+
+        report = LeagueSimulator(PLAYERS, RecordingTransport(seed=7)).run()
+
+        assert report.rounds == 5
+        assert report.matches == 10
+        assert len(set(pairs)) == 10
+        assert all(row["played"] == 4 for row in report.standings)
+
+    def test_seed_is_deterministic(self):
+        """Test the same seed reproduces the same standings."""
+        first = LeagueSimulator(PLAYERS, InProcessTransport(seed=42)).run()
+        second = LeagueSimulator(PLAYERS, InProcessTransport(seed=42)).run()
+
+        assert first.standings == second.standings
+        assert first.draws == second.draws
+
+    def test_technical_losses_are_scored(self):
+        """Test a player timing out loses every match."""
+        transport = InProcessTransport(strategies={"P03": timeout_strategy()}, seed=3)
+
+        report = LeagueSimulator(PLAYERS, transport).run()
+
+        assert report.technical_losses == 4
+        row = next(row for row in report.standings if row["player_id"] == "P03")
+        assert row["losses"] == 4
+        assert row["rank"] == 5
+
+    def test_scoring_override(self):
+        """Test custom scoring is applied to the simulated standings."""
+        scoring = ScoringConfig(win_points=2, draw_points=5, loss_points=0)
+        transport = InProcessTransport(default_strategy=fixed_strategy("odd"), seed=1)
+
+        report = LeagueSimulator(PLAYERS, transport, scoring=scoring).run()
+
+        assert report.draws == 10
+        assert all(row["points"] == 20 for row in report.standings)
+
+    def test_max_rounds(self):
+        """Test a run can be limited to a slice of rounds."""
+        report = LeagueSimulator(PLAYERS, InProcessTransport(seed=1)).run(start_round=2, max_rounds=2)
+
+        assert report.rounds == 2
+        assert report.matches == 4
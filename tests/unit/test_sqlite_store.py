@@ -0,0 +1,199 @@
+"""
+Unit tests for the SQLite repository backend.
+"""
+
+import sqlite3
+import subprocess
+import sys
+import time
+
+import pytest
+from mcp_even_odd_league.league_sdk import sqlite_store
+from mcp_even_odd_league.league_sdk.repositories import (
+    MatchRepository,
+    PlayerHistoryRepository,
+    RoundsRepository,
+    StandingsRepository,
+)
+from mcp_even_odd_league.league_sdk.sqlite_store import SqliteStore, get_store
+
+
+@pytest.fixture(autouse=True)
+def _close_stores():
+    yield
+    sqlite_store.close_stores()
+
+
+def _match(match_id, round_id, player_a, player_b):
+    return {"match_id": match_id, "round_id": round_id, "player_A_id": player_a, "player_B_id": player_b}
+
+
+class TestSqliteStore:
+    """Tests for SqliteStore."""
+
+    def test_wal_mode_and_indexes(self, tmp_path):
+        """Test the database runs in WAL mode with the lookup indexes."""
+        store = SqliteStore(tmp_path / "league.db")
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = {row[0] for row in store._conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"idx_matches_round", "idx_matches_player_a", "idx_matches_player_b"} <= indexes
+        store.close()
+
+    def test_writes_are_batched(self, tmp_path):
+        """Test writes commit once per batch and flush() commits the remainder."""
+        store = SqliteStore(tmp_path / "league.db", batch_size=10, batch_ms=60000)
+        for i in range(25):
+            store.save_match("league_1", f"M{i}", _match(f"M{i}", 1, "P01", "P02"))
+        assert store.commits == 2
+
+        other = sqlite3.connect(str(tmp_path / "league.db"))
+        assert other.execute("SELECT COUNT(*) FROM matches").fetchone()[0] == 20
+        store.flush()
+        assert other.execute("SELECT COUNT(*) FROM matches").fetchone()[0] == 25
+        other.close()
+        store.close()
+
+    def test_failed_save_rolls_back_only_itself(self, tmp_path):
+        """Test a save that fails mid-batch leaves earlier writes in the batch to be committed."""
+        store = SqliteStore(tmp_path / "league.db", batch_size=1000, batch_ms=60000)
+        store.save_standings("league_1", {"standings": [{"player_id": "P1", "points": 3}]})
+        store.save_match("league_1", "M1", _match("M1", 1, "P1", "P2"))
+
+        with pytest.raises(sqlite3.IntegrityError):
+            store.save_standings("league_1", {"standings": [{"player_id": "P2"}, {"player_id": "P2"}]})
+        store.flush()
+
+        other = sqlite3.connect(str(tmp_path / "league.db"))
+        assert other.execute("SELECT player_id, points FROM standings").fetchall() == [("P1", 3)]
+        assert other.execute("SELECT COUNT(*) FROM matches").fetchone()[0] == 1
+        other.close()
+        store.close()
+
+    def test_idle_batch_commits_after_batch_ms(self, tmp_path):
+        """Test an open batch is committed after batch_ms without further writes."""
+        store = SqliteStore(tmp_path / "league.db", batch_size=1000, batch_ms=20)
+        store.save_match("league_1", "M1", _match("M1", 1, "P01", "P02"))
+        deadline = time.monotonic() + 5
+        while store.commits == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert store.commits == 1
+        assert not store._conn.in_transaction
+        store.close()
+
+    def test_two_processes_share_database(self, tmp_path):
+        """Test a writer in another process waits for, rather than fails on, an open batch."""
+        db = tmp_path / "league.db"
+        ready = tmp_path / "ready"
+        child = subprocess.Popen([sys.executable, "-c", f"""
+import time
+from pathlib import Path
+from mcp_even_odd_league.league_sdk.sqlite_store import SqliteStore
+store = SqliteStore(Path({str(db)!r}), batch_size=1000, batch_ms=200)
+store.save_match("league_1", "A1", {{"match_id": "A1", "round_id": 1}})
+Path({str(ready)!r}).touch()
+time.sleep(1.5)  # idle with the batch open until batch_ms commits it
+"""])
+        try:
+            deadline = time.monotonic() + 10
+            while not ready.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert ready.exists()
+
+            store = SqliteStore(db, batch_size=1, busy_timeout_ms=5000)
+            store.save_match("league_1", "B1", {"match_id": "B1", "round_id": 1})
+            assert [m["match_id"] for m in store.find_matches("league_1")] == ["A1", "B1"]
+            store.close()
+        finally:
+            child.wait(timeout=10)
+        assert child.returncode == 0
+
+    def test_find_matches(self, tmp_path):
+        """Test matches are found by round and player."""
+        store = SqliteStore(tmp_path / "league.db")
+        store.save_match("league_1", "R1M1", _match("R1M1", 1, "P01", "P02"))
+        store.save_match("league_1", "R1M2", _match("R1M2", 1, "P03", "P04"))
+        store.save_match("league_1", "R2M1", _match("R2M1", 2, "P02", "P03"))
+        store.save_match("league_2", "R1M1", _match("R1M1", 1, "P02", "P05"))
+
+        assert [m["match_id"] for m in store.find_matches("league_1", round_id=1)] == ["R1M1", "R1M2"]
+        assert [m["match_id"] for m in store.find_matches("league_1", player_id="P02")] == ["R1M1", "R2M1"]
+        assert [m["match_id"] for m in store.find_matches("league_1", round_id=2, player_id="P03")] == ["R2M1"]
+        assert store.load_match("league_1", "R9M9") is None
+        store.close()
+
+    def test_get_store_is_shared_per_file(self, tmp_path):
+        """Test repositories on the same database share one store."""
+        assert get_store(tmp_path / "league.db") is get_store(tmp_path / "." / "league.db")
+        assert get_store(tmp_path / "other.db") is not get_store(tmp_path / "league.db")
+
+
+class TestSqliteRepositories:
+    """Tests for the repositories on the SQLite backend."""
+
+    def test_repositories_survive_restart(self, tmp_path):
+        """Test every repository round-trips through the database."""
+        db = tmp_path / "league.db"
+        standings = StandingsRepository("league_1", data_root=tmp_path, backend="sqlite", db_path=db)
+        standings.update_player("P01", wins=1, losses=0, draws=0, points=3)
+        standings.update_player("P01", wins=2, losses=0, draws=1, points=7)
+        standings.update_player("P02", wins=0, losses=2, draws=1, points=1)
+        RoundsRepository("league_1", data_root=tmp_path, backend="sqlite", db_path=db).save(
+            {"league_id": "league_1", "rounds": [{"round_id": 1, "matches": ["R1M1"]}]})
+        matches = MatchRepository("league_1", data_root=tmp_path, backend="sqlite", db_path=db)
+        assert matches.load("R1M1") == {"match_id": "R1M1", "league_id": "league_1"}
+        matches.save("R1M1", {**_match("R1M1", 1, "P01", "P02"), "winner": "P01"})
+        history = PlayerHistoryRepository("P01", data_root=tmp_path, backend="sqlite", db_path=db)
+        history.add_match({"match_id": "R1M1", "league_id": "league_1"})
+        history.add_match({"match_id": "R2M1", "league_id": "league_1"})
+        sqlite_store.close_stores()
+
+        assert StandingsRepository("league_1", backend="sqlite", db_path=db).load() == {
+            "league_id": "league_1",
+            "standings": [
+                {"player_id": "P01", "wins": 2, "losses": 0, "draws": 1, "points": 7},
+                {"player_id": "P02", "wins": 0, "losses": 2, "draws": 1, "points": 1}
+            ]
+        }
+        assert RoundsRepository("league_1", backend="sqlite", db_path=db).load()["rounds"] == [
+            {"round_id": 1, "matches": ["R1M1"]}]
+        assert MatchRepository("league_1", backend="sqlite", db_path=db).load("R1M1")["winner"] == "P01"
+        matches = PlayerHistoryRepository("P01", backend="sqlite", db_path=db).load()["matches"]
+        assert [m["match_id"] for m in matches] == ["R1M1", "R2M1"]
+        assert not (tmp_path / "leagues").exists()
+
+    def test_document_fields_round_trip(self, tmp_path):
+        """Test top-level fields beside the row lists survive like they do in JSON files."""
+        db = tmp_path / "league.db"
+        standings = {"league_id": "league_1", "version": 3, "last_updated": "2025-01-01T00:00:00Z",
+                     "standings": [{"player_id": "P01", "wins": 1, "losses": 0, "draws": 0, "points": 3}]}
+        StandingsRepository("league_1", backend="sqlite", db_path=db).save(standings)
+        history = {"player_id": "P01", "total": 1, "matches": [{"match_id": "R1M1"}]}
+        PlayerHistoryRepository("P01", backend="sqlite", db_path=db).save(history)
+        sqlite_store.close_stores()
+
+        assert StandingsRepository("league_1", backend="sqlite", db_path=db).load() == standings
+        assert PlayerHistoryRepository("P01", backend="sqlite", db_path=db).load() == history
+
+    def test_find_on_both_backends(self, tmp_path):
+        """Test MatchRepository.find gives the same results on JSON files and SQLite."""
+        for backend in ("json", "sqlite"):
+            repo = MatchRepository("league_1", data_root=tmp_path / backend, write_behind_sec=0,
+                                   backend=backend, db_path=tmp_path / "league.db")
+            repo.save("R2M1", _match("R2M1", 2, "P02", "P03"))
+            repo.save("R1M1", _match("R1M1", 1, "P01", "P02"))
+            repo.save("R1M2", _match("R1M2", 1, "P03", "P04"))
+            assert [m["match_id"] for m in repo.find(round_id=1)] == ["R1M1", "R1M2"]
+            assert [m["match_id"] for m in repo.find(player_id="P02")] == ["R1M1", "R2M1"]
+
+    def test_backend_from_config(self, tmp_path, monkeypatch):
+        """Test STORAGE_BACKEND and DB_PATH select the backend, JSON by default."""
+        assert StandingsRepository("league_1", data_root=tmp_path)._store is None
+
+        monkeypatch.setenv("STORAGE_BACKEND", "SQLite")
+        monkeypatch.setenv("DB_PATH", str(tmp_path / "env.db"))
+        repo = StandingsRepository("league_1", data_root=tmp_path)
+        assert repo._store is get_store(tmp_path / "env.db")
+
+        monkeypatch.setenv("STORAGE_BACKEND", "postgres")
+        with pytest.raises(ValueError, match="postgres"):
+            StandingsRepository("league_1", data_root=tmp_path)
@@ -0,0 +1,154 @@
+"""
+Unit tests for ranked standings.
+
+Covers ranking under the configured tiebreakers, both index backends, and the
+LeagueManager / LEAGUE_QUERY integration.
+"""
+
+import random
+
+import pytest
+from mcp_even_odd_league.agents.league_manager import standings as standings_module
+from mcp_even_odd_league.agents.league_manager.main import LeagueManager, create_dispatcher
+from mcp_even_odd_league.agents.league_manager.standings import ColumnarStandingsStore, RankedStandings
+
+
+@pytest.fixture(params=["sortedcontainers", "bisect"])
+def backend(request, monkeypatch):
+    """Run each test with SortedList (if installed) and with the bisect fallback."""
+    if request.param == "bisect":
+        monkeypatch.setattr(standings_module, "SortedList", None)
+    elif standings_module.SortedList is None:
+        pytest.skip("sortedcontainers not installed")
+    return request.param
+
+
+class TestRankedStandings:
+    """Tests for RankedStandings."""
+
+    def test_default_tiebreakers(self, backend):
+        """Test points, then wins, then player_id ordering."""
+        table = RankedStandings(["points", "wins", "alphabetical"])
+        table.record("P03", wins=1, points=3)
+        table.record("P01", draws=1, points=1)
+        table.record("P02", draws=1, points=1)
+        table.record("P04", wins=1, points=3)
+
+        assert list(table) == ["P03", "P04", "P01", "P02"]
+        assert table.rank("P01") == 3
+        assert [player_id for player_id, _ in table.top(2)] == ["P03", "P04"]
+
+    def test_custom_tiebreakers(self, backend):
+        """Test that tiebreaker order is honored, with losses ranked ascending."""
+        table = RankedStandings(["points", "losses"])
+        table.record("P01", wins=1, points=3)
+        table.record("P01", losses=1)
+        table.record("P02", wins=1, points=3)
+
+        assert list(table) == ["P02", "P01"]
+
+    def test_unknown_tiebreaker(self):
+        """Test that unknown tiebreakers are rejected."""
+        with pytest.raises(ValueError, match="Unknown tiebreaker"):
+            RankedStandings(["points", "head_to_head"])
+
+    def test_stats_are_read_only(self, backend):
+        """Test that stats views cannot bypass the ranking index."""
+        table = RankedStandings()
+        table.record("P01", wins=1, points=3)
+
+        assert table["P01"]["matches_played"] == 1
+        with pytest.raises(TypeError):
+            table["P01"]["points"] = 99
+
+    def test_matches_full_sort(self, backend):
+        """Test that incremental ranking equals a full re-sort after random updates."""
+        rng = random.Random(7)
+        table = RankedStandings(["points", "wins", "alphabetical"])
+        for _ in range(2000):
+            player_id = f"P{rng.randrange(200):03d}"
+            outcome = rng.choice(["win", "draw", "loss"])
+            table.record(player_id, wins=outcome == "win", draws=outcome == "draw",
+                         losses=outcome == "loss", points={"win": 3, "draw": 1, "loss": 0}[outcome])
+
+        expected = sorted(table, key=lambda p: (-table[p]["points"], -table[p]["wins"], p))
+        assert list(table) == expected
+        assert all(table.rank(p) == i for i, p in enumerate(expected, 1))
+
+
+class TestColumnarStore:
+    """Tests for the columnar stats store."""
+
+    def test_matches_dict_store(self, backend):
+        """Test that both stores produce identical standings."""
+        tables = [RankedStandings(store="dict"), RankedStandings(store="columnar")]
+        for table in tables:
+            table.record("P01", wins=1, points=3)
+            table.record("P02", losses=1)
+            table.record("P02", draws=1, points=1)
+
+        assert tables[0].as_table() == tables[1].as_table()
+        assert dict(tables[1]["P02"]) == {"wins": 0, "losses": 1, "draws": 1, "points": 1, "matches_played": 2}
+
+    def test_row_view_is_read_only(self):
+        """Test that columnar rows cannot be written through the view."""
+        table = RankedStandings(store="columnar")
+        table.record("P01", wins=1, points=3)
+
+        with pytest.raises(TypeError):
+            table["P01"]["points"] = 99
+
+    def test_columns_are_parallel_arrays(self):
+        """Test that stats live in one int64 column per field."""
+        store = ColumnarStandingsStore()
+        for player_id in ("P01", "P02"):
+            store.add(player_id)
+        store.increment("P02", 1, 0, 0, 3, 1)
+
+        assert store.player_ids == ["P01", "P02"]
+        assert list(store.columns["points"]) == [0, 3]
+        assert store.columns["points"].itemsize == 8
+
+    def test_numpy_view(self):
+        """Test that as_numpy shares memory with the columns."""
+        numpy = pytest.importorskip("numpy")
+        store = ColumnarStandingsStore()
+        store.add("P01")
+        store.increment("P01", 1, 0, 0, 3, 1)
+
+        assert numpy.array_equal(store.as_numpy()["points"], [3])
+
+    def test_unknown_store(self):
+        """Test that an unknown store name is rejected."""
+        with pytest.raises(ValueError, match="Unknown standings store"):
+            RankedStandings(store="redis")
+
+
+class TestLeagueManagerStandings:
+    """Tests for standings inside LeagueManager."""
+
+    def _report(self, match_id, round_id, winner, loser, status="WIN"):
+        return {"match_id": match_id, "round_id": round_id,
+                "result": {"winner": winner, "score": {winner: 3, loser: 0}, "details": {"status": status}}}
+
+    @pytest.mark.parametrize("store", ["dict", "columnar"])
+    def test_league_query_returns_ranked_table(self, store, monkeypatch):
+        """Test that league_query answers with LEAGUE_QUERY_RESPONSE standings."""
+        monkeypatch.setenv("STANDINGS_STORE", store)
+        manager = LeagueManager("league_test_standings")
+        manager.update_standings_from_match(self._report("R1M1", 1, "P02", "P01"))
+        manager.update_standings_from_match(self._report("R2M1", 2, "P02", "P03", status="TECHNICAL_LOSS"))
+
+        response, status = create_dispatcher(manager).dispatch({
+            "jsonrpc": "2.0", "method": "league_query", "id": 1,
+            "params": {"sender": "player:P01", "auth_token": "tok", "query_type": "GET_STANDINGS"}
+        })
+
+        result = response["result"]
+        assert status == 200
+        assert result["message_type"] == "LEAGUE_QUERY_RESPONSE"
+        assert result["current_round"] == 2
+        assert result["standings"][0] == {"rank": 1, "player_id": "P02", "display_name": "P02",
+                                          "played": 2, "wins": 2, "draws": 0, "losses": 0, "points": 6}
+        assert [row["player_id"] for row in result["standings"]] == ["P02", "P01", "P03"]
+        manager.print_standings()
@@ -0,0 +1,182 @@
+"""
+Unit tests for MCP transports.
+
+Runs MCPClient over LoopbackTransport against in-process dispatchers,
+including a full referee match between two real player agents.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from mcp_even_odd_league.league_sdk import jsonrpc
+from mcp_even_odd_league.league_sdk.mcp_client import MCPClient
+from mcp_even_odd_league.league_sdk.mcp_server import AsyncMCPServer
+from mcp_even_odd_league.league_sdk.transports import HttpTransport, LoopbackTransport
+
+
+ENDPOINT = "http://localhost:8199/mcp"
+
+
+@pytest.fixture
+def echo_dispatcher():
+    """Dispatcher echoing params, recording the objects it receives."""
+    received = []
+    dispatcher = jsonrpc.MethodDispatcher()
+
+    def echo(params):
+        received.append(params)
+        return params
+
+    dispatcher.register("echo", echo)
+    dispatcher.received = received
+    return dispatcher
+
+
+@pytest.fixture
+def unix_endpoint(tmp_path, echo_dispatcher):
+    """Serve echo_dispatcher on a Unix socket from a background event loop."""
+    socket_path = str(tmp_path / "agent.sock")
+    loop = asyncio.new_event_loop()
+    server = AsyncMCPServer(echo_dispatcher, unix_socket=socket_path)
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield f"unix://{socket_path}"
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+class TestLoopbackTransport:
+    """Tests for LoopbackTransport."""
+
+    def test_send_request(self, echo_dispatcher):
+        """Test a request reaches the registered dispatcher and returns its result."""
+        transport = LoopbackTransport()
+        transport.register(ENDPOINT, echo_dispatcher)
+        client = MCPClient(transport=transport)
+
+        assert client.send_request("echo", {"x": 1}, ENDPOINT) == {"x": 1}
+        assert client.pool_stats() == {"endpoints": 1, "requests": 1}
+        assert client.session_pool is None
+
+    def test_error_mapping(self, echo_dispatcher):
+        """Test JSON-RPC errors and unknown endpoints raise like over HTTP."""
+        transport = LoopbackTransport()
+        transport.register(ENDPOINT, echo_dispatcher)
+        client = MCPClient(transport=transport)
+
+        with pytest.raises(Exception, match="JSON-RPC error -32601"):
+            client.send_request("missing", {}, ENDPOINT)
+        with pytest.raises(Exception, match="Connection error"):
+            client.send_request("echo", {}, "http://localhost:1/mcp")
+
+    def test_serialize_copies_payloads(self, echo_dispatcher):
+        """Test serialize=True isolates the handler from the caller's objects."""
+        transport = LoopbackTransport(serialize=True)
+        transport.register(ENDPOINT, echo_dispatcher)
+        params = {"x": [1, 2]}
+
+        MCPClient(transport=transport).send_request("echo", params, ENDPOINT)
+
+        assert echo_dispatcher.received[0] == params
+        assert echo_dispatcher.received[0] is not params
+
+    def test_zero_copy(self, echo_dispatcher):
+        """Test serialize=False passes the caller's objects through unchanged."""
+        transport = LoopbackTransport(serialize=False)
+        transport.register(ENDPOINT, echo_dispatcher)
+        params = {"x": [1, 2]}
+
+        result = MCPClient(transport=transport).send_request("echo", params, ENDPOINT)
+
+        assert echo_dispatcher.received[0] is params
+        assert result is params
+
+    def test_batch_and_notification(self, echo_dispatcher):
+        """Test batches and notifications keep JSON-RPC semantics."""
+        transport = LoopbackTransport()
+        transport.register(ENDPOINT, echo_dispatcher)
+        client = MCPClient(transport=transport)
+
+        results = client.send_batch([("echo", {"n": 1}), ("missing", {})], ENDPOINT)
+        client.send_notification("echo", {"n": 2}, ENDPOINT)
+        client.send_notification("echo", {"n": 3}, "http://localhost:1/mcp")
+
+        assert results[0] == {"n": 1}
+        assert isinstance(results[1], Exception)
+        assert echo_dispatcher.received[-1] == {"n": 2}
+
+    def test_fallback(self, echo_dispatcher):
+        """Test unregistered endpoints go to the fallback transport."""
+        class _Recorder:
+            def __init__(self):
+                self.posted = []
+
+            def post(self, payload, endpoint, timeout):
+                self.posted.append(endpoint)
+                return {"jsonrpc": "2.0", "result": "remote", "id": payload["id"]}
+
+            def stats(self):
+                return {}
+
+        fallback = _Recorder()
+        transport = LoopbackTransport(fallback=fallback)
+        transport.register(ENDPOINT, echo_dispatcher)
+        client = MCPClient(transport=transport)
+
+        assert client.send_request("echo", "local", ENDPOINT) == "local"
+        assert client.send_request("echo", {}, "http://remote:9000/mcp") == "remote"
+        assert fallback.posted == ["http://remote:9000/mcp"]
+
+    def test_referee_match_in_process(self, tmp_path, monkeypatch):
+        """Test a full referee match between two player agents over loopback."""
+        monkeypatch.chdir(tmp_path)  # agents log under ./SHARED/logs
+        from mcp_even_odd_league.agents.player_P01 import main as player_P01
+        from mcp_even_odd_league.agents.player_P02 import main as player_P02
+        from mcp_even_odd_league.agents.referee_REF01.main import Referee
+
+        transport = LoopbackTransport(serialize=False)
+        transport.register("loopback://P01", player_P01.create_dispatcher(player_P01.Player("P01")))
+        transport.register("loopback://P02", player_P02.create_dispatcher(player_P02.Player("P02")))
+        referee = Referee("REF01")
+        referee.mcp_client = MCPClient(transport=transport)
+
+        result = referee.run_match("R1M1", "P01", "P02", "loopback://P01", "loopback://P02",
+                                   "league_loopback", 1, report_to_league_manager=False)
+
+        assert result["is_draw"] or result["winner_id"] in ("P01", "P02")
+        assert transport.stats()["requests"] == 6
+
+
+class TestHttpTransport:
+    """Tests for HttpTransport."""
+
+    def test_is_default(self):
+        """Test MCPClient uses HTTP unless told otherwise."""
+        client = MCPClient()
+
+        assert isinstance(client.transport, HttpTransport)
+        assert client.session_pool is client.transport.session_pool
+
+    def test_unix_socket_endpoint(self, unix_endpoint):
+        """Test requests, batches and notifications over a Unix socket reuse one connection."""
+        client = MCPClient()
+
+        assert client.send_request("echo", {"x": 1}, unix_endpoint) == {"x": 1}
+        assert client.send_batch([("echo", {"x": 2}), ("missing", {})], unix_endpoint)[0] == {"x": 2}
+        client.send_notification("echo", {"x": 3}, unix_endpoint)
+        with pytest.raises(Exception, match="JSON-RPC error -32601"):
+            client.send_request("missing", {}, unix_endpoint)
+
+        stats = client.pool_stats()
+        assert stats["requests"] == 4
+        assert stats["pool_misses"] == 1
+        client.close()
+
+    def test_unix_socket_connection_error(self, tmp_path):
+        """Test a missing socket file maps to a connection error."""
+        with pytest.raises(Exception, match="Connection error"):
+            MCPClient().send_request("echo", {}, f"unix://{tmp_path}/missing.sock")